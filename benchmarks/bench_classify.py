@@ -0,0 +1,61 @@
+# Classification-only fast mode vs full steady state solve of the two zone model
+# Times each point and checks the ignition decision agrees over a random sample of the sweep grid
+# Run from repo root: python benchmarks/bench_classify.py [--samples 40]
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine_cfg import CombustorCfg, Engine
+from compute_main import default_diffuser, T_T3, P_T3, M_DOT_AIR
+from combustor_main import run_diffuser
+from fnc_comb import multi_flow_recirculation_combustion, classify_ignition, ignition_score
+from bench_sparse_two_zone import sample_grid
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--T_ignite", type=float, default=1000.0)
+    parser.add_argument("--fuel_max", type=float, default=1e-3)
+    args = parser.parse_args()
+
+    diffuser1 = default_diffuser()
+    t_full, t_fast = [], []
+    n_agree = 0
+    decided = {}
+    margins = []
+    for f_primary, v_frac_primary, volume_b in sample_grid(args.samples, args.seed):
+        combustor1 = CombustorCfg(fuel_comp="C3H8:1", PR_b=0.95, n_b=0.98, primary_equivRatio=0.5,
+                                  volume_b=volume_b, f_primary=f_primary, v_frac_primary=v_frac_primary)
+        eng1 = Engine(T_t3=T_T3, P_t3=P_T3, m_dot_air=M_DOT_AIR, diffuser=diffuser1, combustor=combustor1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            M_out, converged, diff_gas_out, diff_mdot_out = run_diffuser(eng1)
+
+            t0 = time.perf_counter()
+            primary_gas_out, secondary_gas_out = multi_flow_recirculation_combustion(eng1, diff_gas_out, diff_mdot_out)
+            t_full.append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            res = classify_ignition(eng1, diff_gas_out, diff_mdot_out, T_ignite=args.T_ignite, fuel_max=args.fuel_max)
+            t_fast.append(time.perf_counter() - t0)
+
+        score = ignition_score(primary_gas_out.T, primary_gas_out.X[primary_gas_out.species_index("C3H8")],
+                               args.T_ignite, args.fuel_max)
+        agree = (score >= 0) == res.ignited
+        n_agree += agree
+        decided[res.decided] = decided.get(res.decided, 0) + 1
+        margins.append(res.margin)
+        print(f"f = {f_primary:.3f}, v_frac = {v_frac_primary:.3f}, volume_b = {volume_b:.4f}: "
+              f"full {t_full[-1]:.3f} s (T = {primary_gas_out.T:.1f}), fast {t_fast[-1]:.3f} s "
+              f"({res.decided} at {res.t_over_tau:.1f} tau, margin {res.margin:.2f}){'' if agree else '  MISMATCH'}")
+
+    print(f"\nAgreement: {n_agree}/{args.samples}, decisions: {decided}, min margin: {min(margins):.3f}")
+    print(f"Mean time per point: full {np.mean(t_full):.3f} s, fast {np.mean(t_fast):.3f} s, "
+          f"speedup {np.sum(t_full)/np.sum(t_fast):.1f}x")
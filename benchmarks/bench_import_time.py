@@ -0,0 +1,54 @@
+# Cold-start import time of the headless compute entry point (what every pool worker/ batch job pays)
+# Run from repo root: python benchmarks/bench_import_time.py [--budget 1.0]
+import argparse
+import os
+import subprocess
+import sys
+import statistics
+
+base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Import compute entry, then make sure nothing pulled in plotting or loaded a mechanism
+CHILD = """
+import sys, time
+t0 = time.perf_counter()
+import compute_main
+dt = time.perf_counter() - t0
+heavy = [m for m in ("matplotlib", "matplotlib.pyplot", "mpl_toolkits.mplot3d", "plot_util") if m in sys.modules]
+print(dt)
+print(",".join(heavy))
+"""
+
+
+def time_import(n_runs):
+    times = []
+    heavy = set()
+    for _ in range(n_runs):
+        # Fresh interpreter each time so it's a real cold start (no module cache)
+        out = subprocess.run([sys.executable, "-c", CHILD], cwd=base_dir, capture_output=True, text=True, check=True)
+        dt, mods = out.stdout.splitlines()[-2:]
+        times.append(float(dt))
+        heavy.update(m for m in mods.split(",") if m)
+    return times, heavy
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget", type=float, default=1.0, help="max median import time [s]")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    times, heavy = time_import(args.runs)
+    median = statistics.median(times)
+    print(f"compute_main import: median {median:.3f} s, min {min(times):.3f} s, max {max(times):.3f} s over {args.runs} runs")
+
+    failed = False
+    if heavy:
+        print(f"FAIL: plotting modules imported by compute entry point: {sorted(heavy)}")
+        failed = True
+    if median > args.budget:
+        print(f"FAIL: median import time {median:.3f} s over budget {args.budget:.3f} s")
+        failed = True
+    if not failed:
+        print(f"OK: under {args.budget:.3f} s budget")
+    sys.exit(1 if failed else 0)
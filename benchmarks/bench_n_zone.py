@@ -0,0 +1,57 @@
+# Scaling of the N zone network solve time, sparse (mole reactors + adaptive preconditioner) vs dense
+# Run from repo root: python benchmarks/bench_n_zone.py [--zones 2 5 10 20] [--no-dense]
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine_cfg import CombustorCfg, Engine
+from compute_main import default_diffuser, T_T3, P_T3, M_DOT_AIR
+from combustor_main import run_diffuser
+from fnc_comb import n_zone_combustion, ignition_score
+from fnc_comb.help_fnc import InletState
+
+
+def time_solve(eng, diff_gas_out, diff_mdot_out, inlet, n_zones, solver, recirc_frac):
+    t0 = time.perf_counter()
+    zone_gas_out = n_zone_combustion(eng, diff_gas_out, diff_mdot_out, inlet=inlet, n_zones=n_zones,
+                                     recirc_frac=recirc_frac, solver=solver, return_zones=True)
+    return time.perf_counter() - t0, zone_gas_out
+
+
+def is_lit(gas, fuel_X):
+    # plot_util ignition criteria on the first (fuelled, seeded) zone, a cold network solves faster and times nothing useful
+    return ignition_score(gas.T, gas.X[gas.species_index(fuel_X.split(":")[0])]) >= 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--zones", type=int, nargs="+", default=[2, 5, 10, 20])
+    parser.add_argument("--recirc_frac", type=float, default=0.3)
+    parser.add_argument("--no-dense", action="store_true", help="skip the dense solve (slow at 20 zones)")
+    args = parser.parse_args()
+
+    combustor1 = CombustorCfg(fuel_comp="C3H8:1", PR_b=0.95, n_b=0.98, primary_equivRatio=0.5,
+                              volume_b=0.0207*3, f_primary=0.3, v_frac_primary=0.6)
+    eng1 = Engine(T_t3=T_T3, P_t3=P_T3, m_dot_air=M_DOT_AIR, diffuser=default_diffuser(), combustor=combustor1)
+    M_out, converged, diff_gas_out, diff_mdot_out = run_diffuser(eng1)
+    inlet = InletState(eng1, diff_gas_out, diff_mdot_out)
+
+    solvers = ["sparse"] if args.no_dense else ["sparse", "dense"]
+    print(f"{'zones':>5} | {'solver':>6} | {'time [s]':>9} | {'T_first [K]':>11} | {'T_last [K]':>10}")
+    for n_zones in args.zones:
+        times = {}
+        for solver in solvers:
+            # Recirculation loop needs 2+ primary zones (n_zone_layout)
+            recirc_frac = args.recirc_frac if n_zones >= 4 else 0.0
+            dt, zone_gas_out = time_solve(eng1, diff_gas_out, diff_mdot_out, inlet, n_zones, solver, recirc_frac)
+            if not is_lit(zone_gas_out[0], inlet.fuel_X):
+                print(f"{n_zones:>5} | {solver:>6} | {'-':>9} | {zone_gas_out[0].T:>11.2f} | {zone_gas_out[-1].T:>10.2f}"
+                      f"  zone 0 not lit, timing not reported")
+                continue
+            times[solver] = dt
+            print(f"{n_zones:>5} | {solver:>6} | {dt:>9.3f} | {zone_gas_out[0].T:>11.2f} | {zone_gas_out[-1].T:>10.2f}")
+        if len(times) == 2:
+            print(f"{'':>5}   speedup sparse vs dense: {times['dense'] / times['sparse']:.1f}x")
@@ -0,0 +1,95 @@
+# Two zone model outlet coupling, valves (valve_coeff) vs pressure controllers tied to the inlet MFCs
+# Times each point to steady state, reports mass balance residual, zone pressure offset from P_t4 and
+# whether the ignition outcome/ outlet T agree over a random sample of the sweep grid
+# Run from repo root: python benchmarks/bench_outlet_coupling.py [--samples 20] [--pressure_coeff 1e-2]
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine_cfg import CombustorCfg, Engine
+from compute_main import default_diffuser, T_T3, P_T3, M_DOT_AIR
+from combustor_main import run_diffuser
+from fnc_comb import multi_flow_recirculation_combustion, get_recirculation_network
+from bench_sparse_two_zone import sample_grid
+
+
+def solve_point(eng, diff_gas_out, diff_mdot_out, outlet_coupling, valve_coeff, pressure_coeff):
+    with contextlib.redirect_stdout(io.StringIO()):
+        t0 = time.perf_counter()
+        try:
+            primary_gas_out, secondary_gas_out = multi_flow_recirculation_combustion(
+                eng, diff_gas_out, diff_mdot_out, outlet_coupling=outlet_coupling, valve_coeff=valve_coeff,
+                pressure_coeff=pressure_coeff)
+        except Exception:
+            primary_gas_out, secondary_gas_out = None, None
+        dt = time.perf_counter() - t0
+    net = get_recirculation_network(outlet_coupling=outlet_coupling)
+    return dt, primary_gas_out, secondary_gas_out, net.last_residual, net.network.time
+
+
+def ignited(gas, T_ignite=1000.0, fuel_max=1e-3):
+    return gas.T >= T_ignite and gas.X[gas.species_index("C3H8")] <= fuel_max
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--valve_coeff", type=float, default=1e-4)
+    parser.add_argument("--pressure_coeff", type=float, default=1e-2)
+    args = parser.parse_args()
+
+    diffuser1 = default_diffuser()
+    couplings = ("valve", "pressure")
+    times = {c: [] for c in couplings}
+    t_steady = {c: [] for c in couplings}
+    residuals = {c: [] for c in couplings}
+    dP = {c: [] for c in couplings}
+    n_fail = {c: 0 for c in couplings}
+    n_agree = 0
+    dT_both = []
+    for f_primary, v_frac_primary, volume_b in sample_grid(args.samples, args.seed):
+        combustor1 = CombustorCfg(fuel_comp="C3H8:1", PR_b=0.95, n_b=0.98, primary_equivRatio=0.5,
+                                  volume_b=volume_b, f_primary=f_primary, v_frac_primary=v_frac_primary)
+        eng1 = Engine(T_t3=T_T3, P_t3=P_T3, m_dot_air=M_DOT_AIR, diffuser=diffuser1, combustor=combustor1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            M_out, converged, diff_gas_out, diff_mdot_out = run_diffuser(eng1)
+
+        out = {}
+        for c in couplings:
+            dt, primary_gas_out, secondary_gas_out, res, t_end = solve_point(
+                eng1, diff_gas_out, diff_mdot_out, c, args.valve_coeff, args.pressure_coeff)
+            times[c].append(dt)
+            if primary_gas_out is None:
+                n_fail[c] += 1
+                continue
+            out[c] = primary_gas_out
+            t_steady[c].append(t_end)
+            residuals[c].append(res["mass_residual"])
+            dP[c].append(res["dP_rel"])
+
+        line = f"f = {f_primary:.3f}, v_frac = {v_frac_primary:.3f}, volume_b = {volume_b:.4f}: " + ", ".join(
+            f"{c} {times[c][-1]:.3f} s (T = {out[c].T:.1f})" if c in out else f"{c} FAILED" for c in couplings)
+        if len(out) == 2:
+            ign = [ignited(out[c]) for c in couplings]
+            n_agree += ign[0] == ign[1]
+            if all(ign):
+                dT_both.append(abs(out["valve"].T - out["pressure"].T))
+            if ign[0] != ign[1]:
+                line += "  IGNITION DIFFERS"
+        print(line)
+
+    print()
+    for c in couplings:
+        print(f"{c}: mean time {np.mean(times[c]):.3f} s, mean steady time {np.mean(t_steady[c])*1e3:.2f} ms, "
+              f"max mass residual {np.max(residuals[c]):.2e}, mean |P - P_t4|/P_t4 {np.mean(dP[c]):.3e}, "
+              f"failed {n_fail[c]}")
+    print(f"Speedup (valve/ pressure): {np.sum(times['valve'])/np.sum(times['pressure']):.2f}x")
+    print(f"Ignition outcome agrees: {n_agree}/{args.samples - max(n_fail.values())}"
+          + (f", max |dT| where both ignite {np.max(dT_both):.1f} K" if dT_both else ""))
@@ -0,0 +1,67 @@
+# Damkohler pre-screen vs full steady state solve of the two zone model
+# Screens a random sample of the sweep grid, runs the full solve on all of it, refits the thresholds
+# (calibrate_screen) and reports screening error rates and time per point
+# Run from repo root: python benchmarks/bench_screen.py [--samples 60]
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine_cfg import CombustorCfg, Engine
+from compute_main import default_diffuser, T_T3, P_T3, M_DOT_AIR
+from combustor_main import run_diffuser
+from fnc_comb import multi_flow_recirculation_combustion, screen_point, calibrate_screen, screen_error_rates
+from bench_sparse_two_zone import sample_grid
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--T_ignite", type=float, default=1000.0)
+    parser.add_argument("--fuel_max", type=float, default=1e-3)
+    args = parser.parse_args()
+
+    diffuser1 = default_diffuser()
+    t_full, t_screen = [], []
+    decisions, Da, ignited = [], [], []
+    for f_primary, v_frac_primary, volume_b in sample_grid(args.samples, args.seed):
+        combustor1 = CombustorCfg(fuel_comp="C3H8:1", PR_b=0.95, n_b=0.98, primary_equivRatio=0.5,
+                                  volume_b=volume_b, f_primary=f_primary, v_frac_primary=v_frac_primary)
+        eng1 = Engine(T_t3=T_T3, P_t3=P_T3, m_dot_air=M_DOT_AIR, diffuser=diffuser1, combustor=combustor1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            M_out, converged, diff_gas_out, diff_mdot_out = run_diffuser(eng1)
+
+            t0 = time.perf_counter()
+            res = screen_point(eng1, diff_gas_out, diff_mdot_out, T_ignite=args.T_ignite)
+            t_screen.append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            primary_gas_out, secondary_gas_out = multi_flow_recirculation_combustion(eng1, diff_gas_out, diff_mdot_out)
+            t_full.append(time.perf_counter() - t0)
+
+        ign = bool(primary_gas_out.T >= args.T_ignite
+                   and primary_gas_out.X[primary_gas_out.species_index("C3H8")] <= args.fuel_max)
+        decisions.append(res.decision)
+        Da.append(res.Da)
+        ignited.append(ign)
+        wrong = (res.decision == "no_ignite" and ign) or (res.decision == "ignite" and not ign)
+        print(f"f = {f_primary:.3f}, v_frac = {v_frac_primary:.3f}, volume_b = {volume_b:.4f}: "
+              f"Da = {res.Da:.1f} -> {res.decision}, full T = {primary_gas_out.T:.1f} ({'ignited' if ign else 'not ignited'})"
+              f"{'  WRONG' if wrong else ''}")
+
+    rates = screen_error_rates(decisions, ignited)
+    Da_lo, Da_hi = calibrate_screen(Da, ignited)
+    print(f"\nScreen (default thresholds): {rates}")
+    print(f"Calibrated thresholds from this sample: Da_lo = {Da_lo:.2f}, Da_hi = {Da_hi:.2f}")
+    print(f"Mean time per point: screen {np.mean(t_screen)*1e3:.2f} ms (first {t_screen[0]*1e3:.1f} ms, cached mixture after), "
+          f"full {np.mean(t_full):.3f} s")
+    # Sweep cost if confident points are skipped (ambiguous ones still need the full solve)
+    n_full = rates["n_ambiguous"] + rates["n_ignite"]
+    print(f"Skipping no_ignite points: {n_full}/{len(decisions)} full solves, "
+          f"est. speedup {np.sum(t_full)/(np.sum(t_screen) + np.sum(np.array(t_full)[np.array(decisions) != 'no_ignite'])):.1f}x")
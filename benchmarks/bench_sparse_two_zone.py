@@ -0,0 +1,101 @@
+# Two zone recirculation model, dense vs sparse (mole reactors + adaptive preconditioner) solver
+# Times each point and checks steady outlet T/ composition agree over a random sample of the sweep grid
+# Run from repo root: python benchmarks/bench_sparse_two_zone.py [--samples 20]
+# Sparse is not faster on two reactors (0.79x on 8 samples, half of them redone dense), kept for comparison
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine_cfg import CombustorCfg, Engine
+from compute_main import default_diffuser, T_T3, P_T3, M_DOT_AIR
+from combustor_main import run_diffuser
+from fnc_comb import multi_flow_recirculation_combustion, get_recirculation_network
+
+
+def sample_grid(n_samples, seed, n=25, n2=40, recirc_factor=3):
+    # Same grid as the main sweep (run_1-23-26n25-40)
+    rng = np.random.default_rng(seed)
+    f_primary_array = np.linspace(0.05, 0.95, n)
+    v_frac_primary_array = np.linspace(0.05, 0.95, n)
+    volume_b_array = np.linspace(0.001, 0.08, n2)
+    pts = []
+    for _ in range(n_samples):
+        pts.append((f_primary_array[rng.integers(n)], v_frac_primary_array[rng.integers(n)],
+                    volume_b_array[rng.integers(n2)] * recirc_factor))
+    return pts
+
+
+def solve_point(eng, diff_gas_out, diff_mdot_out, solver):
+    # Model prints totals every call, keep benchmark output readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        t0 = time.perf_counter()
+        try:
+            primary_gas_out, secondary_gas_out = multi_flow_recirculation_combustion(
+                eng, diff_gas_out, diff_mdot_out, solver=solver)
+        except Exception:
+            # advance_to_steady_state hit max steps/ integrator failure, counted as not converged
+            primary_gas_out, secondary_gas_out = None, None
+        dt = time.perf_counter() - t0
+    return dt, primary_gas_out, secondary_gas_out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--T_tol", type=float, default=1.0, help="max allowed |T_sparse - T_dense| [K]")
+    parser.add_argument("--X_tol", type=float, default=1e-4, help="max allowed |X_sparse - X_dense|")
+    args = parser.parse_args()
+
+    diffuser1 = default_diffuser()
+    times = {"dense": [], "sparse": []}
+    dT_max = 0.0
+    dX_max = 0.0
+    n_fail = 0
+    n_no_conv = {"dense": 0, "sparse": 0}
+
+    print(f"{'f_prim':>6} {'v_frac':>6} {'vol_b':>7} | {'dense [s]':>9} {'sparse [s]':>10} | {'T_dense':>8} {'dT':>9} {'dX':>9}")
+    for f_primary, v_frac_primary, volume_b in sample_grid(args.samples, args.seed):
+        combustor1 = CombustorCfg(fuel_comp="C3H8:1", PR_b=0.95, n_b=0.98, primary_equivRatio=0.5,
+                                  volume_b=volume_b, f_primary=f_primary, v_frac_primary=v_frac_primary)
+        eng1 = Engine(T_t3=T_T3, P_t3=P_T3, m_dot_air=M_DOT_AIR, diffuser=diffuser1, combustor=combustor1)
+        M_out, converged, diff_gas_out, diff_mdot_out = run_diffuser(eng1)
+
+        out = {}
+        for solver in ("dense", "sparse"):
+            dt, primary_gas_out, secondary_gas_out = solve_point(eng1, diff_gas_out, diff_mdot_out, solver)
+            times[solver].append(dt)
+            out[solver] = (primary_gas_out, secondary_gas_out)
+            if primary_gas_out is None:
+                n_no_conv[solver] += 1
+
+        if out["dense"][0] is None or out["sparse"][0] is None:
+            n_fail += 1
+            print(f"{f_primary:>6.3f} {v_frac_primary:>6.3f} {volume_b:>7.4f} | {times['dense'][-1]:>9.3f} {times['sparse'][-1]:>10.3f} | "
+                  f"not converged: {[s for s in out if out[s][0] is None]}")
+            continue
+
+        # Worst difference over both zones
+        dT = max(abs(out["sparse"][z].T - out["dense"][z].T) for z in range(2))
+        dX = max(np.max(np.abs(out["sparse"][z].X - out["dense"][z].X)) for z in range(2))
+        dT_max = max(dT_max, dT)
+        dX_max = max(dX_max, dX)
+        if dT > args.T_tol or dX > args.X_tol:
+            n_fail += 1
+        print(f"{f_primary:>6.3f} {v_frac_primary:>6.3f} {volume_b:>7.4f} | {times['dense'][-1]:>9.3f} {times['sparse'][-1]:>10.3f} | "
+              f"{out['dense'][0].T:>8.1f} {dT:>9.2e} {dX:>9.2e}")
+
+    t_dense = np.mean(times["dense"])
+    t_sparse = np.mean(times["sparse"])
+    print(f"\nmean time per point: dense {t_dense:.3f} s, sparse {t_sparse:.3f} s, sparse/ dense speed {t_dense / t_sparse:.2f}x")
+    print(f"max |dT| = {dT_max:.3e} K, max |dX| = {dX_max:.3e}, points outside tolerance/ not converged: {n_fail}/{args.samples}")
+    print(f"not converged: dense {n_no_conv['dense']}, sparse {n_no_conv['sparse']}")
+    n_fallbacks = get_recirculation_network(solver="sparse").n_fallbacks
+    print(f"sparse points redone with dense solver after GMRES failure: {n_fallbacks}/{args.samples}")
+    sys.exit(1 if n_fail else 0)
@@ -1,12 +1,13 @@
-
 # Combustor main
 from fnc_comb import iterate_diffuser
 from fnc_comb import single_flow_combustion
 from fnc_comb import multi_flow_recirculation_combustion
 from fnc_comb import multi_flow_recirculation_secondary_comb_combustion
+from fnc_comb import COMBUSTOR_MODELS, DEFAULT_MODEL, run_combustor_model
+from fnc_comb.help_fnc import InletState
 
 
-def combustor_main(eng):
+def run_diffuser(eng):
 
     # Set diffuser composition to air
     air_X = 'O2:0.21, N2:0.79'
@@ -29,14 +30,34 @@ def combustor_main(eng):
     # current getting good results, velocity down to 25 m/s with +/- 1.9cm to shroud and hub radii
     # static pressure increases with decreased velocity
     # stagnation/ total pressure small decrease due to losses modelled by eta_i (diff efficiency)
-    M_out, converged, diff_gas_out, diff_mdot_out = iterate_diffuser(eng)
+    return iterate_diffuser(eng)
+
+
+def combustor_main(eng, model=DEFAULT_MODEL, **model_kwargs):
+
+    M_out, converged, diff_gas_out, diff_mdot_out = run_diffuser(eng)
 
     if converged:
-        #comb_gas_out = single_flow_combustion(eng, diff_gas_out, diff_mdot_out)
-        comb_primary_gas_out, comb_secondary_gas_out = multi_flow_recirculation_combustion(eng, diff_gas_out, diff_mdot_out)
+        # Models in fnc_comb/combustor_models.py, old default was multi_flow_recirculation_combustion
+        comb_primary_gas_out, comb_secondary_gas_out = run_combustor_model(model, eng, diff_gas_out, diff_mdot_out, **model_kwargs)
         
         # print(comb_gas_out.T)
         # print(comb_gas_out.P)
 
     return comb_primary_gas_out, comb_secondary_gas_out # change
 
+
+def compare_models(eng, models=None):
+    """
+    Run several combustor models on the same design point, diffuser and inlet states only done once
+    Returns {model name: (primary_gas_out, secondary_gas_out)}
+    """
+    if models is None:
+        models = list(COMBUSTOR_MODELS)
+
+    M_out, converged, diff_gas_out, diff_mdot_out = run_diffuser(eng)
+    if not converged:
+        return {name: (None, None) for name in models}
+
+    inlet = InletState(eng, diff_gas_out, diff_mdot_out)
+    return {name: run_combustor_model(name, eng, diff_gas_out, diff_mdot_out, inlet=inlet) for name in models}
@@ -0,0 +1,438 @@
+# Headless compute entry point, no plotting imports so pool workers/ batch jobs start fast
+# Plotting lives in plot_util and is only imported by main.py when rendering is requested
+import argparse
+import numpy as np
+import combustor_main as comb
+from engine_cycle import build_engine_cycle, build_classify_cycle
+from engine_cfg import DiffuserCfg, CombustorCfg, Engine
+import os
+from pickle_util import save, data_dir
+from fnc_comb import COMBUSTOR_MODELS, DEFAULT_MODEL, TrajectoryRecorder, screen_point, screen_error_rates, count_fallbacks, \
+    get_recirculation_network
+from result_cache import ResultCache
+from sweep_runner import SweepRunner
+from telemetry_util import SweepTelemetry
+
+
+# Default operating point, temporary - value from matlab of compressor outlet
+T_T3 = 345.68
+P_T3 = 130640
+M_DOT_AIR = 1.388
+
+
+def default_diffuser():
+    # A_diff_out using +/- 1.9cm to shroud and hub outlet radii
+    return DiffuserCfg(
+        A_diff_in=0.0153,
+        A_diff_out=0.091, # Doing 4 circular combustion chambers, total of them = A_diff_out
+        diff_eta_i=0.9
+    )
+
+
+def run_single(diffuser, combustor, T_t3=T_T3, P_t3=P_T3, m_dot_air=M_DOT_AIR, cache=None, **model_kwargs):
+    eng1 = Engine(T_t3=T_t3, P_t3=P_t3, m_dot_air=m_dot_air, diffuser=diffuser, combustor=combustor)
+    if cache is None:
+        comb_primary_gas_out, comb_secondary_gas_out = comb.combustor_main(eng1, **model_kwargs)
+    else:
+        # Persistent cache (result_cache.py), only solves if this exact point/ code version isn't stored
+        model = model_kwargs.pop("model", DEFAULT_MODEL)
+        comb_primary_gas_out, comb_secondary_gas_out = cache.get_or_run(
+            eng1, lambda: comb.combustor_main(eng1, model, **model_kwargs), model, **model_kwargs)
+
+    T_prim_out = comb_primary_gas_out.T
+    P_prim_out = comb_primary_gas_out.P
+    X = comb_primary_gas_out.X
+    fuel_prim_out = X[comb_primary_gas_out.species_index('C3H8')] #X[iCO2]:.6e
+
+    T_secondary_out = comb_secondary_gas_out.T
+    P_secondary_out = comb_secondary_gas_out.P
+    X2 = comb_secondary_gas_out.X
+    fuel_secondary_out = X2[comb_secondary_gas_out.species_index('C3H8')] #X[iCO2]:.6e
+
+    print(f"Primary: T_out = {T_prim_out}, P_out = {P_prim_out}, fuel_out = {fuel_prim_out}")
+    print(f"Secondary: T_out = {T_secondary_out}, P_out = {P_secondary_out}, fuel_out = {fuel_secondary_out}")
+    if cache is None and model_kwargs.get("model", DEFAULT_MODEL) == "multi_flow_recirculation" \
+            and model_kwargs.get("reuse_network", True):
+        # Solved on the per process network, its converged mass balance (outlet_coupling.OutletCoupling.residual)
+        net = get_recirculation_network(solver=model_kwargs.get("solver", "dense"),
+                                        outlet_coupling=model_kwargs.get("outlet_coupling", "valve"))
+        print(f"Mass balance: {net.last_residual}")
+    return comb_primary_gas_out, comb_secondary_gas_out
+
+
+# Engine cycle per process and model settings, compressor/ diffuser stages cached across points
+_cycles = {}
+
+def _get_cycle(model_kwargs):
+    key = repr(sorted(model_kwargs.items()))
+    if key not in _cycles:
+        _cycles[key] = build_engine_cycle(**model_kwargs)
+    return _cycles[key]
+
+
+def _sweep_point(task):
+    # One sweep point, runs in a SweepRunner worker (or in process), returns plain arrays only
+    diffuser, combustor1, T_t3, P_t3, m_dot_air, cache, model_kwargs = task
+    cycle = _get_cycle(model_kwargs)
+    n_fallbacks = count_fallbacks()
+
+    # Only the combustor (and turbine) stages re-run, compressor/ diffuser cached from first point
+    run_point = lambda: cycle.run(T_t3=T_t3, P_t3=P_t3, m_dot_air=m_dot_air, diffuser=diffuser, combustor=combustor1)["combustor"]
+    if cache is None:
+        comb_primary_gas_out, comb_secondary_gas_out = run_point()
+    else:
+        key_kwargs = dict(model_kwargs)
+        model = key_kwargs.pop("model", DEFAULT_MODEL)
+        eng1 = Engine(T_t3=T_t3, P_t3=P_t3, m_dot_air=m_dot_air, diffuser=diffuser, combustor=combustor1)
+        comb_primary_gas_out, comb_secondary_gas_out = cache.get_or_run(eng1, run_point, model, **key_kwargs)
+    if comb_primary_gas_out is None:
+        return None
+
+    out = {"species_names": comb_primary_gas_out.species_names, "sparse_fallback": count_fallbacks() > n_fallbacks}
+    for zone, gas in (("primary", comb_primary_gas_out), ("secondary", comb_secondary_gas_out)):
+        X = gas.X
+        out[zone] = (gas.T, gas.P, X[gas.species_index('C3H8')], X[gas.species_index('O2')], gas.Y)
+    return out
+
+
+def _run_points(filename, fnc, tasks, store, processes=None, max_rss_mb=None, max_tasks_per_worker=None,
+                timeout_s=None, http_port=None, status_every=5.0):
+    """
+    Runs sweep points through SweepRunner with telemetry (rate, ETA, failures, utilization) rewritten to
+    Data_Storage/<filename>.status.json every status_every s, and served on 127.0.0.1:http_port if given
+    """
+    telemetry = SweepTelemetry(len(tasks), os.path.join(data_dir, filename + ".status.json"), write_every=status_every,
+                               http_port=http_port, n_workers=processes or 1)
+    runner = SweepRunner(fnc, processes, max_rss_mb, max_tasks_per_worker, timeout_s, telemetry)
+    try:
+        runner.run(tasks, store)
+    finally:
+        telemetry.close()
+    return runner.meta
+
+
+def run_sweep(filename, diffuser, f_primary_array, v_frac_primary_array, volume_b_array, recirc_factor,
+              T_t3=T_T3, P_t3=P_T3, m_dot_air=M_DOT_AIR, cache=None,
+              processes=None, max_rss_mb=None, max_tasks_per_worker=None, timeout_s=None, http_port=None,
+              screen=None, screen_check=0.05, screen_skip=("no_ignite",), T_ignite=1000.0, fuel_max=1e-3, **model_kwargs):
+    """
+    cache: optional result_cache.ResultCache, points already on disk (any earlier sweep) are read instead of solved
+    screen: True or dict of fnc_comb.screen_point settings (Da_lo, Da_hi), points the screen puts in
+        screen_skip are not solved (outputs left NaN), a random screen_check fraction of them is solved anyway
+        and screening error rates over every fully solved point go in run_meta["screen"]
+    T_ignite/ fuel_max: ignition criteria the screen and its error rates use (plot_util defaults)
+    processes: None runs in this process, N runs on N workers (sweep_runner.SweepRunner)
+    max_rss_mb/ max_tasks_per_worker: recycle a worker once over the memory watermark/ task count
+    timeout_s: give up on a point after this long (workers only), http_port: serve live status (see _run_points)
+    Memory per point stats saved with the results as run_meta
+    """
+    if processes is not None and "recorder" in model_kwargs:
+        raise ValueError("TrajectoryRecorder can't be shared between worker processes, use processes=None to record")
+    n = len(f_primary_array)
+    nv = len(v_frac_primary_array)
+    n2 = len(volume_b_array)
+
+    # Create output arrays
+    T_primary_out = np.full((n, nv, n2), np.nan)
+    P_primary_out = np.full((n, nv, n2), np.nan)
+    fuel_primary_out = np.full((n, nv, n2), np.nan)
+    O2_primary_out = np.full((n, nv, n2), np.nan)
+    converged = np.zeros((n, nv, n2), dtype=bool)
+
+    T_secondary_out = np.full((n, nv, n2), np.nan)
+    P_secondary_out = np.full((n, nv, n2), np.nan)
+    fuel_secondary_out = np.full((n, nv, n2), np.nan)
+    O2_secondary_out = np.full((n, nv, n2), np.nan)
+
+    # Full outlet compositions (mass fractions) for post_util, allocated once species count is known
+    Y_primary_out = None
+    Y_secondary_out = None
+    species_names = None
+
+    points = []
+    tasks = []
+    for i, f_primary in enumerate(f_primary_array):
+        for j, v_frac_primary in enumerate(v_frac_primary_array):
+            for k, volume_b in enumerate(volume_b_array):
+                combustor1 = CombustorCfg(
+                    fuel_comp="C3H8:1",
+                    PR_b=0.95,
+                    n_b=0.98,
+                    primary_equivRatio=0.5,
+                    volume_b=volume_b*recirc_factor,
+                    f_primary=f_primary,
+                    v_frac_primary=v_frac_primary
+                )
+                points.append((i, j, k))
+                tasks.append((diffuser, combustor1, T_t3, P_t3, m_dot_air, cache, model_kwargs))
+
+    # Low fidelity pre-screen (residence time/ ignition delay), full solve only where it isn't confident
+    screen_decision = None
+    if screen:
+        screen_decision, screen_Da, run_idx = _screen_points(tasks, points, (n, nv, n2), screen, screen_check, screen_skip,
+                                                                T_ignite)
+        points = [points[p] for p in run_idx]
+        tasks = [tasks[p] for p in run_idx]
+
+    def store(idx, out):
+        nonlocal Y_primary_out, Y_secondary_out, species_names, n_sparse_fallbacks
+        i, j, k = points[idx]
+        if out is None:
+            return
+        if Y_primary_out is None:
+            species_names = out["species_names"]
+            Y_primary_out = np.full((n, nv, n2, len(species_names)), np.nan)
+            Y_secondary_out = np.full((n, nv, n2, len(species_names)), np.nan)
+        T_primary_out[i, j, k], P_primary_out[i, j, k], fuel_primary_out[i, j, k], O2_primary_out[i, j, k], Y_primary_out[i, j, k] = out["primary"]
+        T_secondary_out[i, j, k], P_secondary_out[i, j, k], fuel_secondary_out[i, j, k], O2_secondary_out[i, j, k], Y_secondary_out[i, j, k] = out["secondary"]
+        converged[i, j, k] = True
+        n_sparse_fallbacks += out["sparse_fallback"]
+
+    n_sparse_fallbacks = 0
+    print(f"Starting loops...")
+    run_meta = _run_points(filename, _sweep_point, tasks, store, processes, max_rss_mb, max_tasks_per_worker, timeout_s, http_port)
+    _fallback_meta(run_meta, n_sparse_fallbacks, converged.sum())
+    print(f"Memory per point [MB]: {run_meta['rss_delta_per_point_mb']}, workers started: {run_meta['n_workers_started']}, "
+          f"recycled: {run_meta['n_recycled']}, failed points: {run_meta['n_failed']}")
+
+    if screen_decision is not None:
+        # Error rates over every point that got the full solve (ambiguous, not skipped, spot checks of skipped)
+        solved = converged.ravel()
+        ignited = (T_primary_out >= T_ignite) & (fuel_primary_out <= fuel_max)
+        run_meta["screen"] = screen_error_rates(screen_decision.ravel()[solved], ignited.ravel()[solved])
+        run_meta["screen"]["n_skipped"] = screen_decision.size - len(tasks)
+        print(f"Screen: {run_meta['screen']}")
+
+    if cache is not None:
+        # Workers evict against their own copy of the cache, enforce the size bound over everything they wrote
+        cache.evict()
+        if processes is None:
+            print(f"Result cache: {cache.stats()}")
+
+    # Save data using pickle_util
+    save(filename, 'T_primary_out', 'P_primary_out', 'fuel_primary_out', 'O2_primary_out', 'converged',
+         'T_secondary_out', 'P_secondary_out', 'fuel_secondary_out', 'O2_secondary_out',
+         'Y_primary_out', 'Y_secondary_out', 'species_names', 'run_meta',
+         'f_primary_array', 'v_frac_primary_array', 'volume_b_array'
+         )
+    if screen_decision is not None:
+        save(filename + "_screen", 'screen_decision', 'screen_Da', 'f_primary_array', 'v_frac_primary_array', 'volume_b_array')
+
+
+def _fallback_meta(run_meta, n_sparse_fallbacks, n_solved):
+    # Sparse solver points GMRES couldn't finish and were redone dense (RecirculationNetwork.solve)
+    run_meta["n_sparse_fallbacks"] = int(n_sparse_fallbacks)
+    run_meta["sparse_fallback_rate"] = n_sparse_fallbacks / n_solved if n_solved else 0.0
+    if n_sparse_fallbacks:
+        print(f"Sparse solver fell back to dense on {n_sparse_fallbacks}/{n_solved} points")
+
+
+def _screen_points(tasks, points, shape, screen, screen_check, screen_skip, T_ignite=1000.0, seed=0):
+    """
+    Screens every sweep point (diffuser run once, grid shares the throttle point), returns decision/ Da arrays and
+    the indices of points to fully solve. Diffuser not converged: nothing screened (decision "no_diffuser"), every
+    point goes to the full solve, which records the failure
+    """
+    screen_kwargs = screen if isinstance(screen, dict) else {}
+    diffuser, combustor1, T_t3, P_t3, m_dot_air = tasks[0][:5]
+    eng0 = Engine(T_t3=T_t3, P_t3=P_t3, m_dot_air=m_dot_air, diffuser=diffuser, combustor=combustor1)
+    M_out, diff_converged, diff_gas_out, diff_mdot_out = comb.run_diffuser(eng0)
+
+    screen_decision = np.full(shape, "", dtype=object)
+    screen_Da = np.full(shape, np.nan)
+    if not diff_converged:
+        print("Screen: diffuser not converged, no points screened")
+        screen_decision[:] = "no_diffuser"
+        return screen_decision, screen_Da, list(range(len(tasks)))
+    rng = np.random.default_rng(seed)
+    run_idx = []
+    for p, task in enumerate(tasks):
+        eng1 = Engine(T_t3=T_t3, P_t3=P_t3, m_dot_air=m_dot_air, diffuser=diffuser, combustor=task[1])
+        res = screen_point(eng1, diff_gas_out, diff_mdot_out, T_ignite=T_ignite, **screen_kwargs)
+        screen_decision[points[p]] = res.decision
+        screen_Da[points[p]] = res.Da
+        if res.decision not in screen_skip or rng.random() < screen_check:
+            run_idx.append(p)
+    print(f"Screen: {len(tasks) - len(run_idx)}/{len(tasks)} points skipped")
+    return screen_decision, screen_Da, run_idx
+
+
+_classify_cycles = {}
+
+def _classify_point(task):
+    diffuser, combustor1, T_t3, P_t3, m_dot_air, classify_kwargs = task
+    key = repr(sorted(classify_kwargs.items()))
+    if key not in _classify_cycles:
+        _classify_cycles[key] = build_classify_cycle(**classify_kwargs)
+    n_fallbacks = count_fallbacks()
+    res = _classify_cycles[key].run(T_t3=T_t3, P_t3=P_t3, m_dot_air=m_dot_air, diffuser=diffuser, combustor=combustor1)["classify"]
+    if res is None:
+        return None
+    T, P, Y = res.primary_state
+    return (res.ignited, res.margin, res.decided, res.t_over_tau, T, count_fallbacks() > n_fallbacks)
+
+
+def run_classify_sweep(filename, diffuser, f_primary_array, v_frac_primary_array, volume_b_array, recirc_factor,
+                       T_t3=T_T3, P_t3=P_T3, m_dot_air=M_DOT_AIR,
+                       processes=None, max_rss_mb=None, max_tasks_per_worker=None, timeout_s=None, http_port=None,
+                       **classify_kwargs):
+    """
+    Same grid as run_sweep but only the ignition decision (fnc_comb.classify_ignition, early termination)
+    Saves ignited, ignition_margin, decided ("ignited"/ "extinguished"/ "steady"), t_over_tau and the partial primary T
+    classify_kwargs: T_ignite, fuel_max (plot_util defaults 1000 K, 1e-3), solver, rtol, ...
+    """
+    n = len(f_primary_array)
+    nv = len(v_frac_primary_array)
+    n2 = len(volume_b_array)
+
+    ignited = np.zeros((n, nv, n2), dtype=bool)
+    ignition_margin = np.full((n, nv, n2), np.nan)
+    decided = np.full((n, nv, n2), "", dtype=object)
+    t_over_tau = np.full((n, nv, n2), np.nan)
+    T_primary_partial = np.full((n, nv, n2), np.nan)
+
+    points = []
+    tasks = []
+    for i, f_primary in enumerate(f_primary_array):
+        for j, v_frac_primary in enumerate(v_frac_primary_array):
+            for k, volume_b in enumerate(volume_b_array):
+                combustor1 = CombustorCfg(
+                    fuel_comp="C3H8:1",
+                    PR_b=0.95,
+                    n_b=0.98,
+                    primary_equivRatio=0.5,
+                    volume_b=volume_b*recirc_factor,
+                    f_primary=f_primary,
+                    v_frac_primary=v_frac_primary
+                )
+                points.append((i, j, k))
+                tasks.append((diffuser, combustor1, T_t3, P_t3, m_dot_air, classify_kwargs))
+
+    n_sparse_fallbacks = 0
+    n_solved = 0
+    def store(idx, out):
+        nonlocal n_sparse_fallbacks, n_solved
+        if out is not None:
+            i, j, k = points[idx]
+            ignited[i, j, k], ignition_margin[i, j, k], decided[i, j, k], t_over_tau[i, j, k], T_primary_partial[i, j, k] = out[:5]
+            n_sparse_fallbacks += out[5]
+            n_solved += 1
+
+    run_meta = _run_points(filename, _classify_point, tasks, store, processes, max_rss_mb, max_tasks_per_worker, timeout_s, http_port)
+    _fallback_meta(run_meta, n_sparse_fallbacks, n_solved)
+    print(f"Ignited {ignited.sum()}/{ignited.size}, decided early {np.sum(decided != 'steady')}, "
+          f"mean stop {np.nanmean(t_over_tau):.1f} tau, failed points: {run_meta['n_failed']}")
+
+    save(filename, 'ignited', 'ignition_margin', 'decided', 't_over_tau', 'T_primary_partial', 'run_meta',
+         'f_primary_array', 'v_frac_primary_array', 'volume_b_array')
+
+
+def run_compare_sweep(filename, diffuser, combustors, models=None,
+                      T_t3=T_T3, P_t3=P_T3, m_dot_air=M_DOT_AIR):
+    """
+    Model comparison: every model in models evaluated on the same list of combustor design points.
+    Diffuser + inlet states done once per point and shared by all models (comb.compare_models)
+    """
+    if models is None:
+        models = list(COMBUSTOR_MODELS)
+    n_pts = len(combustors)
+
+    # Output arrays per model, index = design point
+    compare_results = {name: {"T_primary_out": np.full(n_pts, np.nan), "fuel_primary_out": np.full(n_pts, np.nan),
+                              "T_secondary_out": np.full(n_pts, np.nan), "fuel_secondary_out": np.full(n_pts, np.nan)}
+                       for name in models}
+    compare_combustors = list(combustors)
+
+    for p, combustor1 in enumerate(compare_combustors):
+        eng1 = Engine(T_t3=T_t3, P_t3=P_t3, m_dot_air=m_dot_air, diffuser=diffuser, combustor=combustor1)
+        model_out = comb.compare_models(eng1, models)
+
+        for name, (comb_primary_gas_out, comb_secondary_gas_out) in model_out.items():
+            if comb_primary_gas_out is None:
+                continue
+            res = compare_results[name]
+            res["T_primary_out"][p] = comb_primary_gas_out.T
+            res["fuel_primary_out"][p] = comb_primary_gas_out.X[comb_primary_gas_out.species_index('C3H8')]
+            res["T_secondary_out"][p] = comb_secondary_gas_out.T
+            res["fuel_secondary_out"][p] = comb_secondary_gas_out.X[comb_secondary_gas_out.species_index('C3H8')]
+
+    save(filename, 'compare_results', 'compare_combustors')
+    return compare_results
+
+
+if __name__ == "__main__":
+    # Units: Kelvin, Pascla, meters(m^2,m^3)
+    parser = argparse.ArgumentParser(description="Headless combustor runs (no plotting)")
+    parser.add_argument("--sweep", metavar="FILENAME", help="run the f/v_frac/volume_b sweep and save to Data_Storage/FILENAME")
+    parser.add_argument("--n", type=int, default=25, help="fraction increments")
+    parser.add_argument("--n2", type=int, default=40, help="volume increments")
+    parser.add_argument("--recirc_factor", type=float, default=3, help="recirculation factor to get effective volume")
+    parser.add_argument("--solver", choices=["dense", "sparse"], default="dense", help="two zone model linear solver")
+    parser.add_argument("--outlet_coupling", choices=["valve", "pressure"], default="valve", help="two zone model outlet devices (fnc_comb.OutletCoupling)")
+    parser.add_argument("--cache", action="store_true", help="use the persistent result cache in Data_Storage/result_cache")
+    parser.add_argument("--cache_mb", type=float, default=500.0, help="result cache size bound (MB)")
+    parser.add_argument("--classify", action="store_true", help="sweep only classifies ignition (early termination, fnc_comb.classify_ignition)")
+    parser.add_argument("--screen", action="store_true", help="skip points the Damkohler pre-screen says won't ignite (fnc_comb.screen_point)")
+    parser.add_argument("--T_ignite", type=float, default=1000.0, help="ignition criterion, primary T [K] (--classify/ --screen)")
+    parser.add_argument("--fuel_max", type=float, default=1e-3, help="ignition criterion, max primary fuel mole fraction (--classify/ --screen)")
+    parser.add_argument("--processes", type=int, default=None, help="sweep worker processes (default: run in this process)")
+    parser.add_argument("--max_rss_mb", type=float, default=None, help="recycle a sweep worker above this resident memory")
+    parser.add_argument("--max_tasks_per_worker", type=int, default=None, help="recycle a sweep worker after this many points")
+    parser.add_argument("--timeout_s", type=float, default=None, help="give up on a sweep point after this long (with --processes)")
+    parser.add_argument("--http_port", type=int, default=None, help="serve live sweep status on 127.0.0.1:PORT")
+    parser.add_argument("--record", metavar="FILENAME", help="record reactor transients to Data_Storage/FILENAME (fnc_comb.load_trajectory)")
+    args = parser.parse_args()
+    if args.classify:
+        # classify_ignition has no result cache or trajectory recorder, and the screen only applies to full solves
+        unsupported = [flag for flag, used in (("--cache", args.cache), ("--record", args.record is not None),
+                                               ("--screen", args.screen)) if used]
+        if args.sweep is None:
+            parser.error("--classify needs --sweep FILENAME")
+        if unsupported:
+            parser.error(f"--classify does not support {', '.join(unsupported)}")
+
+    print(f"Starting code...")
+    diffuser1 = default_diffuser()
+    model_kwargs = {"solver": args.solver}
+    if args.outlet_coupling != "valve":
+        model_kwargs["outlet_coupling"] = args.outlet_coupling # default left out so existing cache keys still match
+    recorder = None
+    if args.record is not None:
+        recorder = TrajectoryRecorder(os.path.join(data_dir, args.record))
+        model_kwargs["recorder"] = recorder
+    if args.cache:
+        model_kwargs["cache"] = ResultCache(max_mb=args.cache_mb)
+
+    if args.sweep is None:
+        # Single run
+        combustor1 = CombustorCfg(
+            fuel_comp="C3H8:1",
+            PR_b=0.95,
+            n_b=0.98,
+            primary_equivRatio=0.5,
+            volume_b=0.0207*args.recirc_factor,
+            f_primary=0.3,
+            v_frac_primary=0.6
+        )
+        run_single(diffuser1, combustor1, **model_kwargs)
+    elif args.classify:
+        run_classify_sweep(args.sweep, diffuser1,
+                           np.linspace(0.05, 0.95, args.n),
+                           np.linspace(0.05, 0.95, args.n),
+                           np.linspace(0.001, 0.08, args.n2),
+                           args.recirc_factor, processes=args.processes, max_rss_mb=args.max_rss_mb,
+                           max_tasks_per_worker=args.max_tasks_per_worker, timeout_s=args.timeout_s,
+                           http_port=args.http_port, solver=args.solver, outlet_coupling=args.outlet_coupling,
+                           T_ignite=args.T_ignite, fuel_max=args.fuel_max)
+    else:
+        run_sweep(args.sweep, diffuser1,
+                  np.linspace(0.05, 0.95, args.n),
+                  np.linspace(0.05, 0.95, args.n),
+                  np.linspace(0.001, 0.08, args.n2),
+                  args.recirc_factor, processes=args.processes, max_rss_mb=args.max_rss_mb,
+                  max_tasks_per_worker=args.max_tasks_per_worker, timeout_s=args.timeout_s,
+                  http_port=args.http_port, screen=args.screen, T_ignite=args.T_ignite, fuel_max=args.fuel_max,
+                  **model_kwargs)
+
+    if recorder is not None:
+        recorder.close()
@@ -0,0 +1,58 @@
+# Engine configuration objects
+from dataclasses import dataclass
+
+
+
+@dataclass
+class DiffuserCfg:
+    A_diff_in: float
+    A_diff_out: float
+    diff_eta_i: float
+
+@dataclass
+class CombustorCfg:
+    fuel_comp: str
+    PR_b: float
+    n_b: float
+    primary_equivRatio: float  
+    volume_b: float
+    f_primary: float # Fraction of primary air mass flow in chamber
+    v_frac_primary: float # Fraction of primary air volume of total chamber volume
+
+# temporary - value from matlab of compressor outlet
+class Engine():
+    def __init__(
+        self,
+        T_t3: float,
+        P_t3: float,
+        m_dot_air: float,
+
+        diffuser: DiffuserCfg,
+        combustor: CombustorCfg,
+    ):
+        self.T_t3 = T_t3
+        self.P_t3 = P_t3
+        self.m_dot_air = m_dot_air
+
+        self.diffuser = diffuser
+        self.combustor = combustor
+
+        # Can just set gas object meches here since all the same for now, and props assigned in fncs
+        # Mechanism loaded on first use, not on construction
+        self.mech = "gri30.yaml"
+        self._diff_gas_in = None
+        self._diff_gas_out = None
+
+    @property
+    def diff_gas_in(self):
+        if self._diff_gas_in is None:
+            import cantera as ct
+            self._diff_gas_in = ct.Solution(self.mech)
+        return self._diff_gas_in
+
+    @property
+    def diff_gas_out(self):
+        if self._diff_gas_out is None:
+            import cantera as ct
+            self._diff_gas_out = ct.Solution(self.mech)
+        return self._diff_gas_out
@@ -0,0 +1,164 @@
+# Engine cycle as a graph of stages (compressor -> diffuser -> combustor -> turbine)
+import copy
+from collections import OrderedDict
+from dataclasses import is_dataclass, astuple
+
+from engine_cfg import Engine
+from combustor_main import run_diffuser
+from fnc_comb import DEFAULT_MODEL, run_combustor_model, classify_ignition
+
+
+def _freeze(value):
+    # Turn a stage input into something hashable for the cache key
+    if is_dataclass(value):
+        return (type(value).__name__,) + astuple(value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class Stage():
+    """
+    One stage of the cycle. Declares its own inputs (names of cycle params) and the upstream stages
+    it reads from. Outputs are cached keyed by the inputs + upstream keys, so a stage only re-runs
+    when something it actually depends on changes.
+    """
+    def __init__(self, name, fnc, inputs=(), upstream=(), max_cache=128):
+        self.name = name
+        self.fnc = fnc # fnc(params, upstream_outputs) -> output
+        self.inputs = tuple(inputs)
+        self.upstream = tuple(upstream)
+        self.max_cache = max_cache # LRU bound, gas objects aren't small so don't keep a whole sweep
+
+        self.cache = OrderedDict()
+        self.n_runs = 0
+        self.n_hits = 0
+
+    def key(self, params, upstream_keys):
+        return (tuple(_freeze(params[name]) for name in self.inputs),
+                tuple(upstream_keys[name] for name in self.upstream))
+
+    def run(self, params, upstream_keys, upstream_outputs):
+        key = self.key(params, upstream_keys)
+        if key in self.cache:
+            self.n_hits += 1
+            self.cache.move_to_end(key)
+            return key, self.cache[key]
+
+        out = self.fnc({name: params[name] for name in self.inputs},
+                       {name: upstream_outputs[name] for name in self.upstream})
+        self.n_runs += 1
+        self.cache[key] = out
+        if len(self.cache) > self.max_cache:
+            self.cache.popitem(last=False)
+        return key, out
+
+
+class EngineCycle():
+    """
+    Ordered collection of stages, stages must be added after the stages they read from.
+    """
+    def __init__(self):
+        self.stages = OrderedDict()
+
+    def add_stage(self, stage):
+        for up in stage.upstream:
+            if up not in self.stages:
+                raise ValueError(f"Stage '{stage.name}' reads from '{up}' which has not been added yet.")
+        self.stages[stage.name] = stage
+        return stage
+
+    def run(self, **params):
+        # Walk stages in order, each returns (key, output); only stages with new keys do any work
+        keys = {}
+        outputs = {}
+        for name, stage in self.stages.items():
+            missing = [p for p in stage.inputs if p not in params]
+            if missing:
+                raise KeyError(f"Stage '{name}' missing inputs: {missing}")
+            keys[name], outputs[name] = stage.run(params, keys, outputs)
+        return outputs
+
+    def stats(self):
+        return {name: {"runs": s.n_runs, "hits": s.n_hits} for name, s in self.stages.items()}
+
+    def clear(self):
+        for stage in self.stages.values():
+            stage.cache.clear()
+
+
+### Default stage functions ###
+def compressor_stage(params, upstream):
+    """
+    Compressor still to be converted from matlab, for now the throttle setting is the compressor
+    outlet (T_t3, P_t3, m_dot_air) passed straight through
+    """
+    return {"T_t3": params["T_t3"], "P_t3": params["P_t3"], "m_dot_air": params["m_dot_air"]}
+
+def diffuser_stage(params, upstream):
+    comp = upstream["compressor"]
+    # Fresh engine (and gas objects) per run so cached outputs never get overwritten by a later run
+    eng = Engine(T_t3=comp["T_t3"], P_t3=comp["P_t3"], m_dot_air=comp["m_dot_air"],
+                 diffuser=params["diffuser"], combustor=None)
+    M_out, converged, diff_gas_out, diff_mdot_out = run_diffuser(eng)
+    return {"eng": eng, "M_out": M_out, "converged": converged,
+            "gas_out": diff_gas_out, "mdot_out": diff_mdot_out}
+
+def make_combustor_stage(model=DEFAULT_MODEL, **model_kwargs):
+    def combustor_stage(params, upstream):
+        diff = upstream["diffuser"]
+        if not diff["converged"]:
+            return None, None
+        # Shallow copy, combustor only reads the diffuser side of the engine
+        eng = copy.copy(diff["eng"])
+        eng.combustor = params["combustor"]
+        return run_combustor_model(model, eng, diff["gas_out"], diff["mdot_out"], **model_kwargs)
+    return combustor_stage
+
+def make_classify_stage(**classify_kwargs):
+    # Ignition classification only (fnc_comb.classify_ignition), no outlet gas objects
+    def classify_stage(params, upstream):
+        diff = upstream["diffuser"]
+        if not diff["converged"]:
+            return None
+        eng = copy.copy(diff["eng"])
+        eng.combustor = params["combustor"]
+        return classify_ignition(eng, diff["gas_out"], diff["mdot_out"], **classify_kwargs)
+    return classify_stage
+
+def turbine_stage(params, upstream):
+    """
+    Turbine still to be converted from matlab, for now just hands back the turbine inlet state
+    (combustor secondary/ dilution zone outlet)
+    """
+    primary_gas_out, secondary_gas_out = upstream["combustor"]
+    if secondary_gas_out is None:
+        return None
+    return {"T_t4": secondary_gas_out.T, "P_t4": secondary_gas_out.P, "gas_in": secondary_gas_out}
+
+
+def build_engine_cycle(max_cache=128, model=DEFAULT_MODEL, **model_kwargs):
+    """
+    Default cycle. Inputs to cycle.run(): T_t3, P_t3, m_dot_air (throttle), diffuser, combustor
+    model: name of combustor model in fnc_comb.COMBUSTOR_MODELS, model_kwargs passed to it (ex: solver="sparse")
+    """
+    cycle = EngineCycle()
+    cycle.add_stage(Stage("compressor", compressor_stage, inputs=("T_t3", "P_t3", "m_dot_air"), max_cache=max_cache))
+    cycle.add_stage(Stage("diffuser", diffuser_stage, inputs=("diffuser",), upstream=("compressor",), max_cache=max_cache))
+    cycle.add_stage(Stage("combustor", make_combustor_stage(model, **model_kwargs), inputs=("combustor",), upstream=("diffuser",), max_cache=max_cache))
+    cycle.add_stage(Stage("turbine", turbine_stage, upstream=("combustor",), max_cache=max_cache))
+    return cycle
+
+
+def build_classify_cycle(max_cache=128, **classify_kwargs):
+    """
+    Compressor -> diffuser -> classify, for envelope sweeps that only need ignited/ not ignited
+    classify_kwargs passed to fnc_comb.classify_ignition (ex: T_ignite, fuel_max, solver)
+    """
+    cycle = EngineCycle()
+    cycle.add_stage(Stage("compressor", compressor_stage, inputs=("T_t3", "P_t3", "m_dot_air"), max_cache=max_cache))
+    cycle.add_stage(Stage("diffuser", diffuser_stage, inputs=("diffuser",), upstream=("compressor",), max_cache=max_cache))
+    cycle.add_stage(Stage("classify", make_classify_stage(**classify_kwargs), inputs=("combustor",), upstream=("diffuser",), max_cache=max_cache))
+    return cycle
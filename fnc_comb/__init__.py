@@ -9,4 +9,11 @@
 from .iterate_diffuser import iterate_diffuser
 from .single_flow_combustion import single_flow_combustion
 from .multi_flow_recirculation_combustion import multi_flow_recirculation_combustion
-from .multi_flow_recirculation_secondary_comb_combustion import multi_flow_recirculation_secondary_comb_combustion
\ No newline at end of file
+from .multi_flow_recirculation_secondary_comb_combustion import multi_flow_recirculation_secondary_comb_combustion
+from .n_zone_combustion import n_zone_combustion, n_zone_layout, NZoneNetwork, ZoneCfg, RecircCfg
+from .recirculation_network import RecirculationNetwork, get_recirculation_network, count_fallbacks
+from .outlet_coupling import OutletCoupling, OUTLET_COUPLINGS
+from .combustor_models import COMBUSTOR_MODELS, DEFAULT_MODEL, register_combustor_model, run_combustor_model
+from .trajectory_recorder import TrajectoryRecorder, load_trajectory, advance_to_steady_state_recorded, advance_recorded
+from .ignition_classifier import classify_ignition, classify_network, ignition_score, IgnitionResult
+from .screen_ignition import screen_point, calibrate_screen, screen_error_rates, ScreenResult
@@ -0,0 +1,39 @@
+
+from .help_fnc import *
+from .single_flow_combustion import single_flow_combustion
+from .multi_flow_recirculation_combustion import multi_flow_recirculation_combustion
+from .multi_flow_recirculation_secondary_comb_combustion import multi_flow_recirculation_secondary_comb_combustion
+from .n_zone_combustion import n_zone_combustion
+
+
+"""
+Registry of combustor models, all called the same way:
+    fnc(eng, diff_gas_out, diff_mdot_out, inlet=None, **kwargs) -> (primary_gas_out, secondary_gas_out)
+Single zone models return one gas, which is used for both primary and secondary outlet.
+"""
+COMBUSTOR_MODELS = {}
+_SINGLE_OUTLET = set()
+
+def register_combustor_model(name, fnc, single_outlet=False):
+    COMBUSTOR_MODELS[name] = fnc
+    if single_outlet:
+        _SINGLE_OUTLET.add(name)
+    else:
+        _SINGLE_OUTLET.discard(name)
+
+register_combustor_model("single_flow", single_flow_combustion, single_outlet=True)
+register_combustor_model("multi_flow_recirculation", multi_flow_recirculation_combustion)
+register_combustor_model("multi_flow_recirculation_secondary_comb", multi_flow_recirculation_secondary_comb_combustion)
+register_combustor_model("n_zone", n_zone_combustion)
+
+DEFAULT_MODEL = "multi_flow_recirculation"
+
+
+def run_combustor_model(name, eng, diff_gas_out, diff_mdot_out, inlet=None, **kwargs):
+    if name not in COMBUSTOR_MODELS:
+        raise KeyError(f"Unknown combustor model '{name}', options: {list(COMBUSTOR_MODELS)}")
+
+    out = COMBUSTOR_MODELS[name](eng, diff_gas_out, diff_mdot_out, inlet=inlet, **kwargs)
+    if name in _SINGLE_OUTLET:
+        return out, out
+    return out
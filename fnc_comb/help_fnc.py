@@ -1,6 +1,11 @@
 import cantera as ct
 import numpy as np
 
+
+# Integrator failures of a steady state solve (catch these, not Exception)
+# cantera 3.2 raises NameError instead of CanteraError at max steps
+SOLVE_ERRORS = (ct.CanteraError, NameError)
+
 # Fuel mass flow calc function
 def calc_fuel_mdot(m_dot_air, equivRatio):
     """
@@ -30,6 +35,13 @@ def calc_fuel_mdot(m_dot_air, equivRatio):
     return m_dot_fuel
 
 
+def check_precon_threshold(precon_threshold):
+    # AdaptivePreconditioner.threshold segfaults on the pinned cantera 3.2, only cantera's default drop tolerance for now
+    if precon_threshold is not None:
+        raise ValueError("precon_threshold isn't supported (setting the preconditioner threshold crashes cantera 3.2), "
+                         "leave it None to use cantera's default")
+
+
 # Getter functions
 def get_gamma(gas: ct.Solution) -> float:
     # gamma = cp/cv
@@ -51,3 +63,54 @@ def get_T(t_static: float, gamma: float, mach: float) -> float:
     # stagnation temperature for isentropic process
     return t_static * (1 + ((gamma - 1) / 2) * mach**2)
 
+
+
+# Inlet state shared by all combustor models (computed once per point, diffuser outlet -> combustor inlet)
+# Models take it as inlet=, compare_models/ throttle_schedule hand one InletState to several models/ designs
+class InletState():
+    def __init__(self, eng, diff_gas_out, diff_mdot_out, mech="gri30.yaml"):
+        self.T_t3 = diff_gas_out.T
+        self.P_t3 = diff_gas_out.P
+        # Calcuate P_t4 using estimated combustor pressure ratio
+        self.P_t4 = self.P_t3 * eng.combustor.PR_b
+        self.m_dot_air = diff_mdot_out
+        # Fuel set by the primary air (f_primary) at primary_equivRatio, every model burns this same fuel flow so
+        # compared models are at the same design point
+        self.m_dot_fuel = calc_fuel_mdot(eng.combustor.f_primary * self.m_dot_air, eng.combustor.primary_equivRatio)
+
+        # Compositions
+        self.air_X = "O2:0.21, N2:0.79" # air same comp always for these models
+        self.fuel_X = eng.combustor.fuel_comp
+
+        # Inlet gas states, models use these for upstream reservoirs (reservoirs don't change them)
+        # Only built on first use, reused network model keeps its own
+        self.mech = mech
+        self._gas_air = None
+        self._gas_fuel = None
+
+    def two_zone_split(self, combustor):
+        """
+        Primary/ secondary split of the two zone models (multi_flow_recirculation*, classify_ignition, screen_point):
+        air by f_primary (secondary air is cooling/ dilution air, all fuel into the primary), volume by
+        v_frac_primary (see sketch diagram, mass flow set by the air split, volume by the geometry)
+        Returns (m_dot_air_primary, m_dot_fuel, m_dot_air_secondary, v_primary, v_secondary)
+        """
+        m_dot_air_primary = combustor.f_primary * self.m_dot_air
+        m_dot_air_secondary = (1-combustor.f_primary) * self.m_dot_air
+        v_primary = combustor.v_frac_primary * combustor.volume_b
+        v_secondary = (1-combustor.v_frac_primary) * combustor.volume_b
+        return m_dot_air_primary, self.m_dot_fuel, m_dot_air_secondary, v_primary, v_secondary
+
+    @property
+    def gas_air(self):
+        if self._gas_air is None:
+            self._gas_air = ct.Solution(self.mech)
+            self._gas_air.TPX = self.T_t3, self.P_t4, self.air_X
+        return self._gas_air
+
+    @property
+    def gas_fuel(self):
+        if self._gas_fuel is None:
+            self._gas_fuel = ct.Solution(self.mech)
+            self._gas_fuel.TPX = self.T_t3, self.P_t4, self.fuel_X
+        return self._gas_fuel
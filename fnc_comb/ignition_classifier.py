@@ -0,0 +1,122 @@
+
+import cantera as ct
+import numpy as np
+from dataclasses import dataclass
+from .help_fnc import *
+from .recirculation_network import RecirculationNetwork, get_recirculation_network
+
+
+@dataclass
+class IgnitionResult:
+    ignited: bool
+    margin: float # distance from the ignition boundary, see ignition_score
+    decided: str # "ignited"/ "extinguished" (stopped early) or "steady" (ran to steady state)
+    t: float # network time when decided [s]
+    t_over_tau: float # same in primary residence times
+    primary_state: tuple # (T, P, Y) when decided (partial, not converged when stopped early)
+    secondary_state: tuple
+
+
+def ignition_score(T, X_fuel, T_ignite=1000.0, fuel_max=1e-3):
+    """
+    Signed distance from the plot_util ignition criteria (T >= T_ignite and fuel <= fuel_max):
+    min(relative T above T_ignite, decades of fuel below fuel_max), >= 0 means ignited, |score| = confidence margin
+    """
+    T_rel = (T - T_ignite) / T_ignite
+    fuel_dec = np.log10(fuel_max / max(X_fuel, 1e-300))
+    return min(T_rel, fuel_dec)
+
+
+def classify_network(network, reactor, tau, fuel_index, T_ignite=1000.0, fuel_max=1e-3, T_margin=0.2,
+                     fuel_margin=0.1, dT_rel=0.02, n_hold=2, check_every=0.5, t_max=30.0):
+    """
+    Steps network in check_every*tau increments and stops once the decision on `reactor` is settled for n_hold checks:
+        ignited: T >= (1 + T_margin) T_ignite, X_fuel <= fuel_margin fuel_max and T changing < dT_rel per check
+        extinguished: T <= (1 - T_margin) T_ignite, X_fuel >= fuel_max/ fuel_margin and T not rising
+    Undecided after t_max*tau -> runs on to steady state (same answer as the full solve)
+    Returns (decided, t)
+    """
+    T_prev = reactor.T
+    n_ign = 0
+    n_ext = 0
+    n_checks = int(np.ceil(t_max / check_every))
+    for k in range(1, n_checks + 1):
+        network.advance(network.time + check_every * tau)
+        T = reactor.T
+        X_fuel = reactor.thermo.X[fuel_index]
+
+        hot = T >= (1 + T_margin) * T_ignite and X_fuel <= fuel_margin * fuel_max and abs(T - T_prev) <= dT_rel * T_prev
+        cold = T <= (1 - T_margin) * T_ignite and X_fuel >= fuel_max / fuel_margin and T <= T_prev
+        n_ign = n_ign + 1 if hot else 0
+        n_ext = n_ext + 1 if cold else 0
+        T_prev = T
+        if n_ign >= n_hold:
+            return "ignited", network.time
+        if n_ext >= n_hold:
+            return "extinguished", network.time
+
+    network.advance_to_steady_state()
+    return "steady", network.time
+
+
+def classify_ignition(eng, diff_gas_out, diff_mdot_out, inlet=None, reuse_network=True, solver="dense",
+                      precon_threshold=None, valve_coeff=1e-4, outlet_coupling="valve", pressure_coeff=1e-2,
+                      T_ignite=1000.0, fuel_max=1e-3, rtol=1e-5, atol=1e-12, **criteria):
+    """
+    Fast mode of multi_flow_recirculation_combustion for envelope studies: only decides whether the primary zone
+    ignites, stopping the integration as soon as that's settled instead of running to steady state
+    rtol/ atol: integrator tolerances while classifying, the decision doesn't need the default 1e-9 (about 2.5x fewer
+    steps through ignition, T history same to ~1 K), network tolerances are put back afterwards
+    criteria: T_margin, fuel_margin, dT_rel, n_hold, check_every, t_max (see classify_network)
+    Returns IgnitionResult
+    """
+    if inlet is None:
+        inlet = InletState(eng, diff_gas_out, diff_mdot_out)
+
+    m_dot_air_primary, m_dot_fuel, m_dot_air_secondary, v_primary, v_secondary = inlet.two_zone_split(eng.combustor)
+
+    if reuse_network:
+        net = get_recirculation_network(inlet.mech, solver, precon_threshold, outlet_coupling)
+    else:
+        net = RecirculationNetwork(inlet.mech, solver, precon_threshold, outlet_coupling)
+    tols = {}
+    _set_tolerances(net, rtol, atol, tols)
+    net.update(inlet.T_t3, inlet.P_t4, inlet.air_X, inlet.fuel_X, eng.combustor.primary_equivRatio,
+               v_primary, v_secondary, m_dot_air_primary, m_dot_fuel, m_dot_air_secondary, valve_coeff=valve_coeff,
+               pressure_coeff=pressure_coeff)
+
+    # Primary zone residence time sets the check interval
+    tau1 = net.r1.density * net.r1.volume / (m_dot_air_primary + m_dot_fuel)
+    fuel = inlet.fuel_X.split(":")[0]
+    i_fuel = net.gas_init_primary.species_index(fuel)
+    try:
+        decided, t = classify_network(net.network, net.r1, tau1, i_fuel, T_ignite, fuel_max, **criteria)
+    except SOLVE_ERRORS:
+        if solver != "sparse":
+            raise
+        # Same fallback as RecirculationNetwork.solve
+        net.n_fallbacks += 1
+        dense = get_recirculation_network(inlet.mech, "dense", outlet_coupling=outlet_coupling)
+        _set_tolerances(dense, rtol, atol, tols)
+        dense.update(*net._last_update)
+        net = dense
+        decided, t = classify_network(net.network, net.r1, tau1, i_fuel, T_ignite, fuel_max, **criteria)
+    finally:
+        # Applied at the next update() (reinitialize)
+        for n, (rtol0, atol0) in tols.items():
+            n.network.rtol, n.network.atol = rtol0, atol0
+
+    # Plain arrays instead of new Solution objects (building those costs more than the early stop saves)
+    primary_state = (net.r1.T, net.r1.thermo.P, net.r1.thermo.Y.copy())
+    secondary_state = (net.r2.T, net.r2.thermo.P, net.r2.thermo.Y.copy())
+    score = ignition_score(net.r1.T, net.r1.thermo.X[i_fuel], T_ignite, fuel_max)
+    return IgnitionResult(ignited=score >= 0, margin=abs(score), decided=decided, t=t, t_over_tau=t / tau1,
+                          primary_state=primary_state, secondary_state=secondary_state)
+
+
+def _set_tolerances(net, rtol, atol, tols):
+    # Keep the network's own tolerances in tols to restore later
+    if net not in tols:
+        tols[net] = (net.network.rtol, net.network.atol)
+    net.network.rtol = rtol
+    net.network.atol = atol
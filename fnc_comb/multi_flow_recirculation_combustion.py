@@ -2,150 +2,74 @@
 import cantera as ct
 import numpy as np
 from .help_fnc import *
+from .recirculation_network import RecirculationNetwork, get_recirculation_network
 
-def multi_flow_recirculation_combustion(eng, diff_gas_out, diff_mdot_out):
+def multi_flow_recirculation_combustion(eng, diff_gas_out, diff_mdot_out, inlet=None, reuse_network=True,
+                                        solver="dense", precon_threshold=None, recorder=None, valve_coeff=1e-4,
+                                        outlet_coupling="valve", pressure_coeff=1e-2):
+
+    if inlet is None:
+        inlet = InletState(eng, diff_gas_out, diff_mdot_out)
 
     # Set variables
-    T_t3 = diff_gas_out.T
-    P_t3 = diff_gas_out.P
+    T_t3 = inlet.T_t3
+    P_t4 = inlet.P_t4
     print(T_t3)
-    print(P_t3)
-    volume_b = eng.combustor.volume_b
-    f_primary = eng.combustor.f_primary
+    print(inlet.P_t3)
     v_frac_primary = eng.combustor.v_frac_primary
-    m_dot_air_total = diff_mdot_out
-
-    # Calcuate P_t4 using estimated combustor pressure ratio
-    P_t4 = P_t3 * eng.combustor.PR_b
+    m_dot_air_total = inlet.m_dot_air
 
-    # Split air, fraction can be dictated by geometry of chamber
-    """
-    fnc uses secondary air as cooling air, so set m_dot_fuel using primary air fraction
-    """
-    m_dot_air_primary = f_primary * m_dot_air_total
-    m_dot_fuel = calc_fuel_mdot(m_dot_air_primary, eng.combustor.primary_equivRatio)
+    # Split air and volume, fraction can be dictated by geometry of chamber (see InletState.two_zone_split)
+    m_dot_air_primary, m_dot_fuel, m_dot_air_secondary, v_primary, v_secondary = inlet.two_zone_split(eng.combustor)
     # print(m_dot_fuel)
     # print(m_dot_air_total)
-    m_dot_air_secondary = (1-f_primary) * m_dot_air_total
-
-    # Split volume
-    """
-    See sketch diagram, mass flow set by initial split of air, volume then set by following geom.
-    """
-    v_primary = v_frac_primary * volume_b
-    v_secondary = (1-v_frac_primary) * volume_b
 
 
     ### Cantera
     # Set up
-    mech = "gri30.yaml"
-    gas_air  = ct.Solution(mech)
-    gas_fuel = ct.Solution(mech)
-    gas_init_primary = ct.Solution(mech)  # separate object for the reactor initial state
-    gas_init_secondary = ct.Solution(mech)
+    mech = inlet.mech
 
     # Compositions
-    air_X  = "O2:0.21, N2:0.79" # air same comp always for this model
-    fuel_X = eng.combustor.fuel_comp
-
-    # Set inlet states
-    gas_air.TPX  = T_t3, P_t4, air_X
-    gas_fuel.TPX = T_t3, P_t4, fuel_X
-    gas_init_secondary.TPX = T_t3, P_t4, air_X
-    # """
-    # Setting temp 1200 to help solver converge, set equivalent ratio as 
-    # """
-    # gas_init_primary.TP = 1200.0, P_t4
-    # gas_init_primary.set_equivalence_ratio(eng.combustor.primary_equivRatio, fuel=fuel_X, oxidizer=air_X)
-
+    air_X  = inlet.air_X # air same comp always for this model
+    fuel_X = inlet.fuel_X
 
     """
+    Network (reservoirs, r1, r2, mfcs, valves) is built once per process and mutated in place for each point,
+    reuse_network=False builds a fresh one (old behavior)
+    solver="sparse" swaps to mole reactors + adaptive preconditioner (see benchmarks/bench_sparse_two_zone.py)
+    recorder: optional TrajectoryRecorder, records T, P, species history of r1/ r2 while solving
+    valve_coeff: r1 -> r2 and outlet valve coefficients
+    outlet_coupling="pressure" swaps the valves for pressure controllers holding P_t4 with outflow = inflow,
+    pressure_coeff their gain [kg/s/Pa] (see outlet_coupling.py, benchmarks/bench_outlet_coupling.py),
+    converged mass balance left in net.last_residual
     Seeding small fraction of hot equilibrium products into primary reactor to model spark
     https://groups.google.com/g/cantera-users/c/x03SbuksnCI?utm_source=chatgpt.com
     https://cantera.org/stable/examples/python/reactors/fuel_injection.html
     """
-    # Initial conditions reactant (at diffuser outlet values)
-    gas_react = ct.Solution(mech)
-    gas_react.TP = T_t3, P_t4
-    gas_react.set_equivalence_ratio(eng.combustor.primary_equivRatio, fuel=fuel_X, oxidizer=air_X)
-    # Seed reactant (equlibriated/ hot)
-    gas_prod = ct.Solution(mech)
-    gas_prod.TP = 2000, P_t4
-    gas_prod.set_equivalence_ratio(eng.combustor.primary_equivRatio, fuel=fuel_X, oxidizer=air_X)
-    gas_prod.equilibrate('HP')
-    # Mix small amount of prod into react
-    perc_seed = 0.1
-    Y_seed = (1 - perc_seed) * gas_react.Y + perc_seed * gas_prod.Y
-    # Initialize primary reactor
-    gas_init_primary.TPY = 1200, P_t4, Y_seed
-
-
-    # Reservoirs
-    upstream_air = ct.Reservoir(gas_air)
-    upstream_fuel = ct.Reservoir(gas_fuel)
-    downstream = ct.Reservoir(gas_init_secondary) # "sink" reservoir; state doesn't feed back, can just use init secondary object
-
-
-
-    ##### Primary reactor #####
-    r1 = ct.IdealGasReactor(gas_init_primary) # initialized with gas_init
-    r1.volume = v_primary
-    r1.energy_enabled = True # ensure energy is on
-
-    # Primary reactor mass flow controllers (fuel only into primary zone)
-    mfc_air1  = ct.MassFlowController(upstream_air, r1)
-    mfc_fuel = ct.MassFlowController(upstream_fuel, r1)
-    mfc_air1.mass_flow_rate  = m_dot_air_primary
-    mfc_fuel.mass_flow_rate = m_dot_fuel
-
-
-    ##### Secondary reactor (cooling secondary air) #####
-    r2 = ct.IdealGasReactor(gas_init_secondary) # initialized with gas_init
-    r2.volume = v_secondary
-    r2.energy_enabled = True # ensure energy is on
-    r2.chemistry_enabled = False # used to cool air, representing dilution/mixing without resolved/full chemistry
-
-    # Secondary reactor flow from primary reactor, pressure valve
-    valve12 = ct.Valve(r1, r2)
-    valve12.valve_coeff = 1e-4
-
-    # Secondary reactor mass flow controller from upstream air
-    mfc_air2  = ct.MassFlowController(upstream_air, r2)
-    mfc_air2.mass_flow_rate  = m_dot_air_secondary
-
-
-    # Valve from r2 to downstream, pressure valve
+    if reuse_network:
+        net = get_recirculation_network(mech, solver, precon_threshold, outlet_coupling)
+    else:
+        net = RecirculationNetwork(mech, solver, precon_threshold, outlet_coupling)
+    net.update(T_t3, P_t4, air_X, fuel_X, eng.combustor.primary_equivRatio,
+               v_primary, v_secondary, m_dot_air_primary, m_dot_fuel, m_dot_air_secondary, valve_coeff=valve_coeff,
+               pressure_coeff=pressure_coeff)
     # see sketch in notebook if forget set up flow
-    v = ct.Valve(r2, downstream)
-    v.valve_coeff = 1e-4
-    # mfc_out = ct.MassFlowController(r2, downstream)
-    # mfc_out.mass_flow_rate =  m_dot_air_primary+m_dot_fuel+m_dot_air_secondary
-
-    # Reactor network and set times
-    network = ct.ReactorNet([r1, r2])
-    t = 0.0
-    dt = 1e-6
 
     # Find primary zone tau
-    rho1 = r1.density
-    vol1 = r1.volume
+    rho1 = net.r1.density
+    vol1 = net.r1.volume
     tau1  = rho1 * vol1 / (m_dot_air_primary + m_dot_fuel)
     # Find seconary zone tau
-    rho2 = r2.density
-    vol2 = r2.volume
+    rho2 = net.r2.density
+    vol2 = net.r2.volume
     tau2 = rho2 * vol2 / (m_dot_air_total + m_dot_fuel)
 
     # Utilize slowest time / max tau to ensure network fully settles
     # t_end = 20.0 * max(tau1, tau2)
     # network.advance(t_end)  # advance(network, t_end)
 
-    network.advance_to_steady_state()
-
     # Set gas_out properties, exporting mass fractions Y, T, P
-    primary_gas_out = ct.Solution(mech)
-    primary_gas_out.TPY = r1.T, r1.thermo.P, r1.thermo.Y
-    secondary_gas_out = ct.Solution(mech)
-    secondary_gas_out.TPY = r2.T, r2.thermo.P, r2.thermo.Y
+    primary_gas_out, secondary_gas_out = net.solve(recorder)
 
     ### Total pressures and temps
     v_in = (m_dot_air_primary+m_dot_fuel) / (primary_gas_out.density * eng.diffuser.A_diff_out * v_frac_primary)
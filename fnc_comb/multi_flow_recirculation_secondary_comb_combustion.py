@@ -2,51 +2,42 @@
 import cantera as ct
 import numpy as np
 from .help_fnc import *
+from .outlet_coupling import OutletCoupling
 
-def multi_flow_recirculation_secondary_comb_combustion(eng, diff_gas_out, diff_mdot_out):
+def multi_flow_recirculation_secondary_comb_combustion(eng, diff_gas_out, diff_mdot_out, inlet=None, valve_coeff=1e-4,
+                                                       outlet_coupling="valve", pressure_coeff=1e-2, return_residual=False):
+    # outlet_coupling/ pressure_coeff: valves or pressure controllers between zones (see outlet_coupling.py)
+    # return_residual=True also returns the converged mass balance (OutletCoupling.residual)
 
-    # Set variables
-    T_t3 = diff_gas_out.T
-    P_t3 = diff_gas_out.P
-    volume_b = eng.combustor.volume_b
-    f_primary = eng.combustor.f_primary
-    v_frac_primary = eng.combustor.v_frac_primary
 
+    if inlet is None:
+        inlet = InletState(eng, diff_gas_out, diff_mdot_out)
 
-    # Calcuate P_t4 using estimated combustor pressure ratio
-    P_t4 = P_t3 * eng.combustor.PR_b
+    # Set variables
+    T_t3 = inlet.T_t3
+    P_t4 = inlet.P_t4
     
     # Total mass flows
-    m_dot_air_total = diff_mdot_out
-    m_dot_fuel = calc_fuel_mdot(m_dot_air_total, eng.combustor.equivRatio)
-    # print(f"eng.combustor.equivRatio = {eng.combustor.equivRatio}")
-
-    # Split air, fraction can be dictated by geometry of chamber
-    m_dot_air_primary = f_primary * m_dot_air_total
-    m_dot_air_secondary = (1-f_primary) * m_dot_air_total
+    m_dot_air_total = inlet.m_dot_air
+    # print(f"eng.combustor.primary_equivRatio = {eng.combustor.primary_equivRatio}")
 
-    # Split volume
-    v_primary = v_frac_primary * volume_b
-    v_secondary = (1-v_frac_primary) * volume_b
+    # Split air and volume, same as multi_flow_recirculation_combustion
+    m_dot_air_primary, m_dot_fuel, m_dot_air_secondary, v_primary, v_secondary = inlet.two_zone_split(eng.combustor)
 
 
     ### Cantera
     # Set up
-    mech = "gri30.yaml"
-    gas_air  = ct.Solution(mech)
-    gas_fuel = ct.Solution(mech)
+    mech = inlet.mech
+    gas_air  = inlet.gas_air
+    gas_fuel = inlet.gas_fuel
     gas_init = ct.Solution(mech)  # separate object for the reactor initial state
 
     # Compositions
-    air_X  = "O2:0.21, N2:0.79" # air same comp always for this model
-    fuel_X = eng.combustor.fuel_comp
-
-    # Set inlet states
-    gas_air.TPX  = T_t3, P_t4, air_X
-    gas_fuel.TPX = T_t3, P_t4, fuel_X
+    air_X  = inlet.air_X # air same comp always for this model
+    fuel_X = inlet.fuel_X
 
     gas_init.TP = 1200.0, P_t4 # 1200 guess to help solver converge
-    gas_init.set_equivalence_ratio(eng.combustor.equivRatio, fuel=fuel_X, oxidizer=air_X)
+    gas_init.set_equivalence_ratio(eng.combustor.primary_equivRatio, fuel=fuel_X, oxidizer=air_X)
 
     # Reservoirs
     upstream_air = ct.Reservoir(gas_air)
@@ -73,19 +64,16 @@ def multi_flow_recirculation_secondary_comb_combustion(eng, diff_gas_out, diff_m
     r2.energy_enabled = True # ensure energy is on
     r2.chemistry_enabled = False # used to cool air, representing dilution/mixing without resolved/full chemistry
 
-    # Secondary reactor flow from primary reactor, pressure valve
-    valve12 = ct.Valve(r1, r2)
-    valve12.valve_coeff = 1e-4
-
     # Secondary reactor mass flow controller from upstream air
     mfc_air2  = ct.MassFlowController(upstream_air, r2)
     mfc_air2.mass_flow_rate  = m_dot_air_secondary
 
 
-    # Valve from r2 to downstream, pressure valve
+    # r1 -> r2 and r2 -> downstream, pressure valves (or pressure controllers)
     # see sketch in notebook if forget set up flow
-    v = ct.Valve(r2, downstream)
-    v.valve_coeff = 1e-4
+    coupling = OutletCoupling(outlet_coupling, r1, r2, downstream, upstream_air)
+    coupling.set_flows(m_dot_air_primary + m_dot_fuel, m_dot_air_secondary, valve_coeff, pressure_coeff)
+    v = coupling.dev_out
     # mfc_out = ct.MassFlowController(r2, downstream)
     # mfc_out.mass_flow_rate =  m_dot_air_primary+m_dot_fuel+m_dot_air_secondary
 
@@ -147,4 +135,6 @@ def multi_flow_recirculation_secondary_comb_combustion(eng, diff_gas_out, diff_m
     # print(f"  O2   = {X[iO2]:.6e}")
     # print(f"  C3H8 = {X[ifuel]:.6e}")
 
+    if return_residual:
+        return primary_gas_out, secondary_gas_out, coupling.residual()
     return primary_gas_out, secondary_gas_out
\ No newline at end of file
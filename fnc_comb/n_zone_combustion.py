@@ -0,0 +1,181 @@
+
+import cantera as ct
+import numpy as np
+from dataclasses import dataclass
+from .help_fnc import *
+from .trajectory_recorder import advance_to_steady_state_recorded
+
+
+"""
+Generalized combustor network: N perfectly stirred zones in series (zone i -> valve -> zone i+1 -> ... -> downstream),
+each zone can take a share of the air and fuel, plus recirculation loops (mass flow controller from a later zone back
+to an earlier one). Replaces the fixed r1 -> r2 chain + recirc_factor volume multiplier when more detail is wanted.
+
+solver="dense" (default) uses IdealGasReactor and the default dense direct solver,
+solver="sparse" is the same network with mole based reactors and cantera's adaptive preconditioner (GMRES + sparse
+ILUT), only worth it for many zones (see benchmarks/bench_n_zone.py).
+https://cantera.org/stable/examples/python/reactors/preconditioned_integration.html
+"""
+
+@dataclass
+class ZoneCfg:
+    v_frac: float # Fraction of total chamber volume
+    air_frac: float # Fraction of total air mass flow injected into this zone
+    fuel_frac: float = 0.0 # Fraction of fuel mass flow injected into this zone
+    chemistry: bool = True
+
+@dataclass
+class RecircCfg:
+    from_zone: int
+    to_zone: int
+    frac: float # Recirculated mass flow as fraction of the from_zone throughflow (without recirculation)
+
+
+def n_zone_layout(combustor, n_zones=2, recirc_frac=0.0):
+    """
+    Default layout from a CombustorCfg, primary region (f_primary air, all fuel, v_frac_primary volume) split evenly
+    over the first half of the zones (fuel in the same proportion as the air, so every primary zone runs at
+    primary_equivRatio like the two zone model's primary), secondary/ dilution air split evenly over the rest.
+    recirc_frac > 0 adds a loop from the last primary zone back to the first (recirculation zone behind the injector),
+    needs at least 2 primary zones (n_zones >= 4), a loop on a single stirred zone would change nothing
+    """
+    if n_zones < 2:
+        raise ValueError(f"n_zones must be >= 2, got {n_zones}")
+    n_p = n_zones // 2
+    if recirc_frac > 0 and n_p < 2:
+        raise ValueError(f"recirc_frac = {recirc_frac} needs n_zones >= 4 (2+ primary zones to recirculate between), "
+                         f"got n_zones = {n_zones}")
+    n_s = n_zones - n_p
+
+    zones = []
+    for i in range(n_p):
+        zones.append(ZoneCfg(v_frac=combustor.v_frac_primary / n_p,
+                             air_frac=combustor.f_primary / n_p,
+                             fuel_frac=1.0 / n_p))
+    for i in range(n_s):
+        zones.append(ZoneCfg(v_frac=(1 - combustor.v_frac_primary) / n_s,
+                             air_frac=(1 - combustor.f_primary) / n_s))
+
+    recirc = []
+    if recirc_frac > 0:
+        recirc.append(RecircCfg(from_zone=n_p - 1, to_zone=0, frac=recirc_frac))
+    return zones, recirc
+
+
+class NZoneNetwork():
+    def __init__(self, inlet, zones, recirc, volume_b, m_dot_fuel, equivRatio,
+                 solver="dense", precon_threshold=None, valve_coeff=1e-4, perc_seed=0.1):
+        if solver not in ("sparse", "dense"):
+            raise ValueError(f"solver must be 'sparse' or 'dense', got '{solver}'")
+        check_precon_threshold(precon_threshold)
+        if not np.isclose(sum(z.air_frac for z in zones), 1.0) or not np.isclose(sum(z.fuel_frac for z in zones), 1.0):
+            raise ValueError("Zone air_frac and fuel_frac must each sum to 1")
+
+        mech = inlet.mech
+        self.mech = mech
+        self.zones = zones
+        self.recirc = recirc
+        reactor_type = ct.IdealGasMoleReactor if solver == "sparse" else ct.IdealGasReactor
+
+        # Reservoirs, inlet gases shared with other models through inlet
+        self.upstream_air = ct.Reservoir(inlet.gas_air)
+        self.upstream_fuel = ct.Reservoir(inlet.gas_fuel)
+        gas_downstream = ct.Solution(mech)
+        gas_downstream.TPX = inlet.T_t3, inlet.P_t4, inlet.air_X
+        self.downstream = ct.Reservoir(gas_downstream)
+
+        # Initial states: fuelled zones seeded with hot products (spark), others inlet air
+        gas_react = ct.Solution(mech)
+        gas_react.TP = inlet.T_t3, inlet.P_t4
+        gas_react.set_equivalence_ratio(equivRatio, fuel=inlet.fuel_X, oxidizer=inlet.air_X)
+        gas_prod = ct.Solution(mech)
+        gas_prod.TP = 2000, inlet.P_t4
+        gas_prod.set_equivalence_ratio(equivRatio, fuel=inlet.fuel_X, oxidizer=inlet.air_X)
+        gas_prod.equilibrate('HP')
+        Y_seed = (1 - perc_seed) * gas_react.Y + perc_seed * gas_prod.Y
+
+        # Zones
+        self.reactors = []
+        self.mfcs = []
+        for zone in zones:
+            gas = ct.Solution(mech)
+            if zone.fuel_frac > 0:
+                gas.TPY = 1200, inlet.P_t4, Y_seed
+            else:
+                gas.TPX = inlet.T_t3, inlet.P_t4, inlet.air_X
+            r = reactor_type(gas)
+            r.volume = zone.v_frac * volume_b
+            r.energy_enabled = True
+            r.chemistry_enabled = zone.chemistry
+            if zone.air_frac > 0:
+                mfc = ct.MassFlowController(self.upstream_air, r)
+                mfc.mass_flow_rate = zone.air_frac * inlet.m_dot_air
+                self.mfcs.append(mfc)
+            if zone.fuel_frac > 0:
+                mfc = ct.MassFlowController(self.upstream_fuel, r)
+                mfc.mass_flow_rate = zone.fuel_frac * m_dot_fuel
+                self.mfcs.append(mfc)
+            self.reactors.append(r)
+
+        # Series chain, pressure valves zone to zone then to sink
+        self.valves = []
+        for r_up, r_down in zip(self.reactors, self.reactors[1:] + [self.downstream]):
+            v = ct.Valve(r_up, r_down)
+            v.valve_coeff = valve_coeff
+            self.valves.append(v)
+
+        # Recirculation loops, throughflow estimate = all air + fuel injected up to and including from_zone
+        thru = np.cumsum([z.air_frac * inlet.m_dot_air + z.fuel_frac * m_dot_fuel for z in zones])
+        self.recirc_mfcs = []
+        for loop in recirc:
+            mfc = ct.MassFlowController(self.reactors[loop.from_zone], self.reactors[loop.to_zone])
+            mfc.mass_flow_rate = loop.frac * thru[loop.from_zone]
+            self.recirc_mfcs.append(mfc)
+
+        self.network = ct.ReactorNet(self.reactors)
+        if solver == "sparse":
+            self.network.preconditioner = ct.AdaptivePreconditioner()
+            # Skip the expensive/ small jacobian terms, preconditioner only has to be approximate
+            self.network.derivative_settings = {"skip-third-bodies": True, "skip-falloff": True}
+
+    def solve(self, recorder=None):
+        if recorder is None:
+            self.network.advance_to_steady_state()
+        else:
+            recorder.start_point({"n_zones": len(self.reactors), "volumes": [r.volume for r in self.reactors]})
+            advance_to_steady_state_recorded(self.network, self.reactors, recorder)
+
+        # Copy out each zone state
+        zone_gas_out = []
+        for r in self.reactors:
+            gas = ct.Solution(self.mech)
+            gas.TPY = r.T, r.thermo.P, r.thermo.Y
+            zone_gas_out.append(gas)
+        return zone_gas_out
+
+
+def n_zone_combustion(eng, diff_gas_out, diff_mdot_out, inlet=None, zones=None, recirc=None, n_zones=2, recirc_frac=0.0,
+                      solver="dense", precon_threshold=None, recorder=None, valve_coeff=1e-4, return_zones=False):
+    """
+    zones/ recirc: lists of ZoneCfg/ RecircCfg, if None built with n_zone_layout(eng.combustor, n_zones, recirc_frac)
+    precon_threshold: must be None, cantera's default drop tolerance (see help_fnc.check_precon_threshold)
+    recorder: optional TrajectoryRecorder, rows tagged with zone index as "reactor"
+    Returns (primary_gas_out, secondary_gas_out) = (first zone, last zone), return_zones=True returns every zone
+    """
+    if inlet is None:
+        inlet = InletState(eng, diff_gas_out, diff_mdot_out)
+
+    if zones is None:
+        zones, default_recirc = n_zone_layout(eng.combustor, n_zones, recirc_frac)
+        if recirc is None:
+            recirc = default_recirc
+    if recirc is None:
+        recirc = []
+
+    net = NZoneNetwork(inlet, zones, recirc, eng.combustor.volume_b, inlet.m_dot_fuel, eng.combustor.primary_equivRatio,
+                       solver=solver, precon_threshold=precon_threshold, valve_coeff=valve_coeff)
+    zone_gas_out = net.solve(recorder)
+
+    if return_zones:
+        return zone_gas_out
+    return zone_gas_out[0], zone_gas_out[-1]
@@ -0,0 +1,67 @@
+
+import cantera as ct
+import numpy as np
+
+
+OUTLET_COUPLINGS = ("valve", "pressure")
+
+
+class OutletCoupling():
+    """
+    Flow devices between the zones of the two zone models: r1 -> r2 and r2 -> downstream (sink at P_t4)
+
+    coupling="valve": ct.Valve, flow = valve_coeff (P_up - P_down) (original). Zone pressures settle mdot/ valve_coeff
+        above P_t4 and how fast they get there depends on valve_coeff
+    coupling="pressure": ct.PressureController, flow = primary flow + pressure_coeff (P_up - P_down). Each primary is a
+        reference MFC (reservoir -> reservoir, moves no mass) carrying the summed inlet MFC flows upstream of it, so
+        outflow = inflow from t = 0 and both zones sit at P_t4 at steady state
+    reference: any reservoir, only used to hang the reference MFCs on
+    """
+    def __init__(self, coupling, r1, r2, downstream, reference):
+        if coupling not in OUTLET_COUPLINGS:
+            raise ValueError(f"outlet_coupling must be one of {OUTLET_COUPLINGS}, got '{coupling}'")
+        self.coupling = coupling
+        self.r1 = r1
+        self.r2 = r2
+        self.downstream = downstream
+        if coupling == "valve":
+            self.dev12 = ct.Valve(r1, r2)
+            self.dev_out = ct.Valve(r2, downstream)
+            self.ref12 = None
+            self.ref_out = None
+        else:
+            self.ref12 = ct.MassFlowController(reference, downstream)
+            self.ref_out = ct.MassFlowController(reference, downstream)
+            self.dev12 = ct.PressureController(r1, r2, primary=self.ref12)
+            self.dev_out = ct.PressureController(r2, downstream, primary=self.ref_out)
+
+    def set_flows(self, m_dot_in1, m_dot_in2, valve_coeff=1e-4, pressure_coeff=1e-2):
+        """
+        m_dot_in1: total inlet MFC flow into r1 (air + fuel), m_dot_in2: inlet MFC flow straight into r2
+        valve_coeff used in valve mode, pressure_coeff [kg/s/Pa] in pressure mode
+        """
+        self.m_dot_in1 = m_dot_in1
+        self.m_dot_in2 = m_dot_in2
+        if self.coupling == "valve":
+            self.dev12.valve_coeff = valve_coeff
+            self.dev_out.valve_coeff = valve_coeff
+        else:
+            self.ref12.mass_flow_rate = m_dot_in1
+            self.ref_out.mass_flow_rate = m_dot_in1 + m_dot_in2
+            self.dev12.pressure_coeff = pressure_coeff
+            self.dev_out.pressure_coeff = pressure_coeff
+
+    def residual(self):
+        """
+        Mass balance of the current network state:
+            mass_residual: max over zones of |inflow - outflow|/ total inflow (0 at a true steady state)
+            dP_rel: max over zones of |P - P_t4|/ P_t4 (valve mode has the valve pressure drop in here)
+            m_dot_out: outlet flow [kg/s]
+        """
+        m_dot_12 = self.dev12.mass_flow_rate
+        m_dot_out = self.dev_out.mass_flow_rate
+        m_dot_total = self.m_dot_in1 + self.m_dot_in2
+        mass_residual = max(abs(self.m_dot_in1 - m_dot_12), abs(m_dot_12 + self.m_dot_in2 - m_dot_out)) / m_dot_total
+        P_t4 = self.downstream.thermo.P
+        dP_rel = max(abs(self.r1.thermo.P - P_t4), abs(self.r2.thermo.P - P_t4)) / P_t4
+        return {"mass_residual": float(mass_residual), "dP_rel": float(dP_rel), "m_dot_out": float(m_dot_out)}
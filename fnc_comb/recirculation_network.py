@@ -0,0 +1,166 @@
+
+import cantera as ct
+import numpy as np
+from .help_fnc import *
+from .trajectory_recorder import advance_to_steady_state_recorded
+from .outlet_coupling import OutletCoupling
+
+
+class RecirculationNetwork():
+    """
+    Two zone network (r1 -> valve12 -> r2 -> v -> downstream) built once and mutated in place.
+    Sweep points only change volumes, mass flow rates and initial states, so update() sets those
+    and reinitializes the integrator instead of rebuilding all the native cantera objects.
+
+    solver="dense": IdealGasReactor + default dense direct linear solver (original)
+    solver="sparse": IdealGasMoleReactor + adaptive preconditioner (GMRES), not faster than dense on this two reactor
+    network and GMRES stalls on some points, which are redone dense (counted in n_fallbacks)
+    precon_threshold: must be None (see help_fnc.check_precon_threshold)
+    outlet_coupling="valve"/ "pressure": r1 -> r2 and outlet devices (see outlet_coupling.OutletCoupling),
+    residual() after solve gives the mass balance of the converged state
+    """
+    def __init__(self, mech="gri30.yaml", solver="dense", precon_threshold=None, outlet_coupling="valve"):
+        if solver not in ("dense", "sparse"):
+            raise ValueError(f"solver must be 'dense' or 'sparse', got '{solver}'")
+        check_precon_threshold(precon_threshold)
+        self.mech = mech
+        self.solver = solver
+        self.outlet_coupling = outlet_coupling
+        reactor_type = ct.IdealGasMoleReactor if solver == "sparse" else ct.IdealGasReactor
+
+        # Gas objects owned by the network, states overwritten each update
+        self.gas_air = ct.Solution(mech)
+        self.gas_fuel = ct.Solution(mech)
+        self.gas_init_primary = ct.Solution(mech)
+        if solver == "sparse":
+            # Preconditioner breaks down for a mole reactor with chemistry_enabled = False, so give the cooling/ dilution
+            # zone a copy of the mechanism with no reactions instead (same physics, no chemistry)
+            gas_species = ct.Solution(mech)
+            self.gas_init_secondary = ct.Solution(thermo="ideal-gas", kinetics="gas", species=gas_species.species(), reactions=[])
+        else:
+            self.gas_init_secondary = ct.Solution(mech)
+        self.gas_downstream = ct.Solution(mech)
+        self.gas_react = ct.Solution(mech) # used for spark seed mixture
+        self.gas_prod = ct.Solution(mech)
+
+        # Reservoirs
+        self.upstream_air = ct.Reservoir(self.gas_air)
+        self.upstream_fuel = ct.Reservoir(self.gas_fuel)
+        self.downstream = ct.Reservoir(self.gas_downstream)
+
+        ##### Primary reactor #####
+        self.r1 = reactor_type(self.gas_init_primary)
+        self.r1.energy_enabled = True
+        self.mfc_air1 = ct.MassFlowController(self.upstream_air, self.r1)
+        self.mfc_fuel = ct.MassFlowController(self.upstream_fuel, self.r1)
+
+        ##### Secondary reactor (cooling secondary air) #####
+        self.r2 = reactor_type(self.gas_init_secondary)
+        self.r2.energy_enabled = True
+        self.r2.chemistry_enabled = solver == "sparse" # used to cool air, no reactions in sparse mode (see above)
+        self.mfc_air2 = ct.MassFlowController(self.upstream_air, self.r2)
+
+        # r1 -> r2 and outlet to sink, valves or pressure controllers
+        self.coupling = OutletCoupling(outlet_coupling, self.r1, self.r2, self.downstream, self.upstream_air)
+        self.valve12 = self.coupling.dev12
+        self.v = self.coupling.dev_out
+
+        self.network = ct.ReactorNet([self.r1, self.r2])
+        self.n_fallbacks = 0 # sparse points that had to be redone dense
+        self.last_residual = None
+        if solver == "sparse":
+            self.network.preconditioner = ct.AdaptivePreconditioner()
+            self.network.derivative_settings = {"skip-third-bodies": True, "skip-falloff": True}
+
+    def update(self, T_t3, P_t4, air_X, fuel_X, equivRatio,
+               v_primary, v_secondary, m_dot_air_primary, m_dot_fuel, m_dot_air_secondary, perc_seed=0.1, valve_coeff=1e-4,
+               pressure_coeff=1e-2):
+        self._last_update = (T_t3, P_t4, air_X, fuel_X, equivRatio, v_primary, v_secondary,
+                             m_dot_air_primary, m_dot_fuel, m_dot_air_secondary, perc_seed, valve_coeff, pressure_coeff)
+
+        # Inlet and sink states
+        self.gas_air.TPX = T_t3, P_t4, air_X
+        self.gas_fuel.TPX = T_t3, P_t4, fuel_X
+        self.gas_downstream.TPX = T_t3, P_t4, air_X
+        self.upstream_air.syncState()
+        self.upstream_fuel.syncState()
+        self.downstream.syncState()
+
+        # Spark seed, same as building from scratch: small fraction of hot equilibrium products
+        self.gas_react.TP = T_t3, P_t4
+        self.gas_react.set_equivalence_ratio(equivRatio, fuel=fuel_X, oxidizer=air_X)
+        self.gas_prod.TP = 2000, P_t4
+        self.gas_prod.set_equivalence_ratio(equivRatio, fuel=fuel_X, oxidizer=air_X)
+        self.gas_prod.equilibrate('HP')
+        Y_seed = (1 - perc_seed) * self.gas_react.Y + perc_seed * self.gas_prod.Y
+
+        # Reactor initial states and volumes
+        self.r1.thermo.TPY = 1200, P_t4, Y_seed
+        self.r1.syncState()
+        self.r1.volume = v_primary
+        self.r2.thermo.TPX = T_t3, P_t4, air_X
+        self.r2.syncState()
+        self.r2.volume = v_secondary
+
+        # Flows
+        self.mfc_air1.mass_flow_rate = m_dot_air_primary
+        self.mfc_fuel.mass_flow_rate = m_dot_fuel
+        self.mfc_air2.mass_flow_rate = m_dot_air_secondary
+        self.coupling.set_flows(m_dot_air_primary + m_dot_fuel, m_dot_air_secondary, valve_coeff, pressure_coeff)
+
+        # Restart integrator at t = 0 with the new states
+        self.network.initial_time = 0.0
+        self.network.reinitialize()
+
+    def solve(self, recorder=None, retry=False):
+        # retry: this solve redoes the recorder's current point (sparse fallback), see TrajectoryRecorder.start_point
+        try:
+            if recorder is None:
+                self.network.advance_to_steady_state()
+            else:
+                # Optional transient history (see trajectory_recorder.py)
+                recorder.start_point({"solver": self.solver, "v_primary": self.r1.volume, "v_secondary": self.r2.volume,
+                                      "m_dot_air_primary": self.mfc_air1.mass_flow_rate, "m_dot_fuel": self.mfc_fuel.mass_flow_rate,
+                                      "m_dot_air_secondary": self.mfc_air2.mass_flow_rate}, retry=retry)
+                advance_to_steady_state_recorded(self.network, [self.r1, self.r2], recorder)
+        except SOLVE_ERRORS:
+            if self.solver != "sparse":
+                raise
+            # GMRES can stall on blown out points once steps get large, redo the point with the dense network
+            self.n_fallbacks += 1
+            dense = get_recirculation_network(self.mech, "dense", outlet_coupling=self.outlet_coupling)
+            dense.update(*self._last_update)
+            out = dense.solve(recorder, retry=True)
+            self.last_residual = dense.last_residual
+            return out
+        self.last_residual = self.residual()
+        return self.outlet_states()
+
+    def residual(self):
+        # Mass balance/ pressure of the current state (see OutletCoupling.residual), solve() keeps the converged one
+        # in last_residual
+        return self.coupling.residual()
+
+    def outlet_states(self):
+        # Copy out, network gas objects get overwritten next point
+        primary_gas_out = ct.Solution(self.mech)
+        primary_gas_out.TPY = self.r1.T, self.r1.thermo.P, self.r1.thermo.Y
+        secondary_gas_out = ct.Solution(self.mech)
+        secondary_gas_out.TPY = self.r2.T, self.r2.thermo.P, self.r2.thermo.Y
+        return primary_gas_out, secondary_gas_out
+
+
+# One network per process and solver setting (pool workers each get their own)
+_networks = {}
+
+def get_recirculation_network(mech="gri30.yaml", solver="dense", precon_threshold=None, outlet_coupling="valve"):
+    key = (mech, solver, precon_threshold, outlet_coupling)
+    if key not in _networks:
+        _networks[key] = RecirculationNetwork(mech, solver=solver, precon_threshold=precon_threshold,
+                                              outlet_coupling=outlet_coupling)
+    return _networks[key]
+
+
+def count_fallbacks():
+    # Sparse points redone dense so far by this process's networks (sweeps diff it around each point)
+    return sum(net.n_fallbacks for net in _networks.values())
@@ -0,0 +1,116 @@
+
+import cantera as ct
+import numpy as np
+from dataclasses import dataclass
+from functools import lru_cache
+from .help_fnc import *
+
+
+@dataclass
+class ScreenResult:
+    decision: str # "ignite"/ "no_ignite" (confident) or "ambiguous" (needs the full solve)
+    Da: float # primary zone residence time/ ignition delay
+    tau1: float # primary zone residence time [s]
+    tau2: float # secondary zone residence time [s]
+    tau_ign: float # ignition delay of the primary seed mixture [s]
+    T_ad: float # adiabatic flame temperature of the primary mixture [K]
+
+
+@lru_cache(maxsize=64)
+def _primary_mixture(mech, T_t3, P_t4, air_X, fuel_X, equivRatio, perc_seed=0.1):
+    """
+    Primary zone start state exactly as RecirculationNetwork.update builds it (1200 K, reactants + perc_seed hot products),
+    its ignition delay (constant pressure, time to +400 K) and the adiabatic flame T of the reactants, plus the
+    secondary zone start density.
+    Depends only on the inlet state/ mixture, so one evaluation covers a whole sweep
+    """
+    gas_react = ct.Solution(mech)
+    gas_react.TP = T_t3, P_t4
+    gas_react.set_equivalence_ratio(equivRatio, fuel=fuel_X, oxidizer=air_X)
+    gas_prod = ct.Solution(mech)
+    gas_prod.TP = 2000, P_t4
+    gas_prod.set_equivalence_ratio(equivRatio, fuel=fuel_X, oxidizer=air_X)
+    gas_prod.equilibrate('HP')
+    Y_seed = (1 - perc_seed) * gas_react.Y + perc_seed * gas_prod.Y
+
+    gas_react.equilibrate('HP')
+    T_ad = gas_react.T
+
+    gas = ct.Solution(mech)
+    gas.TPX = T_t3, P_t4, air_X
+    rho_air = gas.density # secondary zone starts as air at T_t3
+    gas.TPY = 1200, P_t4, Y_seed
+    rho_seed = gas.density
+    r = ct.IdealGasConstPressureReactor(gas)
+    net = ct.ReactorNet([r])
+    tau_ign = np.inf
+    while net.time < 1.0:
+        net.step()
+        if r.T > 1200 + 400:
+            tau_ign = net.time
+            break
+    return rho_seed, rho_air, tau_ign, T_ad
+
+
+def screen_point(eng, diff_gas_out, diff_mdot_out, inlet=None, Da_lo=12.0, Da_hi=27.0, T_ignite=1000.0):
+    """
+    Low fidelity screen for the two zone model (multi_flow_recirculation_combustion) primary zone:
+        T_ad < T_ignite                -> no_ignite (mixture can't reach the criterion at all)
+        Da = tau1/ tau_ign <= Da_lo    -> no_ignite (flow leaves before it can ignite, blowout)
+        Da >= Da_hi                    -> ignite
+        otherwise                      -> ambiguous, run the full solve
+    tau1/ tau2 are the same residence times the model computes (initial zone states). Default Da_lo/ Da_hi are the
+    observed boundary (Da ~ 18 at the default throttle point) / x 1.5, refit with calibrate_screen for other inlets
+    (see benchmarks/bench_screen.py)
+    """
+    if inlet is None:
+        inlet = InletState(eng, diff_gas_out, diff_mdot_out)
+
+    m_dot_air_primary, m_dot_fuel, m_dot_air_secondary, v_primary, v_secondary = inlet.two_zone_split(eng.combustor)
+
+    rho1, rho2, tau_ign, T_ad = _primary_mixture(inlet.mech, inlet.T_t3, inlet.P_t4, inlet.air_X, inlet.fuel_X,
+                                                 eng.combustor.primary_equivRatio)
+    tau1 = rho1 * v_primary / (m_dot_air_primary + m_dot_fuel)
+    tau2 = rho2 * v_secondary / (inlet.m_dot_air + m_dot_fuel)
+    Da = tau1 / tau_ign
+
+    if T_ad < T_ignite or Da <= Da_lo:
+        decision = "no_ignite"
+    elif Da >= Da_hi:
+        decision = "ignite"
+    else:
+        decision = "ambiguous"
+    return ScreenResult(decision=decision, Da=Da, tau1=tau1, tau2=tau2, tau_ign=tau_ign, T_ad=T_ad)
+
+
+def calibrate_screen(Da, ignited, safety=1.5):
+    """
+    Fit screen thresholds to full solves: Da_lo below every igniting point, Da_hi above every non igniting point,
+    each widened by the safety factor. Returns (Da_lo, Da_hi)
+    """
+    Da = np.asarray(Da)
+    ignited = np.asarray(ignited, dtype=bool)
+    Da_lo = Da[ignited].min() / safety if ignited.any() else np.inf
+    Da_hi = Da[~ignited].max() * safety if (~ignited).any() else 0.0
+    return Da_lo, Da_hi
+
+
+def screen_error_rates(decisions, ignited):
+    """
+    decisions: screen decisions, ignited: full solve outcome for the same points
+    Returns counts + rates of wrong confident decisions (false_no_ignite = screened out but the full solve ignites)
+    """
+    decisions = np.asarray(decisions)
+    ignited = np.asarray(ignited, dtype=bool)
+    no = decisions == "no_ignite"
+    yes = decisions == "ignite"
+    n_no = int(no.sum())
+    n_yes = int(yes.sum())
+    return {
+        "n": len(decisions),
+        "n_no_ignite": n_no, "n_ignite": n_yes, "n_ambiguous": int((decisions == "ambiguous").sum()),
+        "false_no_ignite": int((no & ignited).sum()), "false_ignite": int((yes & ~ignited).sum()),
+        "false_no_ignite_rate": float((no & ignited).sum() / n_no) if n_no else 0.0,
+        "false_ignite_rate": float((yes & ~ignited).sum() / n_yes) if n_yes else 0.0,
+        "screened_fraction": (n_no + n_yes) / len(decisions) if len(decisions) else 0.0,
+    }
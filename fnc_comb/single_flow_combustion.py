@@ -2,33 +2,32 @@
 import cantera as ct
 import numpy as np
 from .help_fnc import *
+from .trajectory_recorder import advance_recorded
 
-def single_flow_combustion(eng, diff_gas_out, diff_mdot_out):
+def single_flow_combustion(eng, diff_gas_out, diff_mdot_out, inlet=None, recorder=None, valve_coeff=1e-4):
+
+    if inlet is None:
+        inlet = InletState(eng, diff_gas_out, diff_mdot_out)
 
     # Set variables
-    T_t3 = diff_gas_out.T
-    P_t3 = diff_gas_out.P
+    T_t3 = inlet.T_t3
+    P_t4 = inlet.P_t4
     volume_b = eng.combustor.volume_b
-    m_dot_air = diff_mdot_out
-    m_dot_fuel = calc_fuel_mdot(m_dot_air, eng.combustor.equivRatio)
-
-    # Calcuate P_t4 using estimated combustor pressure ratio
-    P_t4 = P_t3 * eng.combustor.PR_b
+    m_dot_air = inlet.m_dot_air
+    m_dot_fuel = inlet.m_dot_fuel
     
     ### Cantera
     # Set up
-    mech = "gri30.yaml"
-    gas_air  = ct.Solution(mech)
-    gas_fuel = ct.Solution(mech)
+    mech = inlet.mech
+    gas_air  = inlet.gas_air
+    gas_fuel = inlet.gas_fuel
     gas_init = ct.Solution(mech)  # separate object for the reactor initial state
 
     # Compositions
-    air_X  = "O2:0.21, N2:0.79" # air same comp always for this model
-    fuel_X = eng.combustor.fuel_comp
+    air_X  = inlet.air_X # air same comp always for this model
+    fuel_X = inlet.fuel_X
 
-    # Set inlet states
-    gas_air.TPX  = T_t3, P_t4, air_X
-    gas_fuel.TPX = T_t3, P_t4, fuel_X
+    # Set initial state
     gas_init.TPX = 1200.0, P_t4, air_X
 
     # Reservoirs
@@ -49,7 +48,7 @@ def single_flow_combustion(eng, diff_gas_out, diff_mdot_out):
 
     # Valve to downstream, pressure dependent outlet device
     v = ct.Valve(r, downstream)
-    v.valve_coeff = 1e-4
+    v.valve_coeff = valve_coeff
     # Can change to fix flow below for comparison
     # mfc_out = ct.MassFlowController(r, downstream)
     # mfc_out.mass_flow_rate = m_dot_air + m_dot_fuel
@@ -65,8 +64,15 @@ def single_flow_combustion(eng, diff_gas_out, diff_mdot_out):
     tau  = rho0 * vol / (m_dot_air + m_dot_fuel)
     t_end = 20.0 * tau
 
+    # Optional transient history (TrajectoryRecorder), same end points as the plain advance calls
+    if recorder is not None:
+        recorder.start_point({"volume_b": volume_b, "m_dot_air": m_dot_air, "m_dot_fuel": m_dot_fuel, "tau": tau})
+
     # Check comp right after start (not a linear progression, just viewing solver at different txTau)
-    network.advance(6.5*tau)
+    if recorder is None:
+        network.advance(6.5*tau)
+    else:
+        advance_recorded(network, 6.5*tau, [r], recorder)
     gas_out = ct.Solution(mech)
     gas_out.TPY = r.T, r.thermo.P, r.thermo.Y
     X = gas_out.X              # mole fractions (numpy array)
@@ -82,7 +88,10 @@ def single_flow_combustion(eng, diff_gas_out, diff_mdot_out):
     print(f"  C3H8 = {X[ifuel]:.6e}")
 
 
-    network.advance(t_end)  # advance(network, t_end)
+    if recorder is None:
+        network.advance(t_end)  # advance(network, t_end)
+    else:
+        advance_recorded(network, t_end, [r], recorder)
 
     # Set gas_out properties, exporting mass fractions Y, T, P
     gas_out = ct.Solution(mech)
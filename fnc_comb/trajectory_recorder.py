@@ -0,0 +1,178 @@
+
+import json
+import cantera as ct
+import numpy as np
+
+
+class TrajectoryRecorder():
+    """
+    Records reactor transients (t, T, P, selected species X) while a network integrates, for looking at slow
+    convergence/ blowout without print edits. Rows go into a fixed size float32 buffer that gets appended to
+    a raw binary file whenever it fills, so memory stays bounded no matter how many sweep points are recorded.
+
+    Decimation: a step is kept every `every` integrator steps, or sooner if any reactor T moved more than dT_min
+    since the last kept row (so ignition/ blowout fronts are kept, the long flat tail is thinned out).
+
+    File layout: <path> raw float32 rows, <path>.json columns/ dtype, <path>.points.jsonl one line of info per
+    start_point (appended as it happens, like the rows). Readable mid run, load with load_trajectory(path)
+
+    Retries: start_point(info, retry=True) (sparse -> dense fallback) keeps the point index and bumps the "attempt"
+    column, so a retried design is still one point, rows of the failed attempt kept apart from the final ones
+    """
+    def __init__(self, path, species=("C3H8", "O2", "CO", "CO2", "H2O"), capacity=4096, every=20, dT_min=5.0):
+        self.path = path
+        self.meta_path = path + ".json"
+        self.points_path = path + ".points.jsonl"
+        self.species = tuple(species)
+        self.columns = ("point", "attempt", "reactor", "t", "T", "P") + tuple(f"X_{sp}" for sp in self.species)
+        self.every = every
+        self.dT_min = dT_min
+
+        self.buffer = np.empty((capacity, len(self.columns)), dtype=np.float32)
+        self.n_buf = 0
+        self.n_rows = 0 # rows written to disk
+        self.n_points = 0
+
+        self._point = -1
+        self._attempt = 0
+        self._n_steps = 0
+        self._last_T = None
+        self._sp_idx = None
+
+        # Start fresh files
+        with open(self.path, "wb"):
+            pass
+        with open(self.points_path, "w"):
+            pass
+        self._write_meta()
+
+    def start_point(self, info=None, retry=False):
+        """
+        Called by the networks at the start of each solve, info = whatever describes the point (volumes, flows, ..)
+        retry=True: same point solved again (solver fallback), rows go in as the next attempt of the current point
+        """
+        if retry and self._point >= 0:
+            self._attempt += 1
+        else:
+            self._point += 1
+            self._attempt = 0
+            self.n_points += 1
+        self._n_steps = 0
+        self._last_T = None
+        line = {"point": self._point, "attempt": self._attempt, "info": info if info is not None else {}}
+        with open(self.points_path, "a") as f:
+            f.write(json.dumps(line, default=float) + "\n")
+        return self._point
+
+    def sample(self, t, reactors, force=False):
+        self._n_steps += 1
+        T_now = np.array([r.T for r in reactors])
+        if not force and self._last_T is not None and self._n_steps % self.every != 0:
+            if np.max(np.abs(T_now - self._last_T)) < self.dT_min:
+                return
+        self._last_T = T_now
+
+        if self._sp_idx is None:
+            thermo = reactors[0].thermo
+            self._sp_idx = [thermo.species_index(sp) for sp in self.species]
+
+        for i, r in enumerate(reactors):
+            if self.n_buf == len(self.buffer):
+                self.flush()
+            row = self.buffer[self.n_buf]
+            row[0] = self._point
+            row[1] = self._attempt
+            row[2] = i
+            row[3] = t
+            row[4] = r.T
+            row[5] = r.thermo.P
+            row[6:] = r.thermo.X[self._sp_idx]
+            self.n_buf += 1
+
+    def flush(self):
+        if self.n_buf:
+            with open(self.path, "ab") as f:
+                f.write(self.buffer[:self.n_buf].tobytes())
+            self.n_rows += self.n_buf
+            self.n_buf = 0
+
+    def _write_meta(self):
+        meta = {"columns": self.columns, "dtype": "float32", "n_rows": self.n_rows, "n_points": self.n_points}
+        with open(self.meta_path, "w") as f:
+            json.dump(meta, f)
+
+    def close(self):
+        self.flush()
+        self._write_meta()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_trajectory(path):
+    """
+    Returns dict of column name -> array, filter with d["point"] == k, d["reactor"] == i (d["attempt"] for retried
+    points), plus "points": info of each point's last attempt and "attempts": number of attempts per point
+    """
+    with open(path + ".json") as f:
+        meta = json.load(f)
+    data = np.fromfile(path, dtype=meta["dtype"]).reshape(-1, len(meta["columns"]))
+    out = {name: data[:, c] for c, name in enumerate(meta["columns"])}
+    points = {}
+    attempts = {}
+    with open(path + ".points.jsonl") as f:
+        for line in f:
+            entry = json.loads(line)
+            points[entry["point"]] = entry["info"]
+            attempts[entry["point"]] = entry["attempt"] + 1
+    out["points"] = [points[k] for k in sorted(points)]
+    out["attempts"] = [attempts[k] for k in sorted(attempts)]
+    return out
+
+
+def _network_state(reactors):
+    # Mass, volume, T, Y of each reactor (same as ReactorNet.get_state for IdealGasReactor, which mole reactors don't support)
+    return np.concatenate([np.concatenate(([r.mass, r.volume, r.T], r.thermo.Y)) for r in reactors])
+
+
+def advance_to_steady_state_recorded(network, reactors, recorder, max_steps=10000, residual_threshold=0.0, atol=0.0):
+    """
+    Same stopping rule as ReactorNet.advance_to_steady_state (residual of state change over 10 steps), stepping by
+    hand so every step can be handed to the recorder
+    """
+    if not residual_threshold:
+        residual_threshold = 10.0 * network.rtol
+    if not atol:
+        atol = network.rtol
+
+    recorder.sample(network.time, reactors, force=True)
+    max_state_values = _network_state(reactors)
+    for step in range(max_steps):
+        previous_state = _network_state(reactors)
+        for n1 in range(10):
+            network.step()
+            recorder.sample(network.time, reactors)
+        state = _network_state(reactors)
+        max_state_values = np.maximum(max_state_values, state)
+        residual = np.linalg.norm((state - previous_state) / (max_state_values + atol)) / np.sqrt(len(state))
+        if residual < residual_threshold:
+            break
+    # Always keep the final state
+    recorder.sample(network.time, reactors, force=True)
+    if step == max_steps - 1:
+        raise ct.CanteraError("Maximum number of steps reached before convergence below maximum residual")
+
+def advance_recorded(network, t_end, reactors, recorder, n_out=100):
+    """
+    network.advance(t_end) for the time-marched models, hit on a log spaced output grid (integrator can't step
+    backwards to land on t_end, so the grid is the decimation here, every output is kept)
+    """
+    t0 = network.time
+    recorder.sample(t0, reactors, force=True)
+    t_first = t0 + (t_end - t0) * 1e-4
+    for t in np.geomspace(t_first, t_end, n_out):
+        network.advance(t)
+        recorder.sample(network.time, reactors, force=True)
@@ -12,7 +12,8 @@ def save(filename, *args):
     
     # Get global dictionary
     # glob = globals()
-    glob = inspect.currentframe().f_back.f_globals # Needed for passing in variables from another script
+    caller = inspect.currentframe().f_back
+    glob = {**caller.f_globals, **caller.f_locals} # Needed for passing in variables from another script/ function
     d = {}
     for v in args:
         # Copy over desired values
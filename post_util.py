@@ -0,0 +1,147 @@
+# Post processing of stored sweep results, all numpy over the whole result cube (no reactor re-runs)
+# Works from saved T, P, Y arrays (run_sweep saves Y_*_out + species_names), cantera only used once for species data
+import argparse
+import os
+import pickle
+
+import numpy as np
+from pickle_util import data_dir
+from fnc_comb.help_fnc import calc_fuel_mdot, get_T, get_P
+
+
+R_U = 8314.462618 # J/kmol/K
+
+# Lower heating values [J/kg], for combustion efficiency
+LHV = {"C3H8": 46.35e6, "CO": 10.10e6, "H2": 119.96e6, "CH4": 50.03e6}
+
+
+class SpeciesData():
+    """
+    NASA7 coefficients, molecular weights and carbon atom counts for the species in the stored arrays
+    """
+    def __init__(self, species_names, mech="gri30.yaml"):
+        import cantera as ct
+        gas = ct.Solution(mech)
+        self.species_names = list(species_names)
+        idx = [gas.species_index(sp) for sp in self.species_names]
+        self.MW = gas.molecular_weights[idx] # kg/kmol
+        self.n_C = np.array([gas.n_atoms(k, "C") for k in idx])
+
+        coeffs = np.array([gas.species(k).thermo.coeffs for k in idx]) # [T_mid, high(7), low(7)]
+        self.T_mid = coeffs[:, 0]
+        self.a_high = coeffs[:, 1:8]
+        self.a_low = coeffs[:, 8:15]
+
+    def index(self, sp):
+        return self.species_names.index(sp)
+
+
+### Mixture properties, T/ P shape (...), Y shape (..., n_species) ###
+def cp_R(T, sd):
+    # Species cp/R, shape (..., n_species)
+    T = np.asarray(T)[..., None]
+    low = sd.a_low[:, 0] + T*(sd.a_low[:, 1] + T*(sd.a_low[:, 2] + T*(sd.a_low[:, 3] + T*sd.a_low[:, 4])))
+    high = sd.a_high[:, 0] + T*(sd.a_high[:, 1] + T*(sd.a_high[:, 2] + T*(sd.a_high[:, 3] + T*sd.a_high[:, 4])))
+    return np.where(T > sd.T_mid, high, low)
+
+def mix_R(Y, sd):
+    # Mixture gas constant [J/kg/K]
+    return R_U * np.sum(Y / sd.MW, axis=-1)
+
+def mix_cp(T, Y, sd):
+    # Mixture cp [J/kg/K]
+    return R_U * np.sum(Y * cp_R(T, sd) / sd.MW, axis=-1)
+
+def mass_to_mole(Y, sd):
+    n = Y / sd.MW
+    return n / np.sum(n, axis=-1, keepdims=True)
+
+
+### Derived quantities ###
+def stagnation_props(T, P, Y, m_dot, area, sd):
+    """
+    Same as the totals in multi_flow_recirculation_combustion (get_gamma/ get_a/ get_T/ get_P), for whole arrays
+    m_dot, area broadcastable to T (flow through the zone outlet and its cross section)
+    """
+    R = mix_R(Y, sd)
+    cp = mix_cp(T, Y, sd)
+    gamma = cp / (cp - R)
+    a = np.sqrt(gamma * R * T)
+    rho = P / (R * T)
+    M = m_dot / (rho * area * a)
+    return {"gamma": gamma, "a": a, "M": M, "T_0": get_T(T, gamma, M), "P_0": get_P(P, gamma, M)}
+
+
+def emission_indices(Y, sd, fuel="C3H8", species=("CO", "NO", "C3H8")):
+    """
+    Emission index [g/kg fuel] by carbon balance (all carbon in the products came from the fuel), composition only:
+    EI_k = X_k MW_k / sum_j(X_j n_C,j) * n_C,fuel / MW_fuel * 1000
+    Unburned fuel = EI of the fuel species itself
+    """
+    X = mass_to_mole(Y, sd)
+    i_fuel = sd.index(fuel)
+    carbon = np.sum(X * sd.n_C, axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scale = sd.n_C[i_fuel] / sd.MW[i_fuel] * 1000.0 / carbon
+        return {sp: X[..., sd.index(sp)] * sd.MW[sd.index(sp)] * scale for sp in species}
+
+
+def combustion_efficiency(Y, sd, fuel="C3H8"):
+    """
+    eta_b = 1 - sum(EI_k LHV_k)/ (1000 LHV_fuel) over the partially burned species (fuel, CO, H2, CH4)
+    """
+    species = [sp for sp in LHV if sp in sd.species_names]
+    EI = emission_indices(Y, sd, fuel, species)
+    loss = sum(EI[sp] * LHV[sp] for sp in species)
+    return 1.0 - loss / (1000.0 * LHV[fuel])
+
+
+def sweep_flows(f_primary_array, v_frac_primary_array, volume_b_array, m_dot_air, equivRatio, A_diff_out):
+    """
+    Mass flows and areas of the two zone sweep cube (same splits as multi_flow_recirculation_combustion),
+    shapes broadcast to (n, nv, n2)
+    """
+    f = np.asarray(f_primary_array)[:, None, None]
+    v_frac = np.asarray(v_frac_primary_array)[None, :, None]
+    m_dot_fuel = calc_fuel_mdot(f * m_dot_air, equivRatio)
+    return {"m_dot_primary": f*m_dot_air + m_dot_fuel, "area_primary": A_diff_out * v_frac,
+            "m_dot_secondary": m_dot_air + m_dot_fuel, "area_secondary": A_diff_out}
+
+
+def post_process_sweep(data, m_dot_air, equivRatio, A_diff_out, mech="gri30.yaml", fuel="C3H8"):
+    """
+    data: dict from a run_sweep file (needs T_*_out, P_*_out, Y_*_out, species_names and the input arrays)
+    Returns {zone: {quantity: array (n, nv, n2)}} for zone in primary/ secondary
+    """
+    if "Y_primary_out" not in data:
+        raise KeyError("Stored result has no Y_primary_out/ Y_secondary_out, rerun the sweep with the current run_sweep")
+    sd = SpeciesData(data["species_names"], mech)
+    flows = sweep_flows(data["f_primary_array"], data["v_frac_primary_array"], data["volume_b_array"],
+                        m_dot_air, equivRatio, A_diff_out)
+    out = {}
+    for zone in ("primary", "secondary"):
+        T, P, Y = data[f"T_{zone}_out"], data[f"P_{zone}_out"], data[f"Y_{zone}_out"]
+        res = stagnation_props(T, P, Y, flows[f"m_dot_{zone}"], flows[f"area_{zone}"], sd)
+        res["eta_b"] = combustion_efficiency(Y, sd, fuel)
+        for sp, EI in emission_indices(Y, sd, fuel, ("CO", "NO", fuel)).items():
+            res[f"EI_{sp}"] = EI
+        out[zone] = res
+    return out
+
+
+if __name__ == "__main__":
+    from compute_main import default_diffuser, M_DOT_AIR
+    parser = argparse.ArgumentParser(description="Derived quantities (stagnation T/P, Mach, efficiency, emission indices) for a saved sweep")
+    parser.add_argument("filename", help="run_sweep output in Data_Storage")
+    parser.add_argument("--m_dot_air", type=float, default=M_DOT_AIR)
+    parser.add_argument("--equivRatio", type=float, default=0.5, help="primary equivalence ratio used in the sweep")
+    args = parser.parse_args()
+
+    with open(os.path.join(data_dir, args.filename), "rb") as f:
+        data = pickle.load(f)
+    post = post_process_sweep(data, args.m_dot_air, args.equivRatio, default_diffuser().A_diff_out)
+
+    full_path = os.path.join(data_dir, args.filename + "_post")
+    with open(full_path, "wb") as f:
+        pickle.dump(post, f)
+    print("Saved to:", full_path)
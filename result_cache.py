@@ -0,0 +1,260 @@
+# Persistent result cache, combustor outlet states keyed by a hash of everything that goes into a point
+# Overlapping/ rerun sweeps only solve the points that aren't on disk yet
+import argparse
+import glob
+import hashlib
+import json
+import os
+import pickle
+from dataclasses import asdict, is_dataclass
+
+import numpy as np
+from pickle_util import data_dir
+
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+cache_dir = os.path.join(data_dir, "result_cache")
+
+# Model kwargs that don't change the result (diagnostics only), left out of the key
+_KEY_IGNORE = ("recorder",)
+
+_code_version = None
+
+def code_version():
+    """
+    Hash of the combustor/ engine cycle source files + cantera version, any code edit gives new keys (old entries go stale)
+    """
+    global _code_version
+    if _code_version is None:
+        import cantera as ct
+        h = hashlib.sha256(ct.__version__.encode())
+        files = ["combustor_main.py", "engine_cfg.py", "engine_cycle.py"] + sorted(os.path.relpath(p, base_dir) for p in glob.glob(os.path.join(base_dir, "fnc_comb", "*.py")))
+        for name in files:
+            with open(os.path.join(base_dir, name), "rb") as f:
+                h.update(name.encode())
+                h.update(f.read())
+        _code_version = h.hexdigest()[:16]
+    return _code_version
+
+
+def point_config(eng, model, model_kwargs):
+    # Everything that sets the outlet state of one point, as plain json types
+    return {
+        "T_t3": eng.T_t3, "P_t3": eng.P_t3, "m_dot_air": eng.m_dot_air,
+        "diffuser": asdict(eng.diffuser), "combustor": asdict(eng.combustor),
+        "mech": eng.mech, "model": model,
+        "model_kwargs": {k: v for k, v in model_kwargs.items() if k not in _KEY_IGNORE},
+        "code_version": code_version(),
+    }
+
+
+def _json_default(value):
+    # Model kwargs can hold dataclasses (n_zone ZoneCfg/ RecircCfg lists) and numpy scalars/ arrays
+    if is_dataclass(value) and not isinstance(value, type):
+        return {"__type__": type(value).__name__, **asdict(value)}
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return float(value)
+
+
+def point_key(config):
+    # Canonical json (sorted keys, repr floats) -> sha256
+    text = json.dumps(config, sort_keys=True, default=_json_default)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+_MISSING = object()
+
+def _config_value(config, name):
+    # Dotted names reach into nested config dicts (ex: "combustor.f_primary", "model_kwargs.solver")
+    value = config
+    for part in name.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return _MISSING
+        value = value[part]
+    return value
+
+
+def parse_match(items):
+    """
+    KEY=VALUE strings -> match dict, values parsed as json where possible so numbers/ true/ false/ null
+    compare by value ("f_primary=0.3" matches 0.3, "solver=sparse" stays a string)
+    """
+    match = {}
+    for item in items:
+        name, value = item.split("=", 1)
+        try:
+            match[name] = json.loads(value)
+        except ValueError:
+            match[name] = value
+    return match
+
+
+def _gas_state(gas):
+    if gas is None:
+        return None
+    return (gas.T, gas.P, np.array(gas.Y))
+
+def _state_gas(state, mech):
+    if state is None:
+        return None
+    import cantera as ct
+    gas = ct.Solution(mech)
+    gas.TPY = state
+    return gas
+
+
+class ResultCache():
+    """
+    One pickle per point in cache_dir/<key[:2]>/<key>.pkl holding the config and the outlet (T, P, Y) states.
+    Size bounded: when the total goes over max_mb, least recently used entries (file mtime, touched on hits)
+    are deleted. Non converged points (None outlets) are cached too so they aren't retried.
+    Sweep tasks carry the cache, unpickling gives each worker process one instance per cache directory (see
+    _open_cache) so its total_bytes keeps counting across points. That count misses the other workers' puts, so
+    evict() re-reads the size from disk and tolerates entries another worker removed first, the parent evicts
+    again after the run.
+    """
+    def __init__(self, path=cache_dir, max_mb=500.0):
+        self.path = path
+        self.max_bytes = max_mb * 1e6
+        os.makedirs(self.path, exist_ok=True)
+        self.n_hits = 0
+        self.n_misses = 0
+        self.n_evicted = 0
+        self.total_bytes = sum(os.path.getsize(p) for p in self._entries())
+
+    def __reduce__(self):
+        return _open_cache, (self.path, self.max_bytes / 1e6)
+
+    def _entries(self):
+        return glob.glob(os.path.join(self.path, "*", "*.pkl"))
+
+    def _file(self, key):
+        return os.path.join(self.path, key[:2], key + ".pkl")
+
+    def get(self, key, mech="gri30.yaml"):
+        # Returns (primary_gas_out, secondary_gas_out) or None on a miss
+        file = self._file(key)
+        try:
+            with open(file, "rb") as f:
+                entry = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            self.n_misses += 1
+            return None
+        try:
+            os.utime(file) # LRU order
+        except FileNotFoundError:
+            pass # evicted by another worker since the read, the entry is still good
+        self.n_hits += 1
+        return _state_gas(entry["primary"], mech), _state_gas(entry["secondary"], mech)
+
+    def put(self, key, config, primary_gas_out, secondary_gas_out):
+        file = self._file(key)
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        entry = {"config": config, "primary": _gas_state(primary_gas_out), "secondary": _gas_state(secondary_gas_out)}
+        # Write then rename so a killed sweep never leaves a half written entry
+        tmp = file + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(entry, f)
+        if os.path.exists(file):
+            self.total_bytes -= os.path.getsize(file)
+        os.replace(tmp, file)
+        self.total_bytes += os.path.getsize(file)
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+
+    def get_or_run(self, eng, fnc, model, **model_kwargs):
+        """
+        Look up the point, otherwise fnc() -> (primary_gas_out, secondary_gas_out) and store it
+        """
+        config = point_config(eng, model, model_kwargs)
+        key = point_key(config)
+        out = self.get(key, eng.mech)
+        if out is None:
+            out = fnc()
+            self.put(key, config, *out)
+        return out
+
+    def _stat_entries(self):
+        # (mtime, size, path) of every entry on disk, skipping any removed while listing
+        entries = []
+        for p in self._entries():
+            try:
+                st = os.stat(p)
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        return entries
+
+    def evict(self, max_bytes=None):
+        # Delete oldest entries until under max_bytes, size re-read from disk (other processes write here too)
+        if max_bytes is None:
+            max_bytes = self.max_bytes
+        entries = sorted(self._stat_entries())
+        self.total_bytes = sum(size for mtime, size, p in entries)
+        for mtime, size, p in entries:
+            if self.total_bytes <= max_bytes:
+                break
+            try:
+                os.remove(p)
+                self.n_evicted += 1
+            except FileNotFoundError:
+                pass # another worker evicted it first
+            self.total_bytes -= size
+
+    def invalidate(self, match=None, stale=False):
+        """
+        Remove entries, all of them by default.
+        match: dict of config values that must all be equal to remove (ex: {"mech": "gri30.yaml", "model": "n_zone"}),
+            dotted keys reach nested values ({"combustor.f_primary": 0.3})
+        stale: only remove entries written by a different code version
+        """
+        n_removed = 0
+        for p in self._entries():
+            if match or stale:
+                with open(p, "rb") as f:
+                    config = pickle.load(f)["config"]
+                if stale and config["code_version"] == code_version():
+                    continue
+                if match and any(_config_value(config, k) != v for k, v in match.items()):
+                    continue
+            self.total_bytes -= os.path.getsize(p)
+            os.remove(p)
+            n_removed += 1
+        return n_removed
+
+    def stats(self):
+        return {"entries": len(self._entries()), "MB": self.total_bytes / 1e6, "hits": self.n_hits,
+                "misses": self.n_misses, "evicted": self.n_evicted}
+
+
+# One cache instance per process and directory, what a pickled ResultCache opens as in a worker
+_open_caches = {}
+
+def _open_cache(path, max_mb):
+    if path not in _open_caches:
+        _open_caches[path] = ResultCache(path, max_mb)
+    cache = _open_caches[path]
+    cache.max_bytes = max_mb * 1e6
+    return cache
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the persistent combustor result cache")
+    parser.add_argument("command", choices=["info", "clear", "stale", "prune"],
+                        help="info: size/ entries, clear: remove entries (all or --match), stale: remove entries from other code versions, prune: evict LRU down to --max_mb")
+    parser.add_argument("--path", default=cache_dir, help="cache directory")
+    parser.add_argument("--max_mb", type=float, default=500.0, help="size bound")
+    parser.add_argument("--match", nargs="*", default=[], metavar="KEY=VALUE", help="only clear entries with these config values (ex: model=n_zone combustor.f_primary=0.3)")
+    args = parser.parse_args()
+
+    cache = ResultCache(args.path, args.max_mb)
+    if args.command == "clear":
+        match = parse_match(args.match)
+        print(f"Removed {cache.invalidate(match=match)} entries")
+    elif args.command == "stale":
+        print(f"Removed {cache.invalidate(stale=True)} entries")
+    elif args.command == "prune":
+        cache.evict()
+        print(f"Evicted {cache.n_evicted} entries")
+    print(cache.stats())
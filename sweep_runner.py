@@ -0,0 +1,240 @@
+# Sweep runner, worker processes with memory watermark tracking and recycling
+# Cantera native objects pile up over tens of thousands of points, a worker that crosses the watermark
+# (or task count) finishes its point, exits and is replaced, so long runs keep a flat memory profile
+import multiprocessing as mp
+import os
+import time
+from collections import deque
+from multiprocessing import connection
+
+import numpy as np
+
+
+_PAGE_MB = os.sysconf("SC_PAGE_SIZE") / 1e6 if hasattr(os, "sysconf") else 4096 / 1e6
+
+def rss_mb():
+    # Current resident memory of this process [MB], /proc on linux, peak rss elsewhere
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_MB
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def _worker(wid, fnc, conn, max_tasks, max_rss_mb):
+    # Own pipe to the parent, one point at a time, so killing this worker can't corrupt anyone else's channel
+    n_tasks = 0
+    while True:
+        item = conn.recv()
+        if item is None:
+            break
+        idx, task = item
+        rss_before = rss_mb()
+        try:
+            out, err = fnc(task), None
+        except Exception as e:
+            out, err = None, repr(e)
+        rss_after = rss_mb()
+        n_tasks += 1
+        recycle = bool((max_tasks and n_tasks >= max_tasks) or (max_rss_mb and rss_after >= max_rss_mb))
+        conn.send((idx, (out, err, rss_before, rss_after), recycle))
+        if recycle:
+            break
+    conn.close()
+
+
+class SweepRunner():
+    """
+    Runs fnc(task) for a list of tasks on `processes` worker processes (None = in this process, no recycling).
+    max_rss_mb: worker exits after the point that takes it over this resident memory, a fresh one replaces it
+    max_tasks_per_worker: same on a task count
+    A worker that dies mid point (segfault/ OOM kill) is replaced and its point retried once.
+    timeout_s: a point running longer is killed with its worker and recorded as failed (workers only)
+    telemetry: optional telemetry_util.SweepTelemetry, fed point start/ finish events
+    After run(): self.meta has memory per point stats, worker peak rss, recycle/ failure/ timeout counts
+    """
+    def __init__(self, fnc, processes=None, max_rss_mb=None, max_tasks_per_worker=None, timeout_s=None, telemetry=None):
+        self.fnc = fnc
+        self.processes = processes
+        self.max_rss_mb = max_rss_mb
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.timeout_s = timeout_s
+        self.telemetry = telemetry
+        self.meta = {}
+
+    def run(self, tasks, callback=None):
+        """
+        callback(idx, out) called in this process as each point finishes (out None if it failed)
+        Returns list of outputs in task order
+        """
+        tasks = list(tasks)
+        n = len(tasks)
+        results = [None] * n
+        self._rss_before = np.full(n, np.nan)
+        self._rss_after = np.full(n, np.nan)
+        self._errors = {}
+        self._worker_peak = {}
+        self._n_recycled = 0
+        self._n_workers = 0
+        self._n_crashed = 0
+        self._n_timeouts = 0
+        t0 = time.time()
+
+        def finish(idx, out, err, rss_before, rss_after, wid, timeout=False):
+            results[idx] = out
+            if self.telemetry is not None:
+                self.telemetry.point_done(wid, ok=err is None, timeout=timeout)
+            self._rss_before[idx] = rss_before
+            self._rss_after[idx] = rss_after
+            self._worker_peak[wid] = max(self._worker_peak.get(wid, 0.0), rss_after)
+            if err is not None:
+                self._errors[idx] = err
+            if callback is not None:
+                callback(idx, out)
+
+        if self.processes is None:
+            for idx, task in enumerate(tasks):
+                if self.telemetry is not None:
+                    self.telemetry.point_started(0)
+                rss_before = rss_mb()
+                try:
+                    out, err = self.fnc(task), None
+                except Exception as e:
+                    out, err = None, repr(e)
+                finish(idx, out, err, rss_before, rss_mb(), 0)
+            self._n_workers = 1
+        else:
+            self._run_workers(tasks, finish)
+
+        self.meta = self._build_meta(n, time.time() - t0)
+        return results
+
+    def _run_workers(self, tasks, finish):
+        pending = deque(range(len(tasks)))
+        workers = {} # wid -> (Process, parent end of its pipe)
+        in_flight = {} # wid -> (task idx, start time)
+        retries = set()
+        p_exit = {} # wid -> exit code of removed workers
+
+        def start_worker():
+            wid = self._n_workers
+            self._n_workers += 1
+            conn, child_conn = mp.Pipe()
+            p = mp.Process(target=_worker, args=(wid, self.fnc, child_conn, self.max_tasks_per_worker, self.max_rss_mb), daemon=True)
+            p.start()
+            child_conn.close()
+            workers[wid] = (p, conn)
+            dispatch(wid)
+
+        def dispatch(wid):
+            # Next point to an idle worker, workers without work wait until shutdown
+            if pending:
+                idx = pending.popleft()
+                in_flight[wid] = (idx, time.time())
+                try:
+                    workers[wid][1].send((idx, tasks[idx]))
+                except OSError:
+                    pass # worker already gone, its pipe reads EOF next and worker_lost retries the point
+                if self.telemetry is not None:
+                    self.telemetry.point_started(wid)
+
+        def remove_worker(wid, kill=False):
+            # Always joined (no zombies), a killed worker only ever held its own pipe
+            p, conn = workers.pop(wid)
+            if kill:
+                p.terminate()
+            p.join()
+            conn.close()
+            p_exit[wid] = p.exitcode
+
+        def worker_lost(wid):
+            # Died without reporting (segfault, OOM killer), retry its point once
+            nonlocal n_done
+            remove_worker(wid)
+            exitcode = p_exit[wid]
+            idx, t_start = in_flight.pop(wid, (None, None))
+            if idx is not None:
+                self._n_crashed += 1
+                if idx in retries:
+                    finish(idx, None, f"worker died (exit code {exitcode})", np.nan, np.nan, wid)
+                    n_done += 1
+                else:
+                    retries.add(idx)
+                    pending.appendleft(idx)
+            if pending:
+                start_worker()
+
+        for w in range(min(self.processes, len(tasks))):
+            start_worker()
+
+        n_done = 0
+        try:
+            while n_done < len(tasks):
+                conns = {conn: wid for wid, (p, conn) in workers.items()}
+                for conn in connection.wait(list(conns), timeout=1.0):
+                    wid = conns[conn]
+                    try:
+                        idx, payload, recycle = conn.recv()
+                    except (EOFError, OSError): # pipe closed with the worker
+                        worker_lost(wid)
+                        continue
+                    in_flight.pop(wid, None)
+                    finish(idx, *payload, wid)
+                    n_done += 1
+                    if recycle:
+                        self._n_recycled += 1
+                        remove_worker(wid)
+                        if pending:
+                            start_worker()
+                    else:
+                        dispatch(wid)
+
+                # Kill points over the time limit, the worker goes with it (no way to interrupt cantera mid step)
+                if self.timeout_s is not None:
+                    now = time.time()
+                    for t_wid, (t_idx, t_start) in list(in_flight.items()):
+                        if now - t_start > self.timeout_s:
+                            remove_worker(t_wid, kill=True)
+                            del in_flight[t_wid]
+                            self._n_timeouts += 1
+                            finish(t_idx, None, f"timeout after {self.timeout_s} s", np.nan, np.nan, t_wid, timeout=True)
+                            n_done += 1
+                            if pending:
+                                start_worker()
+        finally:
+            for wid, (p, conn) in list(workers.items()):
+                try:
+                    conn.send(None)
+                except OSError:
+                    pass
+            for wid, (p, conn) in list(workers.items()):
+                p.join(timeout=10)
+                if p.is_alive():
+                    p.terminate()
+                    p.join()
+                conn.close()
+
+    def _build_meta(self, n, wall_time):
+        delta = self._rss_after - self._rss_before
+        finite = np.isfinite(delta)
+        stats = lambda x: {"mean": float(np.mean(x)), "p95": float(np.percentile(x, 95)), "max": float(np.max(x))} if len(x) else {}
+        return {
+            "n_points": n,
+            "n_failed": len(self._errors),
+            "errors": dict(self._errors),
+            "processes": self.processes,
+            "max_rss_mb": self.max_rss_mb,
+            "max_tasks_per_worker": self.max_tasks_per_worker,
+            "n_workers_started": self._n_workers,
+            "n_recycled": self._n_recycled,
+            "n_crashed": self._n_crashed,
+            "n_timeouts": self._n_timeouts,
+            "timeout_s": self.timeout_s,
+            "wall_time": wall_time,
+            "rss_delta_per_point_mb": stats(delta[finite]), # growth of the worker over one point
+            "rss_after_point_mb": stats(self._rss_after[np.isfinite(self._rss_after)]),
+            "worker_peak_rss_mb": dict(self._worker_peak),
+            "rss_delta_mb": delta,
+            "rss_after_mb": self._rss_after,
+        }
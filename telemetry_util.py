@@ -0,0 +1,126 @@
+# Sweep telemetry, rate/ ETA/ failure counts/ worker utilization for runs in progress
+# Published to a status json rewritten every few seconds and optionally a local http endpoint
+# (watch with: watch -n 5 cat Data_Storage/<sweep>.status.json, or curl http://127.0.0.1:<port>/)
+import json
+import os
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class SweepTelemetry():
+    """
+    Fed by SweepRunner: point_started(wid) when a worker picks up a point, point_done(wid, ok, timeout) when it
+    finishes. Per point cost is a few clock reads and a deque append, the file is only rewritten every write_every s.
+    window: number of recent points for the rolling throughput
+    """
+    def __init__(self, n_total, status_path=None, write_every=5.0, window=50, http_port=None, n_workers=1, verbose=True):
+        self.n_total = n_total
+        self.status_path = status_path
+        self.write_every = write_every
+        self.n_workers = n_workers
+        self.verbose = verbose
+
+        self.t_start = time.time()
+        self.n_done = 0
+        self.n_failed = 0
+        self.n_timeouts = 0
+        self.last_point_s = None
+        self.busy_s = 0.0 # summed point time over all workers
+        self._running = {} # wid -> start time
+        self._recent = deque(maxlen=window) # finish times
+        self._t_write = 0.0
+        self._lock = threading.Lock()
+
+        self.server = None
+        if http_port is not None:
+            self.server = ThreadingHTTPServer(("127.0.0.1", http_port), self._handler())
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def point_started(self, wid):
+        with self._lock:
+            self._running[wid] = time.time()
+
+    def point_done(self, wid, ok=True, timeout=False):
+        now = time.time()
+        with self._lock:
+            t0 = self._running.pop(wid, None)
+            if t0 is not None:
+                self.last_point_s = now - t0
+                self.busy_s += self.last_point_s
+            self.n_done += 1
+            self.n_failed += not ok
+            self.n_timeouts += timeout
+            self._recent.append(now)
+        if now - self._t_write >= self.write_every:
+            self.write()
+
+    def status(self):
+        now = time.time()
+        with self._lock:
+            elapsed = now - self.t_start
+            rate = self.n_done / elapsed if elapsed > 0 else 0.0
+            # Rolling throughput over the last `window` points
+            if len(self._recent) > 1:
+                rolling = (len(self._recent) - 1) / max(self._recent[-1] - self._recent[0], 1e-9)
+            else:
+                rolling = rate
+            n_left = self.n_total - self.n_done
+            eta = n_left / rolling if rolling > 0 else None
+            busy = self.busy_s + sum(now - t0 for t0 in self._running.values())
+            return {
+                "n_total": self.n_total,
+                "n_done": self.n_done,
+                "n_failed": self.n_failed,
+                "n_timeouts": self.n_timeouts,
+                "fraction_done": self.n_done / self.n_total if self.n_total else 1.0,
+                "elapsed_s": elapsed,
+                "rate_per_s": rate,
+                "rolling_rate_per_s": rolling,
+                "mean_point_s": self.busy_s / self.n_done if self.n_done else None,
+                "last_point_s": self.last_point_s,
+                "eta_s": eta,
+                "eta_time": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now + eta)) if eta is not None else None,
+                "n_workers": self.n_workers,
+                "workers_busy": len(self._running),
+                "worker_utilization": busy / (elapsed * self.n_workers) if elapsed > 0 else 0.0,
+                "updated": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)),
+            }
+
+    def write(self):
+        self._t_write = time.time()
+        st = self.status()
+        if self.verbose:
+            eta_min = f"{st['eta_s']/60:.1f} min" if st["eta_s"] is not None else "-"
+            print(f"{st['n_done']}/{st['n_total']} points, {st['rolling_rate_per_s']:.2f} pts/s, "
+                  f"ETA {eta_min}, failed {st['n_failed']} (timeouts {st['n_timeouts']}), "
+                  f"utilization {100*st['worker_utilization']:.0f}%")
+        if self.status_path is not None:
+            # Write then rename so a reader never sees a half written file
+            tmp = self.status_path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump(st, f, indent=1)
+            os.replace(tmp, self.status_path)
+
+    def close(self):
+        self.write()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def _handler(self):
+        telemetry = self
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps(telemetry.status(), indent=1).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass # keep sweep output clean
+        return Handler
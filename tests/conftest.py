@@ -0,0 +1,23 @@
+# Modules live at the repo root (no package install), make them importable from the tests
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def design_point():
+    """
+    Default design (compute_main single run, lights at ~1720 K in the two zone model): (eng, diff_gas_out, diff_mdot_out)
+    """
+    import combustor_main as comb
+    from compute_main import default_diffuser, T_T3, P_T3, M_DOT_AIR
+    from engine_cfg import CombustorCfg, Engine
+    combustor = CombustorCfg(fuel_comp="C3H8:1", PR_b=0.95, n_b=0.98, primary_equivRatio=0.5, volume_b=0.0207*3,
+                             f_primary=0.3, v_frac_primary=0.6)
+    eng = Engine(T_t3=T_T3, P_t3=P_T3, m_dot_air=M_DOT_AIR, diffuser=default_diffuser(), combustor=combustor)
+    M_out, converged, diff_gas_out, diff_mdot_out = comb.run_diffuser(eng)
+    assert converged
+    return eng, diff_gas_out, diff_mdot_out
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+from combustor_main import compare_models
+from fnc_comb.help_fnc import InletState, calc_fuel_mdot
+
+
+def test_inlet_fuel_from_primary_air(design_point):
+    eng, diff_gas_out, diff_mdot_out = design_point
+    inlet = InletState(eng, diff_gas_out, diff_mdot_out)
+    c = eng.combustor
+    assert inlet.m_dot_fuel == pytest.approx(calc_fuel_mdot(c.f_primary * diff_mdot_out, c.primary_equivRatio))
+
+
+def test_compare_models_same_fuel_flow(design_point):
+    # Same fuel/ air in every model, so the outlet carries the same carbon whatever the zone layout
+    eng = design_point[0]
+    results = compare_models(eng)
+    carbon = {name: secondary.elemental_mass_fraction("C") for name, (primary, secondary) in results.items()}
+    assert np.allclose(list(carbon.values()), carbon["multi_flow_recirculation"], rtol=1e-2), carbon # single_flow is time marched (20 tau)
+
+
+def test_two_zone_split(design_point):
+    eng, diff_gas_out, diff_mdot_out = design_point
+    inlet = InletState(eng, diff_gas_out, diff_mdot_out)
+    c = eng.combustor
+    m_dot_air_primary, m_dot_fuel, m_dot_air_secondary, v_primary, v_secondary = inlet.two_zone_split(c)
+    assert m_dot_air_primary == pytest.approx(c.f_primary * diff_mdot_out)
+    assert m_dot_air_primary + m_dot_air_secondary == pytest.approx(diff_mdot_out)
+    assert m_dot_fuel == inlet.m_dot_fuel
+    assert v_primary == pytest.approx(c.v_frac_primary * c.volume_b)
+    assert v_primary + v_secondary == pytest.approx(c.volume_b)
@@ -0,0 +1,73 @@
+import pytest
+from engine_cycle import EngineCycle, Stage
+
+
+def counting_stage(name, inputs=(), upstream=(), max_cache=128):
+    # Output records the inputs/ upstream outputs it was built from, calls counted on the stage (n_runs)
+    def fnc(params, upstream_outputs):
+        return (name, tuple(sorted(params.items())), tuple(sorted(upstream_outputs.items())))
+    return Stage(name, fnc, inputs=inputs, upstream=upstream, max_cache=max_cache)
+
+
+def test_stage_lru_evicts_least_recently_used():
+    stage = counting_stage("s", inputs=("x",), max_cache=2)
+    stage.run({"x": 1}, {}, {})
+    stage.run({"x": 2}, {}, {})
+    stage.run({"x": 1}, {}, {}) # hit, x=1 now most recent
+    stage.run({"x": 3}, {}, {}) # evicts x=2
+    assert (stage.n_runs, stage.n_hits) == (3, 1)
+    assert len(stage.cache) == 2
+
+    stage.run({"x": 1}, {}, {})
+    assert stage.n_runs == 3
+    stage.run({"x": 2}, {}, {})
+    assert stage.n_runs == 4
+
+
+def test_cycle_only_reruns_stages_downstream_of_a_change():
+    cycle = EngineCycle()
+    cycle.add_stage(counting_stage("a", inputs=("x",)))
+    cycle.add_stage(counting_stage("b", inputs=("y",), upstream=("a",)))
+    cycle.add_stage(counting_stage("c", upstream=("b",)))
+
+    cycle.run(x=1, y=1)
+    cycle.run(x=1, y=2) # a cached, b and c rerun
+    assert cycle.stats() == {"a": {"runs": 1, "hits": 1}, "b": {"runs": 2, "hits": 0}, "c": {"runs": 2, "hits": 0}}
+
+    out = cycle.run(x=2, y=2) # upstream change invalidates everything below it
+    assert cycle.stats()["b"]["runs"] == 3
+    assert cycle.stats()["c"]["runs"] == 3
+    assert out["b"][2] == (("a", out["a"]),)
+
+    cycle.run(x=1, y=1) # still in every stage cache
+    assert {name: s["runs"] for name, s in cycle.stats().items()} == {"a": 2, "b": 3, "c": 3}
+
+
+def test_cycle_clear_forces_rerun():
+    cycle = EngineCycle()
+    stage = cycle.add_stage(counting_stage("a", inputs=("x",)))
+    cycle.run(x=1)
+    cycle.clear()
+    cycle.run(x=1)
+    assert stage.n_runs == 2
+
+
+def test_dataclass_and_dict_inputs_key_by_value():
+    from engine_cfg import CombustorCfg
+    stage = counting_stage("s", inputs=("combustor", "opts"))
+    cfg = dict(fuel_comp="C3H8:1", PR_b=0.95, n_b=0.98, primary_equivRatio=0.5, volume_b=0.06, f_primary=0.3,
+               v_frac_primary=0.6)
+    stage.run({"combustor": CombustorCfg(**cfg), "opts": {"b": [1, 2], "a": 1}}, {}, {})
+    stage.run({"combustor": CombustorCfg(**cfg), "opts": {"a": 1, "b": [1, 2]}}, {}, {})
+    assert (stage.n_runs, stage.n_hits) == (1, 1)
+    stage.run({"combustor": CombustorCfg(**{**cfg, "f_primary": 0.4}), "opts": {"a": 1, "b": [1, 2]}}, {}, {})
+    assert stage.n_runs == 2
+
+
+def test_cycle_checks_stage_order_and_inputs():
+    cycle = EngineCycle()
+    with pytest.raises(ValueError):
+        cycle.add_stage(counting_stage("b", upstream=("a",)))
+    cycle.add_stage(counting_stage("a", inputs=("x",)))
+    with pytest.raises(KeyError):
+        cycle.run(y=1)
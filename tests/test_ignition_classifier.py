@@ -0,0 +1,45 @@
+import cantera as ct
+import pytest
+from fnc_comb import classify_network, ignition_score
+
+
+def network(T, X):
+    gas = ct.Solution("gri30.yaml")
+    gas.TPX = T, 4e5, X
+    r = ct.IdealGasReactor(gas)
+    return ct.ReactorNet([r]), r, gas.species_index("C3H8")
+
+
+def test_ignition_score():
+    assert ignition_score(1500.0, 1e-6) == pytest.approx(0.5) # T limited
+    assert ignition_score(2500.0, 1e-4) == pytest.approx(1.0) # fuel limited, decades below fuel_max
+    assert ignition_score(900.0, 1e-6) < 0
+    assert ignition_score(1500.0, 1e-2) < 0
+
+
+def test_classify_network_ignited():
+    # Burned lean products, hot, no fuel left and T flat
+    gas = ct.Solution("gri30.yaml")
+    gas.TPX = 800.0, 4e5, "C3H8:1, O2:10, N2:37.6"
+    gas.equilibrate("HP")
+    net, r, i_fuel = network(gas.T, gas.X)
+    decided, t = classify_network(net, r, 1e-3, i_fuel)
+    assert decided == "ignited"
+    assert t == pytest.approx(2 * 0.5e-3) # settled at the first n_hold checks
+
+
+def test_classify_network_extinguished():
+    # Cold fuel/ air mixture, never lights
+    net, r, i_fuel = network(400.0, "C3H8:1, O2:10, N2:37.6")
+    decided, t = classify_network(net, r, 1e-3, i_fuel)
+    assert decided == "extinguished"
+    assert t == pytest.approx(2 * 0.5e-3)
+
+
+def test_classify_network_undecided_runs_to_steady_state():
+    # Cold but too little fuel for "extinguished": neither criterion holds, falls through to advance_to_steady_state
+    net, r, i_fuel = network(400.0, "C3H8:0.002, O2:0.21, N2:0.79")
+    r.chemistry_enabled = False
+    decided, t = classify_network(net, r, 1e-3, i_fuel, t_max=2.0)
+    assert decided == "steady"
+    assert t > 2.0 * 1e-3
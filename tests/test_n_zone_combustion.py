@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+from fnc_comb import n_zone_combustion, n_zone_layout
+
+
+def test_layout_fuel_follows_primary_air(design_point):
+    eng = design_point[0]
+    zones, recirc = n_zone_layout(eng.combustor, n_zones=6, recirc_frac=0.3)
+    primary = zones[:3]
+    # Every primary zone at the design primary equivalence ratio: fuel share = its share of the primary air
+    assert [z.fuel_frac / (z.air_frac / eng.combustor.f_primary) for z in primary] == pytest.approx([1.0] * 3)
+    assert all(z.fuel_frac == 0 for z in zones[3:])
+    assert sum(z.air_frac for z in zones) == pytest.approx(1.0)
+    assert sum(z.v_frac for z in zones) == pytest.approx(1.0)
+    assert [(r.from_zone, r.to_zone) for r in recirc] == [(2, 0)]
+
+
+def test_layout_rejects_recirc_without_primary_zones(design_point):
+    with pytest.raises(ValueError):
+        n_zone_layout(design_point[0].combustor, n_zones=3, recirc_frac=0.3)
+
+
+def test_four_zones_light_like_two_zone(design_point):
+    eng, diff_gas_out, diff_mdot_out = design_point
+    two = n_zone_combustion(eng, diff_gas_out, diff_mdot_out, n_zones=2)
+    four = n_zone_combustion(eng, diff_gas_out, diff_mdot_out, n_zones=4, recirc_frac=0.3, return_zones=True)
+    assert two[0].T > 1500
+    for gas in four[:2]:
+        assert np.isclose(gas.T, two[0].T, rtol=0.02)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from post_util import SpeciesData, combustion_efficiency, emission_indices
+
+
+SPECIES = ["C3H8", "CO", "CO2", "CH4", "NO", "H2", "H2O", "O2", "N2"]
+
+
+@pytest.fixture(scope="module")
+def sd():
+    return SpeciesData(SPECIES)
+
+
+def mass_fractions(sd, X):
+    # Mole fractions {species: X} -> Y over sd.species_names
+    x = np.array([X.get(sp, 0.0) for sp in sd.species_names])
+    return x * sd.MW / np.sum(x * sd.MW)
+
+
+def test_emission_indices_carbon_balance(sd):
+    # Carbon in every carbon species adds up to the carbon in the fuel: sum EI_k n_C,k/ MW_k = 1000 n_C,fuel/ MW_fuel
+    rng = np.random.default_rng(0)
+    Y = rng.random((5, 3, len(SPECIES)))
+    Y /= Y.sum(axis=-1, keepdims=True)
+    carbon_species = [sp for sp in SPECIES if sd.n_C[sd.index(sp)] > 0]
+    EI = emission_indices(Y, sd, species=carbon_species)
+    assert EI["CO"].shape == (5, 3)
+    carbon = sum(EI[sp] * sd.n_C[sd.index(sp)] / sd.MW[sd.index(sp)] for sp in carbon_species)
+    i_fuel = sd.index("C3H8")
+    assert np.allclose(carbon, 1000.0 * sd.n_C[i_fuel] / sd.MW[i_fuel])
+
+
+def test_emission_indices_limits(sd):
+    # All carbon still in the fuel: EI_fuel = 1000 g/kg, all as CO2: 3 MW_CO2/ MW_C3H8 per g of fuel
+    EI = emission_indices(mass_fractions(sd, {"C3H8": 0.04, "N2": 0.96}), sd, species=("C3H8", "CO"))
+    assert EI["C3H8"] == pytest.approx(1000.0)
+    assert EI["CO"] == 0.0
+    EI = emission_indices(mass_fractions(sd, {"CO2": 0.1, "H2O": 0.13, "N2": 0.77}), sd, species=("CO2", "C3H8"))
+    assert EI["CO2"] == pytest.approx(3 * sd.MW[sd.index("CO2")] / sd.MW[sd.index("C3H8")] * 1000.0)
+    assert EI["C3H8"] == 0.0
+
+
+def test_combustion_efficiency(sd):
+    assert combustion_efficiency(mass_fractions(sd, {"CO2": 0.1, "H2O": 0.13, "N2": 0.77}), sd) == pytest.approx(1.0)
+    assert combustion_efficiency(mass_fractions(sd, {"C3H8": 0.04, "N2": 0.96}), sd) == pytest.approx(0.0)
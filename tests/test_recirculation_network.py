@@ -0,0 +1,22 @@
+import copy
+from dataclasses import replace
+
+import numpy as np
+from fnc_comb import multi_flow_recirculation_combustion
+
+
+def test_reused_network_matches_fresh_build(design_point):
+    eng, diff_gas_out, diff_mdot_out = design_point
+    other = copy.copy(eng)
+    other.combustor = replace(eng.combustor, f_primary=0.5, v_frac_primary=0.3, volume_b=0.03)
+
+    fresh = multi_flow_recirculation_combustion(eng, diff_gas_out, diff_mdot_out, reuse_network=False)
+    # Shared network left in another point's state first
+    multi_flow_recirculation_combustion(other, diff_gas_out, diff_mdot_out)
+    reused = multi_flow_recirculation_combustion(eng, diff_gas_out, diff_mdot_out)
+
+    assert fresh[0].T > 1500 # lit, not two matching cold solutions
+    for gas_fresh, gas_reused in zip(fresh, reused):
+        assert np.isclose(gas_reused.T, gas_fresh.T, rtol=1e-6)
+        assert np.isclose(gas_reused.P, gas_fresh.P, rtol=1e-6)
+        assert np.allclose(gas_reused.Y, gas_fresh.Y, rtol=1e-4, atol=1e-10)
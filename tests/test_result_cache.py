@@ -0,0 +1,118 @@
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+from sweep_runner import SweepRunner
+from result_cache import ResultCache, code_version, parse_match, point_key
+
+
+@dataclass
+class _Zone:
+    f: float
+    v_frac: float
+
+
+def config(**changes):
+    cfg = {"T_t3": 500.0, "P_t3": 4e5, "m_dot_air": 1.0, "combustor": {"f_primary": 0.3}, "model": "two_zone",
+           "model_kwargs": {"solver": "dense"}, "code_version": code_version()}
+    cfg.update(changes)
+    return cfg
+
+
+def test_point_key_canonical():
+    assert point_key(config()) == point_key(dict(reversed(list(config().items()))))
+    assert point_key(config()) != point_key(config(T_t3=500.0001))
+    assert point_key(config(model_kwargs={"x": np.float64(1.5)})) == point_key(config(model_kwargs={"x": 1.5}))
+
+
+def test_point_key_dataclass_kwargs():
+    key = point_key(config(model_kwargs={"zones": [_Zone(0.3, 0.6), _Zone(0.7, 0.4)]}))
+    assert key == point_key(config(model_kwargs={"zones": [_Zone(0.3, 0.6), _Zone(0.7, 0.4)]}))
+    assert key != point_key(config(model_kwargs={"zones": [_Zone(0.3, 0.6), _Zone(0.7, 0.5)]}))
+
+
+def test_parse_match_typed_values():
+    assert parse_match(["combustor.f_primary=0.3", "solver=sparse", "flag=true"]) == \
+        {"combustor.f_primary": 0.3, "solver": "sparse", "flag": True}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(str(tmp_path), max_mb=1.0)
+
+
+def put(cache, cfg):
+    key = point_key(cfg)
+    cache.put(key, cfg, None, None)
+    return key
+
+
+def test_get_put_roundtrip(cache):
+    key = put(cache, config())
+    assert cache.get(key) == (None, None)
+    assert cache.get(point_key(config(T_t3=600.0))) is None
+    assert (cache.n_hits, cache.n_misses) == (1, 1)
+
+
+def test_evict_oldest_first(cache):
+    keys = [put(cache, config(T_t3=500.0 + i)) for i in range(4)]
+    for i, key in enumerate(keys):
+        os.utime(cache._file(key), (1000 + i, 1000 + i))
+    os.utime(cache._file(keys[0])) # touched (like a hit), now newest
+    size = os.path.getsize(cache._file(keys[0]))
+
+    cache.evict(max_bytes=2*size)
+    assert cache.n_evicted == 2
+    assert [cache.get(k) is not None for k in keys] == [True, False, False, True]
+    assert cache.total_bytes == sum(os.path.getsize(p) for p in cache._entries())
+
+
+def test_put_over_bound_evicts(tmp_path):
+    cache = ResultCache(str(tmp_path), max_mb=1e-6) # smaller than one entry
+    put(cache, config())
+    assert cache.stats()["entries"] == 0
+    assert cache.n_evicted == 1
+
+
+def test_invalidate_stale_and_match(cache):
+    put(cache, config())
+    put(cache, config(code_version="old"))
+    assert cache.invalidate(stale=True) == 1
+    assert cache.stats()["entries"] == 1
+
+    put(cache, config(combustor={"f_primary": 0.4}))
+    assert cache.invalidate(match={"combustor.f_primary": 0.5}) == 0
+    assert cache.invalidate(match=parse_match(["combustor.f_primary=0.4"])) == 1
+    assert cache.invalidate() == 1
+    assert cache.total_bytes == 0
+
+
+def put_task(task):
+    cache, i = task
+    put(cache, config(T_t3=500.0 + i))
+
+
+def test_size_bound_with_workers(tmp_path):
+    # Every worker gets its own copy of the cache, the bound still holds for what they write together
+    cache = ResultCache(str(tmp_path), max_mb=1.0)
+    size = os.path.getsize(cache._file(put(cache, config(T_t3=0.0))))
+    cache.invalidate()
+    cache.max_bytes = 6.5 * size
+
+    runner = SweepRunner(put_task, processes=2)
+    runner.run([(cache, i) for i in range(40)])
+    assert runner.meta["n_failed"] == 0
+    assert len(cache._entries()) <= 6 + 2 # at most one put in flight per worker over the bound
+    cache.evict()
+    assert len(cache._entries()) == 6
+    assert cache.total_bytes == 6 * size
+
+
+def test_evict_skips_entries_removed_elsewhere(cache):
+    keys = [put(cache, config(T_t3=500.0 + i)) for i in range(3)]
+    other = ResultCache(cache.path) # second process view, removes an entry behind this one's back
+    os.remove(other._file(keys[0]))
+    cache.evict(max_bytes=0)
+    assert cache._entries() == []
+    assert cache.total_bytes == 0
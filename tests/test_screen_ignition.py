@@ -0,0 +1,22 @@
+import pytest
+from fnc_comb.screen_ignition import screen_error_rates
+
+
+def test_screen_error_rates():
+    decisions = ["no_ignite", "no_ignite", "no_ignite", "ignite", "ignite", "ambiguous", "ambiguous", "ambiguous"]
+    ignited = [False, False, True, True, False, True, False, True]
+    rates = screen_error_rates(decisions, ignited)
+    assert rates["n"] == 8
+    assert (rates["n_no_ignite"], rates["n_ignite"], rates["n_ambiguous"]) == (3, 2, 3)
+    assert (rates["false_no_ignite"], rates["false_ignite"]) == (1, 1)
+    assert rates["false_no_ignite_rate"] == pytest.approx(1/3)
+    assert rates["false_ignite_rate"] == pytest.approx(1/2)
+    assert rates["screened_fraction"] == pytest.approx(5/8)
+
+
+def test_screen_error_rates_no_confident_decisions():
+    rates = screen_error_rates(["ambiguous", "no_diffuser"], [True, False])
+    assert (rates["n_no_ignite"], rates["n_ignite"], rates["n_ambiguous"]) == (0, 0, 1)
+    assert rates["false_no_ignite_rate"] == rates["false_ignite_rate"] == 0.0
+    assert rates["screened_fraction"] == 0.0
+    assert screen_error_rates([], [])["screened_fraction"] == 0.0
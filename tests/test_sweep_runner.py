@@ -0,0 +1,82 @@
+import os
+import time
+
+from sweep_runner import SweepRunner
+
+
+def square(x):
+    return x * x
+
+def fail_odd(x):
+    if x % 2:
+        raise ValueError(x)
+    return x
+
+def crash_once(task):
+    # Dies without reporting the first time it sees a task (marker file), returns on the retry
+    x, marker = task
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        os._exit(1)
+    return x
+
+def crash(x):
+    os._exit(1)
+
+def sleep_on_negative(x):
+    if x < 0:
+        time.sleep(60)
+    return x
+
+
+def test_in_process_errors_recorded():
+    runner = SweepRunner(fail_odd)
+    assert runner.run(range(4)) == [0, None, 2, None]
+    assert runner.meta["n_failed"] == 2
+    assert set(runner.meta["errors"]) == {1, 3}
+
+
+def test_workers_results_in_task_order_with_callback():
+    done = {}
+    runner = SweepRunner(square, processes=2)
+    assert runner.run(range(10), callback=done.__setitem__) == [x * x for x in range(10)]
+    assert done == {x: x * x for x in range(10)}
+    assert runner.meta["n_workers_started"] == 2
+
+
+def test_recycle_on_task_count():
+    runner = SweepRunner(square, processes=1, max_tasks_per_worker=2)
+    assert runner.run(range(5)) == [x * x for x in range(5)]
+    assert runner.meta["n_recycled"] == 2
+    assert runner.meta["n_workers_started"] == 3
+
+
+def test_recycle_on_rss_watermark():
+    runner = SweepRunner(square, processes=2, max_rss_mb=1e-3) # every point crosses it
+    assert runner.run(range(4)) == [x * x for x in range(4)]
+    assert runner.meta["n_recycled"] == 4
+    assert runner.meta["n_failed"] == 0
+
+
+def test_crashed_worker_retried_once(tmp_path):
+    tasks = [(x, str(tmp_path / f"marker_{x}")) for x in range(3)]
+    runner = SweepRunner(crash_once, processes=2)
+    assert runner.run(tasks) == [0, 1, 2]
+    assert runner.meta["n_crashed"] == 3
+    assert runner.meta["n_failed"] == 0
+
+
+def test_crash_on_retry_recorded_as_failed():
+    runner = SweepRunner(crash, processes=1)
+    assert runner.run([1]) == [None]
+    assert runner.meta["n_crashed"] == 2
+    assert "worker died" in runner.meta["errors"][0]
+
+
+def test_timeout_kills_point_only():
+    runner = SweepRunner(sleep_on_negative, processes=2, timeout_s=0.5)
+    t0 = time.time()
+    assert runner.run([1, -1, 2, 3]) == [1, None, 2, 3]
+    assert time.time() - t0 < 30
+    assert runner.meta["n_timeouts"] == 1
+    assert "timeout" in runner.meta["errors"][1]
@@ -0,0 +1,60 @@
+import json
+
+import pytest
+import telemetry_util
+from telemetry_util import SweepTelemetry
+
+
+class Clock():
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(telemetry_util.time, "time", clock)
+    return clock
+
+
+def test_status_rate_and_eta(clock):
+    tel = SweepTelemetry(10, write_every=1e9, window=3, n_workers=2, verbose=False)
+    # Two workers, 2 s per point, then a 4th point taking 6 s (rolling rate only sees the last window)
+    for t_start, t_end, wid in ((0, 2, 0), (0, 2, 1), (2, 4, 0), (4, 10, 0)):
+        clock.now = 1000.0 + t_start
+        tel.point_started(wid)
+        clock.now = 1000.0 + t_end
+        tel.point_done(wid, ok=t_end != 10)
+
+    st = tel.status()
+    assert st["n_done"] == 4
+    assert st["n_failed"] == 1
+    assert st["fraction_done"] == pytest.approx(0.4)
+    assert st["elapsed_s"] == pytest.approx(10.0)
+    assert st["rate_per_s"] == pytest.approx(0.4)
+    assert st["rolling_rate_per_s"] == pytest.approx(2 / 8) # 3 finishes at 2, 4, 10 s
+    assert st["eta_s"] == pytest.approx(6 / 0.25)
+    assert st["mean_point_s"] == pytest.approx(12 / 4)
+    assert st["last_point_s"] == pytest.approx(6.0)
+    assert st["worker_utilization"] == pytest.approx(12 / 20)
+
+
+def test_status_counts_running_points_and_done(clock, tmp_path):
+    path = str(tmp_path / "sweep.status.json")
+    tel = SweepTelemetry(1, status_path=path, write_every=1e9, n_workers=1, verbose=False)
+    assert tel.status()["eta_s"] is None # nothing done yet
+    tel.point_started(0)
+    clock.now += 5.0
+    assert tel.status()["workers_busy"] == 1
+    assert tel.status()["worker_utilization"] == pytest.approx(1.0)
+    tel.point_done(0, ok=False, timeout=True)
+    tel.close()
+
+    with open(path) as f:
+        st = json.load(f)
+    assert (st["n_done"], st["n_failed"], st["n_timeouts"]) == (1, 1, 1)
+    assert st["fraction_done"] == 1.0
+    assert st["eta_s"] == 0.0
@@ -0,0 +1,30 @@
+import numpy as np
+from throttle_schedule import OperatingPoint, operability_map
+
+
+OPS = [OperatingPoint(f"op{o}", 500.0, 4e5, 1.0) for o in range(3)]
+
+
+def test_operability_map():
+    lit = np.array([[True, True, True], [True, False, False], [False, False, False]])
+    margin = np.array([[0.5, 0.2, 0.3], [0.4, 0.1, np.nan], [np.nan, np.nan, np.nan]])
+    solved = np.array([[True, True, True], [True, True, False], [False, False, False]])
+    maps = operability_map(["d0", "d1", "d2"], OPS, lit, margin, solved)
+
+    assert [m["design"] for m in maps] == ["d0", "d1", "d2"]
+    assert maps[0]["status"] == {"op0": "lit", "op1": "lit", "op2": "lit"}
+    assert maps[0]["operable"]
+    assert maps[0]["n_lit"] == 3
+    assert maps[0]["min_margin"] == 0.2
+    assert maps[0]["blowout_points"] == []
+
+    assert maps[1]["status"] == {"op0": "lit", "op1": "blowout", "op2": "failed"}
+    assert not maps[1]["operable"]
+    assert maps[1]["n_lit"] == 1
+    assert maps[1]["min_margin"] == -0.1 # blowout margins count negative
+    assert maps[1]["blowout_points"] == ["op1"]
+
+    # Nothing solved: failed everywhere, no margin
+    assert set(maps[2]["status"].values()) == {"failed"}
+    assert not maps[2]["operable"]
+    assert np.isnan(maps[2]["min_margin"])
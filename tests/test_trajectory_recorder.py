@@ -0,0 +1,84 @@
+import cantera as ct
+import numpy as np
+from fnc_comb import TrajectoryRecorder, advance_recorded, load_trajectory
+
+
+def reactor(T):
+    gas = ct.Solution("gri30.yaml")
+    gas.TPX = T, ct.one_atm, "C3H8:1, O2:5, N2:18.8"
+    return ct.IdealGasReactor(gas)
+
+
+def test_recorder_roundtrip(tmp_path):
+    path = str(tmp_path / "traj")
+    expected = []
+    with TrajectoryRecorder(path, species=("C3H8", "CO2"), capacity=8) as rec: # small buffer, several flushes
+        for k, T in enumerate((1400.0, 1500.0)):
+            r1, r2 = reactor(T), reactor(300.0)
+            net = ct.ReactorNet([r1, r2])
+            assert rec.start_point({"T0": T}) == k
+            advance_recorded(net, 1e-3, [r1, r2], rec, n_out=20)
+            expected.append((net.time, r1.T, r1.thermo["CO2"].X[0]))
+        assert rec.n_rows > 0
+
+    d = load_trajectory(path)
+    assert d["points"] == [{"T0": 1400.0}, {"T0": 1500.0}]
+    assert d["attempts"] == [1, 1]
+    assert set(d["attempt"]) == {0}
+    assert len(d["t"]) == 2 * 2 * 21 # every output kept, 2 reactors, 2 points
+    for k, (t, T, X_CO2) in enumerate(expected):
+        rows = (d["point"] == k) & (d["reactor"] == 0)
+        assert np.all(np.diff(d["t"][rows]) >= 0)
+        assert np.isclose(d["t"][rows][-1], t, rtol=1e-6)
+        assert np.isclose(d["T"][rows][-1], T, rtol=1e-6) # float32 storage
+        assert np.isclose(d["X_CO2"][rows][-1], X_CO2, rtol=1e-5)
+        assert np.all(d["T"][(d["point"] == k) & (d["reactor"] == 1)] < 400) # cold reactor stays cold
+
+
+def test_point_info_streamed(tmp_path):
+    # Point info goes to disk as points start, nothing kept per point in memory, readable before close()
+    path = str(tmp_path / "traj")
+    rec = TrajectoryRecorder(path, capacity=4)
+    for k in range(50):
+        rec.start_point({"k": k})
+    assert not hasattr(rec, "points")
+    assert load_trajectory(path)["points"] == [{"k": k} for k in range(50)]
+    rec.close()
+
+
+def test_retry_keeps_point_index(tmp_path):
+    path = str(tmp_path / "traj")
+    r = reactor(1500.0)
+    with TrajectoryRecorder(path) as rec:
+        assert rec.start_point({"solver": "sparse"}) == 0
+        rec.sample(0.0, [r], force=True)
+        assert rec.start_point({"solver": "dense"}, retry=True) == 0
+        rec.sample(0.0, [r], force=True)
+        rec.sample(1e-3, [r], force=True)
+        assert rec.start_point({"solver": "dense"}) == 1
+
+    d = load_trajectory(path)
+    assert d["points"] == [{"solver": "dense"}, {"solver": "dense"}]
+    assert d["attempts"] == [2, 1]
+    assert list(d["attempt"][d["point"] == 0]) == [0, 1, 1]
+
+
+def test_sparse_fallback_recorded_as_one_point(design_point, tmp_path, monkeypatch):
+    # GMRES stall on the sparse network -> dense redo of the same point, still one recorded point
+    import fnc_comb.recirculation_network as rn
+    from fnc_comb import multi_flow_recirculation_combustion
+    recorded = rn.advance_to_steady_state_recorded
+    def stall(network, reactors, recorder):
+        if isinstance(reactors[0], ct.IdealGasMoleReactor):
+            raise NameError("max steps")
+        return recorded(network, reactors, recorder)
+    monkeypatch.setattr(rn, "advance_to_steady_state_recorded", stall)
+
+    path = str(tmp_path / "traj")
+    with TrajectoryRecorder(path) as rec:
+        multi_flow_recirculation_combustion(*design_point, solver="sparse", recorder=rec)
+    d = load_trajectory(path)
+    assert len(d["points"]) == 1
+    assert d["points"][0]["solver"] == "dense"
+    assert d["attempts"] == [2]
+    assert set(d["point"]) == {0}
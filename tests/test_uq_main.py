@@ -0,0 +1,56 @@
+import cantera as ct
+import numpy as np
+import pytest
+import uq_main
+from uq_main import lhs_samples, wilson_interval
+
+
+def test_wilson_interval():
+    assert wilson_interval(0, 0, 1.96) == (0.0, 1.0)
+    lo, hi = wilson_interval(5, 10, 1.96)
+    assert lo == pytest.approx(0.2366, abs=1e-4)
+    assert hi == pytest.approx(0.7634, abs=1e-4)
+
+    # Stays inside [0, 1] and is not degenerate at k = 0/ n
+    lo, hi = wilson_interval(0, 20, 1.96)
+    assert lo == pytest.approx(0.0, abs=1e-12)
+    assert 0 < hi < 1
+    lo, hi = wilson_interval(20, 20, 1.96)
+    assert 0 < lo < 1
+    assert hi == pytest.approx(1.0)
+
+    # Symmetric in k <-> n - k, narrows with n
+    lo, hi = wilson_interval(3, 20, 1.96)
+    assert wilson_interval(17, 20, 1.96) == pytest.approx((1 - hi, 1 - lo))
+    lo2, hi2 = wilson_interval(30, 200, 1.96)
+    assert hi2 - lo2 < hi - lo
+
+
+def test_lhs_one_sample_per_stratum():
+    n, d = 16, 4
+    u = lhs_samples(n, d, np.random.default_rng(0))
+    assert u.shape == (n, d)
+    assert np.all((u >= 0) & (u < 1))
+    for c in range(d):
+        assert sorted(np.floor(u[:, c] * n).astype(int)) == list(range(n))
+    # Strata shuffled independently per dimension
+    assert not np.array_equal(np.argsort(u[:, 0]), np.argsort(u[:, 1]))
+
+
+def test_lhs_seeded():
+    a = lhs_samples(8, 2, np.random.default_rng(1))
+    b = lhs_samples(8, 2, np.random.default_rng(1))
+    assert np.array_equal(a, b)
+
+
+@pytest.mark.parametrize("error", [NameError("max steps"), ct.CanteraError("CVodes error")])
+def test_uq_point_records_solver_failures(design_point, monkeypatch, error):
+    # Non converged steady state is a recorded failed sample, not an exception out of pool.map
+    eng = design_point[0]
+    def fail(*args, **kwargs):
+        raise error
+    monkeypatch.setattr(uq_main, "run_combustor_model", fail)
+    task = (eng.diffuser, eng.combustor, eng.T_t3, eng.P_t3, eng.m_dot_air, 3, {"PR_b": 0.95}, uq_main.DEFAULT_MODEL, {})
+    outputs, err = uq_main._uq_point(task)
+    assert np.all(np.isnan(outputs))
+    assert err.startswith(type(error).__name__)
@@ -0,0 +1,213 @@
+# Throttle schedule batch mode, combustor designs x engine operating points, headless (no plotting imports)
+# Answers whether each design lights at every point of the throttle schedule: diffuser + inlet states are
+# computed once per operating point (per worker) and shared by every design, the design x operating point
+# matrix runs on SweepRunner workers, output is an operability map (lit/ blowout/ failed per point) per design
+import argparse
+import csv
+import itertools
+from dataclasses import astuple, dataclass, fields, replace
+
+import numpy as np
+import combustor_main as comb
+from engine_cfg import CombustorCfg, Engine
+from compute_main import default_diffuser, _run_points, T_T3, P_T3, M_DOT_AIR
+from pickle_util import save
+from fnc_comb import DEFAULT_MODEL, run_combustor_model, classify_ignition, ignition_score
+from fnc_comb.help_fnc import InletState
+
+
+@dataclass
+class OperatingPoint:
+    name: str
+    T_t3: float # compressor outlet total temperature [K]
+    P_t3: float # compressor outlet total pressure [Pa]
+    m_dot_air: float # [kg/s]
+
+
+def example_schedule(throttles=(0.4, 0.6, 0.8, 1.0), T_amb=288.15, P_amb=101325.0):
+    """
+    Placeholder schedule until the compressor map is converted from matlab: each throttle setting linearly
+    between ambient (0) and the default design point (1, T_T3/ P_T3/ M_DOT_AIR)
+    """
+    return [OperatingPoint(f"throttle_{t:.2f}", T_amb + t * (T_T3 - T_amb), P_amb + t * (P_T3 - P_amb), t * M_DOT_AIR)
+            for t in throttles]
+
+
+def load_schedule(path):
+    # csv with header name,T_t3,P_t3,m_dot_air (one row per operating point)
+    with open(path, newline="") as f:
+        return [OperatingPoint(row["name"], float(row["T_t3"]), float(row["P_t3"]), float(row["m_dot_air"]))
+                for row in csv.DictReader(f)]
+
+
+def load_designs(path, base=None):
+    """
+    csv with a header of CombustorCfg field names (one row per design), missing columns taken from base
+    (default: the usual C3H8 design, PR_b = 0.95, n_b = 0.98, primary_equivRatio = 0.5)
+    """
+    if base is None:
+        base = CombustorCfg(fuel_comp="C3H8:1", PR_b=0.95, n_b=0.98, primary_equivRatio=0.5,
+                            volume_b=0.0207*3, f_primary=0.3, v_frac_primary=0.6)
+    types = {f.name: f.type for f in fields(CombustorCfg)}
+    with open(path, newline="") as f:
+        return [replace(base, **{k: (v if types[k] is str else float(v)) for k, v in row.items()})
+                for row in csv.DictReader(f)]
+
+
+# Per process cache of operating point work shared by all designs:
+# (op, diffuser) -> diffuser outputs, (op, diffuser, PR_b, fuel_comp, f_primary, primary_equivRatio) -> InletState
+_op_cache = {}
+
+def _op_inlet(op, diffuser, combustor):
+    diff_key = (op.T_t3, op.P_t3, op.m_dot_air) + astuple(diffuser)
+    if diff_key not in _op_cache:
+        eng = Engine(T_t3=op.T_t3, P_t3=op.P_t3, m_dot_air=op.m_dot_air, diffuser=diffuser, combustor=None)
+        M_out, converged, diff_gas_out, diff_mdot_out = comb.run_diffuser(eng)
+        _op_cache[diff_key] = (converged, diff_gas_out, diff_mdot_out)
+    converged, diff_gas_out, diff_mdot_out = _op_cache[diff_key]
+    if not converged:
+        return None
+
+    eng = Engine(T_t3=op.T_t3, P_t3=op.P_t3, m_dot_air=op.m_dot_air, diffuser=diffuser, combustor=combustor)
+    inlet_key = diff_key + (combustor.PR_b, combustor.fuel_comp, combustor.f_primary, combustor.primary_equivRatio)
+    if inlet_key not in _op_cache:
+        # InletState reads PR_b/ fuel_comp and the fuel flow inputs from the combustor, designs differing only in
+        # volumes share it
+        _op_cache[inlet_key] = InletState(eng, diff_gas_out, diff_mdot_out)
+    return eng, diff_gas_out, diff_mdot_out, _op_cache[inlet_key]
+
+
+def _schedule_point(task):
+    # One design at one operating point, runs in a SweepRunner worker, returns plain values only
+    op, diffuser, combustor, mode, T_ignite, fuel_max, model, model_kwargs = task
+    shared = _op_inlet(op, diffuser, combustor)
+    if shared is None:
+        return None
+    eng, diff_gas_out, diff_mdot_out, inlet = shared
+
+    if mode == "classify":
+        res = classify_ignition(eng, diff_gas_out, diff_mdot_out, inlet=inlet, T_ignite=T_ignite, fuel_max=fuel_max,
+                                **model_kwargs)
+        T, P, Y = res.primary_state
+        return (res.ignited, res.margin, T, np.nan)
+
+    primary_gas_out, secondary_gas_out = run_combustor_model(model, eng, diff_gas_out, diff_mdot_out, inlet=inlet,
+                                                             **model_kwargs)
+    X_fuel = primary_gas_out.X[primary_gas_out.species_index(inlet.fuel_X.split(":")[0])]
+    score = ignition_score(primary_gas_out.T, X_fuel, T_ignite, fuel_max) # same margin as classify mode
+    return (score >= 0, abs(score), primary_gas_out.T, secondary_gas_out.T)
+
+
+def run_schedule(filename, designs, ops=None, diffuser=None, mode="classify", T_ignite=1000.0, fuel_max=1e-3,
+                 processes=None, max_rss_mb=None, max_tasks_per_worker=None, timeout_s=None, http_port=None,
+                 model=DEFAULT_MODEL, **model_kwargs):
+    """
+    designs: list of CombustorCfg, ops: list of OperatingPoint (default example_schedule())
+    mode="classify": ignition decision only (fnc_comb.classify_ignition, two zone model, early termination),
+        model_kwargs go to classify_ignition (solver, outlet_coupling, rtol, ...)
+    mode="full": steady state solve with combustor model `model`, model_kwargs passed to it
+    Each point starts from the spark seed, so "lit" at a point = lights and holds a steady flame there
+    Tasks are queued operating point major, so each worker computes the diffuser/ inlet state of an operating
+    point once and reuses it for every design it picks up there
+    Returns list (per design) of operability maps (see operability_map), arrays saved to Data_Storage/filename
+    """
+    if mode not in ("classify", "full"):
+        raise ValueError(f"mode must be 'classify' or 'full', got '{mode}'")
+    if ops is None:
+        ops = example_schedule()
+    if diffuser is None:
+        diffuser = default_diffuser()
+    n_d = len(designs)
+    n_op = len(ops)
+
+    lit = np.zeros((n_d, n_op), dtype=bool)
+    margin = np.full((n_d, n_op), np.nan)
+    T_primary_out = np.full((n_d, n_op), np.nan)
+    T_secondary_out = np.full((n_d, n_op), np.nan)
+    solved = np.zeros((n_d, n_op), dtype=bool)
+
+    points = []
+    tasks = []
+    for o, op in enumerate(ops):
+        for d, combustor in enumerate(designs):
+            points.append((d, o))
+            tasks.append((op, diffuser, combustor, mode, T_ignite, fuel_max, model, model_kwargs))
+
+    def store(idx, out):
+        if out is not None:
+            d, o = points[idx]
+            lit[d, o], margin[d, o], T_primary_out[d, o], T_secondary_out[d, o] = out
+            solved[d, o] = True
+
+    run_meta = _run_points(filename, _schedule_point, tasks, store, processes, max_rss_mb, max_tasks_per_worker,
+                           timeout_s, http_port)
+    operability = operability_map(designs, ops, lit, margin, solved)
+    print_operability(operability, ops)
+
+    op_table = [(op.name, op.T_t3, op.P_t3, op.m_dot_air) for op in ops]
+    save(filename, 'lit', 'margin', 'T_primary_out', 'T_secondary_out', 'solved', 'operability', 'op_table',
+         'designs', 'run_meta')
+    return operability
+
+
+def operability_map(designs, ops, lit, margin, solved):
+    """
+    Per design: status per operating point ("lit"/ "blowout"/ "failed"), operable = lit at every point,
+    min_margin over the schedule (how close the weakest point is to the ignition boundary) and the points that
+    blow out
+    """
+    maps = []
+    for d, combustor in enumerate(designs):
+        status = np.where(~solved[d], "failed", np.where(lit[d], "lit", "blowout"))
+        signed = np.where(lit[d], margin[d], -margin[d])
+        maps.append({
+            "design": combustor,
+            "status": {op.name: str(s) for op, s in zip(ops, status)},
+            "operable": bool(np.all(status == "lit")),
+            "n_lit": int(np.sum(status == "lit")),
+            "min_margin": float(np.nanmin(signed)) if np.any(solved[d]) else np.nan,
+            "blowout_points": [op.name for op, s in zip(ops, status) if s == "blowout"],
+        })
+    return maps
+
+
+def print_operability(operability, ops):
+    # One row per design, one column per operating point: # lit, . blowout, ? failed
+    mark = {"lit": "#", "blowout": ".", "failed": "?"}
+    print("Operating points: " + ", ".join(f"{o}: {op.name}" for o, op in enumerate(ops)))
+    for d, m in enumerate(operability):
+        c = m["design"]
+        row = "".join(mark[s] for s in m["status"].values())
+        verdict = "OPERABLE" if m["operable"] else f"{m['n_lit']}/{len(ops)} lit"
+        print(f"design {d} (f = {c.f_primary:.3f}, v_frac = {c.v_frac_primary:.3f}, volume_b = {c.volume_b:.4f}): "
+              f"{row}  {verdict}, min margin {m['min_margin']:.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Combustor designs x throttle schedule operability")
+    parser.add_argument("--out", metavar="FILENAME", default="throttle_schedule", help="save to Data_Storage/FILENAME")
+    parser.add_argument("--ops", metavar="CSV", help="operating points (name,T_t3,P_t3,m_dot_air), default example_schedule")
+    parser.add_argument("--throttles", type=float, nargs="+", default=[0.4, 0.6, 0.8, 1.0], help="example_schedule settings")
+    parser.add_argument("--designs", metavar="CSV", help="designs (CombustorCfg field columns), default --f_primary x ...")
+    parser.add_argument("--f_primary", type=float, nargs="+", default=[0.3])
+    parser.add_argument("--v_frac_primary", type=float, nargs="+", default=[0.6])
+    parser.add_argument("--volume_b", type=float, nargs="+", default=[0.0207], help="geometric volume(s), times recirc_factor")
+    parser.add_argument("--recirc_factor", type=float, default=3, help="recirculation factor to get effective volume")
+    parser.add_argument("--mode", choices=["classify", "full"], default="classify")
+    parser.add_argument("--solver", choices=["dense", "sparse"], default="dense", help="two zone model linear solver")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: run in this process)")
+    parser.add_argument("--timeout_s", type=float, default=None, help="give up on a point after this long (with --processes)")
+    parser.add_argument("--http_port", type=int, default=None, help="serve live status on 127.0.0.1:PORT")
+    args = parser.parse_args()
+
+    schedule = load_schedule(args.ops) if args.ops else example_schedule(args.throttles)
+    if args.designs:
+        schedule_designs = load_designs(args.designs)
+    else:
+        schedule_designs = [CombustorCfg(fuel_comp="C3H8:1", PR_b=0.95, n_b=0.98, primary_equivRatio=0.5,
+                                         volume_b=volume_b*args.recirc_factor, f_primary=f_primary,
+                                         v_frac_primary=v_frac_primary)
+                            for f_primary, v_frac_primary, volume_b in
+                            itertools.product(args.f_primary, args.v_frac_primary, args.volume_b)]
+    run_schedule(args.out, schedule_designs, schedule, mode=args.mode, processes=args.processes,
+                 timeout_s=args.timeout_s, http_port=args.http_port, solver=args.solver)
@@ -0,0 +1,222 @@
+# Monte Carlo uncertainty quantification over uncertain model inputs, headless (no plotting imports)
+# Samples drawn in batches (Latin hypercube or Sobol), each batch solved in parallel, sampling for a design
+# stops once the ignition probability and mean outlet T confidence intervals are tight enough
+import argparse
+import itertools
+import multiprocessing as mp
+from dataclasses import replace
+from statistics import NormalDist
+
+import numpy as np
+import combustor_main as comb
+from engine_cfg import CombustorCfg, Engine
+from compute_main import default_diffuser, T_T3, P_T3, M_DOT_AIR
+from pickle_util import save
+from fnc_comb import DEFAULT_MODEL, run_combustor_model
+from fnc_comb.help_fnc import SOLVE_ERRORS
+
+
+# Uncertain inputs and (low, high) bounds, sampled uniformly
+# recirc_factor multiplies the design volume_b, valve_coeff goes to the combustor model
+# n_b (CombustorCfg) isn't sampled, the current combustor models don't use it
+UQ_PARAMS = {
+    "PR_b": (0.93, 0.97),
+    "diff_eta_i": (0.85, 0.95),
+    "recirc_factor": (2.0, 4.0),
+    "valve_coeff": (5e-5, 2e-4),
+}
+
+
+### Samplers, unit hypercube [0, 1)^d ###
+def lhs_samples(n, d, rng):
+    # One sample per stratum in every dimension, strata shuffled independently per dimension
+    u = (np.arange(n)[:, None] + rng.random((n, d))) / n
+    for c in range(d):
+        u[:, c] = u[rng.permutation(n), c]
+    return u
+
+class UnitSampler():
+    """
+    method="lhs": fresh Latin hypercube per batch (every batch is a valid LHS on its own)
+    method="sobol": one scrambled Sobol sequence continued across batches (needs scipy)
+    """
+    def __init__(self, method, d, seed=0):
+        if method not in ("lhs", "sobol"):
+            raise ValueError(f"method must be 'lhs' or 'sobol', got '{method}'")
+        self.method = method
+        self.d = d
+        self.rng = np.random.default_rng(seed)
+        if method == "sobol":
+            try:
+                from scipy.stats import qmc
+            except ImportError:
+                raise ImportError("method='sobol' needs scipy (pip install scipy), or use method='lhs'")
+            self.sobol = qmc.Sobol(d, scramble=True, seed=seed)
+
+    def draw(self, n):
+        if self.method == "lhs":
+            return lhs_samples(n, self.d, self.rng)
+        return self.sobol.random(n)
+
+
+def scale_samples(u, params):
+    # Unit samples -> {param name: values}
+    return {name: low + u[:, c] * (high - low) for c, (name, (low, high)) in enumerate(params.items())}
+
+
+### One sample ###
+def _uq_point(task):
+    diffuser, combustor, T_t3, P_t3, m_dot_air, recirc_factor, sample, model, model_kwargs = task
+
+    diffuser = replace(diffuser, diff_eta_i=sample.get("diff_eta_i", diffuser.diff_eta_i))
+    combustor = replace(combustor,
+                        PR_b=sample.get("PR_b", combustor.PR_b),
+                        volume_b=combustor.volume_b * sample.get("recirc_factor", recirc_factor))
+    model_kwargs = dict(model_kwargs)
+    if "valve_coeff" in sample:
+        model_kwargs["valve_coeff"] = sample["valve_coeff"]
+
+    eng = Engine(T_t3=T_t3, P_t3=P_t3, m_dot_air=m_dot_air, diffuser=diffuser, combustor=combustor)
+    failed = ((np.nan, np.nan, np.nan, np.nan),)
+    # Returns (outputs, error message or None), failed samples (diffuser not converged/ integrator failure) are
+    # recorded, anything else is a bug and propagates
+    M_out, converged, diff_gas_out, diff_mdot_out = comb.run_diffuser(eng)
+    if not converged:
+        return failed + ("diffuser not converged",)
+    try:
+        primary_gas_out, secondary_gas_out = run_combustor_model(model, eng, diff_gas_out, diff_mdot_out, **model_kwargs)
+    except SOLVE_ERRORS as e:
+        return failed + (f"{type(e).__name__}: {e}",)
+    i_fuel = primary_gas_out.species_index('C3H8')
+    return (primary_gas_out.T, primary_gas_out.X[i_fuel], secondary_gas_out.T, secondary_gas_out.X[i_fuel]), None
+
+
+### Statistics ###
+def wilson_interval(k, n, z):
+    # Binomial proportion CI, behaves at p near 0/ 1 (most designs either always or never ignite)
+    if n == 0:
+        return 0.0, 1.0
+    p = k / n
+    denom = 1 + z**2 / n
+    center = (p + z**2 / (2*n)) / denom
+    half = z * np.sqrt(p*(1 - p)/n + z**2/(4*n**2)) / denom
+    return center - half, center + half
+
+
+def summarize(out, T_ignite, fuel_max, z):
+    T_primary, fuel_primary, T_secondary, fuel_secondary = out.T
+    valid = np.isfinite(T_primary)
+    n = int(valid.sum())
+    ignited = valid & (T_primary >= T_ignite) & (fuel_primary <= fuel_max) # plot_util ignition criteria
+    k = int(ignited.sum())
+    p_ci = wilson_interval(k, n, z)
+
+    T_valid = T_primary[valid]
+    T_mean = float(T_valid.mean()) if n else np.nan
+    T_half = float(z * T_valid.std(ddof=1) / np.sqrt(n)) if n > 1 else np.inf
+    pct = (5, 50, 95)
+    return {
+        "n": n, "n_failed": int((~valid).sum()),
+        "p_ignite": k / n if n else np.nan, "p_ci": p_ci,
+        "T_primary_mean": T_mean, "T_primary_ci": (T_mean - T_half, T_mean + T_half),
+        "T_primary_pct": dict(zip(pct, np.percentile(T_valid, pct))) if n else {},
+        "T_secondary_pct": dict(zip(pct, np.percentile(T_secondary[valid], pct))) if n else {},
+        "fuel_primary_pct": dict(zip(pct, np.percentile(fuel_primary[valid], pct))) if n else {},
+    }
+
+
+def run_uq(designs, diffuser=None, params=UQ_PARAMS, method="lhs", batch_size=32, min_samples=64, max_samples=512,
+           p_tol=0.05, T_tol=10.0, conf=0.95, processes=None, seed=0, T_ignite=1000.0, fuel_max=1e-3,
+           recirc_factor=3, T_t3=T_T3, P_t3=P_T3, m_dot_air=M_DOT_AIR, model=DEFAULT_MODEL, **model_kwargs):
+    """
+    designs: list of CombustorCfg (volume_b = geometric volume, times sampled or fixed recirc_factor)
+    params: {name: (low, high)} subset of UQ_PARAMS keys to treat as uncertain, rest stay at design values
+    Sequential stopping per design: after each batch (and at least min_samples), stop once the ignition probability
+    CI half width <= p_tol and the mean primary T CI half width <= T_tol [K], or at max_samples
+    processes: pool size (None = all cores, 1 = run in this process)
+    Returns list (per design) of summary dicts + raw samples/ outputs
+    """
+    if diffuser is None:
+        diffuser = default_diffuser()
+    unknown = set(params) - set(UQ_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown UQ parameters: {sorted(unknown)}, options: {list(UQ_PARAMS)}")
+    z = NormalDist().inv_cdf(0.5 + conf/2)
+
+    pool = mp.Pool(processes) if processes != 1 else None
+    run_batch = pool.map if pool is not None else lambda fnc, tasks: list(map(fnc, tasks))
+
+    results = []
+    try:
+        for d, combustor in enumerate(designs):
+            sampler = UnitSampler(method, len(params), seed + d)
+            samples = {name: np.empty(0) for name in params}
+            out = np.empty((0, 4))
+            errors = {} # sample index -> failure message
+            stopped_early = False
+            while len(out) < max_samples:
+                n_batch = min(batch_size, max_samples - len(out))
+                batch = scale_samples(sampler.draw(n_batch), params)
+                tasks = [(diffuser, combustor, T_t3, P_t3, m_dot_air, recirc_factor,
+                          {name: float(batch[name][s]) for name in params}, model, model_kwargs)
+                         for s in range(n_batch)]
+                batch_out = run_batch(_uq_point, tasks)
+                for s, (point_out, err) in enumerate(batch_out):
+                    if err is not None:
+                        errors[len(out) + s] = err
+                out = np.vstack([out, np.array([point_out for point_out, err in batch_out])])
+                samples = {name: np.concatenate([samples[name], batch[name]]) for name in params}
+
+                summary = summarize(out, T_ignite, fuel_max, z)
+                p_half = (summary["p_ci"][1] - summary["p_ci"][0]) / 2
+                T_half = (summary["T_primary_ci"][1] - summary["T_primary_ci"][0]) / 2
+                print(f"Design {d}: n = {summary['n']}, p_ignite = {summary['p_ignite']:.3f} +/- {p_half:.3f}, "
+                      f"T_primary = {summary['T_primary_mean']:.1f} +/- {T_half:.1f}")
+                if len(out) >= min_samples and p_half <= p_tol and T_half <= T_tol:
+                    stopped_early = len(out) < max_samples
+                    break
+
+            summary.update({"design": combustor, "samples": samples, "stopped_early": stopped_early, "errors": errors,
+                            "T_primary_out": out[:, 0], "fuel_primary_out": out[:, 1],
+                            "T_secondary_out": out[:, 2], "fuel_secondary_out": out[:, 3]})
+            results.append(summary)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo UQ over uncertain combustor inputs")
+    parser.add_argument("--out", metavar="FILENAME", default="uq_results", help="save to Data_Storage/FILENAME")
+    parser.add_argument("--params", nargs="+", default=list(UQ_PARAMS), choices=list(UQ_PARAMS), help="uncertain inputs")
+    parser.add_argument("--method", choices=["lhs", "sobol"], default="lhs")
+    parser.add_argument("--f_primary", type=float, nargs="+", default=[0.3])
+    parser.add_argument("--v_frac_primary", type=float, nargs="+", default=[0.6])
+    parser.add_argument("--volume_b", type=float, nargs="+", default=[0.0207], help="geometric volume(s), times recirc_factor")
+    parser.add_argument("--recirc_factor", type=float, default=3, help="used when recirc_factor isn't sampled")
+    parser.add_argument("--batch", type=int, default=32)
+    parser.add_argument("--min_samples", type=int, default=64)
+    parser.add_argument("--max_samples", type=int, default=512)
+    parser.add_argument("--p_tol", type=float, default=0.05, help="ignition probability CI half width to stop at")
+    parser.add_argument("--T_tol", type=float, default=10.0, help="mean primary T CI half width [K] to stop at")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--solver", choices=["dense", "sparse"], default="dense", help="two zone model linear solver")
+    args = parser.parse_args()
+
+    uq_designs = [CombustorCfg(fuel_comp="C3H8:1", PR_b=0.95, n_b=0.98, primary_equivRatio=0.5,
+                               volume_b=volume_b, f_primary=f_primary, v_frac_primary=v_frac_primary)
+                  for f_primary, v_frac_primary, volume_b in itertools.product(args.f_primary, args.v_frac_primary, args.volume_b)]
+    uq_params = {name: UQ_PARAMS[name] for name in args.params}
+
+    uq_results = run_uq(uq_designs, params=uq_params, method=args.method, batch_size=args.batch,
+                        min_samples=args.min_samples, max_samples=args.max_samples, p_tol=args.p_tol, T_tol=args.T_tol,
+                        processes=args.processes, seed=args.seed, recirc_factor=args.recirc_factor, solver=args.solver)
+    for res in uq_results:
+        c = res["design"]
+        print(f"f = {c.f_primary}, v_frac = {c.v_frac_primary}, volume_b = {c.volume_b}: n = {res['n']} "
+              f"({res['n_failed']} failed), p_ignite = {res['p_ignite']:.3f} CI {np.round(res['p_ci'], 3)}, "
+              f"T_primary 5/50/95% = {np.round(list(res['T_primary_pct'].values()), 1)}")
+    save(args.out, 'uq_results', 'uq_designs', 'uq_params')